@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Address Filtering
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import os.path
+import time
+import logging
+import regex as re
+import numpy as np
+import pandas as pd
+
+MAIN_DIR = os.path.dirname(os.path.realpath(__file__))
+MODULE_DIR = os.path.abspath(os.path.join(MAIN_DIR, os.pardir))
+ROOT_DIR = os.path.abspath(os.path.join(MODULE_DIR, os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from webscraping.webvariables import Address
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["address_filter"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+address_pattern = r"(?P<city>[^,]+),\s*(?P<state>[A-Z]{2})\s*(?P<zipcode>\d{5})(?:-\d{4})?\s*$"
+alternation = lambda items: "|".join([re.escape(str(item)) for item in items])
+
+
+def address_pushdown(addresses, *args, state=None, citys=[], zipcodes=[], **kwargs):
+    mask = pd.Series(True, index=addresses.index)
+    if state:
+        mask &= addresses.str.contains(str(state), regex=False, na=False)
+    if citys or zipcodes:
+        mask &= addresses.str.contains(alternation([*citys, *zipcodes]), case=False, regex=True, na=False)
+    return mask
+
+
+def address_split(addresses, *args, state=None, citys=[], zipcodes=[], **kwargs):
+    splits = addresses.str.strip().str.extract(address_pattern)
+    splits["city"] = splits["city"].str.strip()
+    parsed = splits.notna().all(axis=1)
+    mask = pd.Series(True, index=addresses.index)
+    if citys or zipcodes:
+        mask &= splits["city"].isin(list(citys)) | splits["zipcode"].isin(list(zipcodes))
+    if state:
+        mask &= splits["state"] == state
+    return mask | ~parsed
+
+
+def address_filter(dataframe, *args, state=None, citys=[], zipcodes=[], **kwargs):
+    dataframe = dataframe[address_pushdown(dataframe["address"], state=state, citys=citys, zipcodes=zipcodes)]
+    dataframe = dataframe[address_split(dataframe["address"], state=state, citys=citys, zipcodes=zipcodes)]
+    dataframe = dataframe.copy()
+    dataframe["address"] = dataframe["address"].apply(Address.fromstr)
+    dataframe["city"] = dataframe["address"].apply(lambda x: x.city if x else None)
+    dataframe["state"] = dataframe["address"].apply(lambda x: x.state if x else None)
+    dataframe["zipcode"] = dataframe["address"].apply(lambda x: x.zipcode if x else None)
+    if citys or zipcodes:
+        dataframe = dataframe[(dataframe["city"].isin(list(citys)) | dataframe["zipcode"].isin(list(zipcodes)))]
+    if state:
+        dataframe = dataframe[dataframe["state"] == state]
+    return dataframe
+
+
+def benchmark(*args, size=10**6, state="CA", citys=["Bakersfield"], zipcodes=[], **kwargs):
+    states = np.random.choice(["CA", "TX", "NY", "FL", "WA", "OR", "AZ", "NV"], size=size)
+    cities = np.random.choice(["Bakersfield", "Fresno", "Austin", "Albany", "Miami", "Seattle", "Portland", "Phoenix"], size=size)
+    numbers = np.random.randint(1, 9999, size=size)
+    postals = np.random.randint(10000, 99999, size=size)
+    addresses = ["{:.0f} Main St, {}, {} {:05.0f}".format(*values) for values in zip(numbers, cities, states, postals)]
+    dataframe = pd.DataFrame({"GID": np.arange(size).astype(str), "address": addresses, "link": ""})
+    start = time.perf_counter()
+    filtered = address_filter(dataframe, state=state, citys=citys, zipcodes=zipcodes)
+    elapsed = time.perf_counter() - start
+    LOGGER.info("AddressFilter[{:.0f}]: {:.0f} rows in {:.2f}s".format(size, len(filtered), elapsed))
+    return elapsed
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="[%(levelname)s, %(threadName)s]:  %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    benchmark()
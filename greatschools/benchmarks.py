@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Offline Benchmark Application
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import os.path
+import time
+import json
+import random
+import logging
+import threading
+import tempfile
+import requests
+import regex as re
+import pandas as pd
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+MAIN_DIR = os.path.dirname(os.path.realpath(__file__))
+MODULE_DIR = os.path.abspath(os.path.join(MAIN_DIR, os.pardir))
+ROOT_DIR = os.path.abspath(os.path.join(MODULE_DIR, os.pardir))
+SAVE_DIR = os.path.join(ROOT_DIR, "save")
+REPOSITORY_DIR = os.path.join(SAVE_DIR, "greatschools")
+SNAPSHOT_DIR = os.path.join(REPOSITORY_DIR, "snapshots")
+BENCHMARK_FILE = os.path.join(REPOSITORY_DIR, "benchmarks.jsonl")
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+if MODULE_DIR not in sys.path:
+    sys.path.append(MODULE_DIR)
+
+from utilities.inputs import InputParser
+from greatschools.snapshots import SnapshotStore, snapshot_loader
+from greatschools.metrics import WebMetrics
+from greatschools.links import Greatschools_Links_WebSource, Greatschools_Links_WebScheduler, Greatschools_Links_WebDelayer, Greatschools_Links_HeadlessWebBrowser, Greatschools_Links_WebDownloader
+from greatschools.schools import Greatschools_Schools_WebSource, Greatschools_Schools_WebPage, Greatschools_Schools_WebScheduler, Greatschools_Schools_WebDelayer, Greatschools_Schools_HeadlessWebBrowser, Greatschools_Schools_WebDownloader
+from greatschools.boundarys import boundary_outcome, boundary_parser, identity_parser
+from greatschools.boundarys import Greatschools_Boundary_WebScheduler, Greatschools_Boundary_WebSession, Greatschools_Boundary_WebDelayer, Greatschools_Boundary_JSONWebDownloader
+from greatschools.journals import WebJournal
+from greatschools.indexes import LinkIndex
+from greatschools.changes import ChangeIndex
+from greatschools.refreshes import RefreshIndex
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["BenchmarkServer", "benchmark", "extraction", "download"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DATASETS = ("links", "schools", "boundary")
+CAPTCHA_PAGE = """<html><body><div id="Captcha" class="Captcha"><h1>Please verify you are a human</h1></div></body></html>"""
+NORESULTS_PAGE = """<html><body><section class="school-list"><span class="heading">Your search did not return any schools</span></section></body></html>"""
+captcha_pattern = re.compile(r"(?:class|id)=\"[^\"]*Captcha")
+location_parser = lambda url: "{}?{}".format(urlsplit(str(url)).path, urlsplit(str(url)).query) if urlsplit(str(url)).query else urlsplit(str(url)).path
+host_parser = lambda url, host: "{}{}".format(str(host).rstrip("/"), location_parser(url))
+percentile_parser = lambda values, fraction: sorted(values)[min(int(fraction * len(values)), len(values) - 1)] if values else None
+rss_parser = lambda: (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 ** 2 if sys.platform == "darwin" else 1024)) if resource is not None else None
+
+
+def html_parser(Source):
+    def wrapper(url, response):
+        if captcha_pattern.search(response.text):
+            return "captcha", []
+        results = [(fields, dataset, data) for fields, dataset, data in Source(response.text, url=url)() if data is not None and len(data)]
+        return ("success", results) if results else ("badrequest", [])
+    return wrapper
+
+
+def json_parser(url, response):
+    outcome, contents = boundary_outcome(response)
+    data = boundary_parser(contents) if outcome == "success" else None
+    return (outcome, [({"url": str(url)}, "shapes", data)]) if bool(data) else (outcome if outcome != "success" else "badrequest", [])
+
+
+benchmark_parsers = {"links": html_parser(Greatschools_Links_WebSource), "schools": html_parser(Greatschools_Schools_WebSource), "boundary": json_parser}
+
+
+class Benchmark_Links_WebScheduler(Greatschools_Links_WebScheduler, fields=["dataset", "zipcode"], dataset=["school"]):
+    @staticmethod
+    def zipcode(*args, zipcodes=[], **kwargs): return [str(zipcode) for zipcode in zipcodes]
+
+
+class Benchmark_Schools_WebScheduler(Greatschools_Schools_WebScheduler, fields=["GID"]):
+    @staticmethod
+    def GID(*args, GIDs=[], **kwargs): return [str(GID) for GID in GIDs]
+
+
+class Benchmark_Boundary_WebScheduler(Greatschools_Boundary_WebScheduler, fields=["GID"]):
+    @staticmethod
+    def GID(*args, GIDs=[], **kwargs): return [str(GID) for GID in GIDs]
+
+
+class Benchmark_WebVPN(object):
+    terminated = False
+    ready = True
+    server = "localhost"
+    def trip(self): pass
+
+
+class Benchmark_Links_WebDownloader(Greatschools_Links_WebDownloader):
+    vpn = Benchmark_WebVPN()
+
+
+class Benchmark_Schools_WebDownloader(Greatschools_Schools_WebDownloader):
+    vpn = Benchmark_WebVPN()
+
+
+class Benchmark_Boundary_JSONWebDownloader(Greatschools_Boundary_JSONWebDownloader):
+    vpn = Benchmark_WebVPN()
+
+
+class BenchmarkServer(object):
+    def __init__(self, *args, pages, host="127.0.0.1", port=0, latency=(0, 0), captcha=0.0, noresults=0.0, seed=None, **kwargs):
+        self.__mutex = threading.Lock()
+        self.__random = random.Random(seed)
+        self.__pages = {location_parser(url): content for url, content in dict(pages).items()}
+        self.__host = host
+        self.__port = int(port)
+        self.__latency = tuple(float(value) for value in latency)
+        self.__captcha = float(captcha)
+        self.__noresults = float(noresults)
+        self.__counts = {"success": 0, "captcha": 0, "noresults": 0, "missing": 0}
+        self.__server = None
+        self.__thread = None
+
+    def __repr__(self): return "{}(pages={:.0f}, latency={}, captcha={}, noresults={})".format(self.__class__.__name__, len(self.pages), repr(self.latency), repr(self.captcha), repr(self.noresults))
+    def __enter__(self): return self.start()
+    def __exit__(self, error_type, error_value, error_traceback): self.stop()
+
+    @classmethod
+    def load(cls, store, dataset, *args, date=None, **kwargs):
+        pages = {}
+        for file in store.files(dataset, date=date):
+            url, date, content = snapshot_loader(file)
+            pages[url] = content
+        return cls(*args, pages=pages, **kwargs)
+
+    def start(self):
+        server = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self): server.respond(self)
+            def log_message(self, *args, **kwargs): pass
+        self.__server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="GreatSchoolsBenchmarkServer", daemon=True)
+        self.__thread.start()
+        LOGGER.info("Serving: {}[{}]".format(repr(self), self.address))
+        return self
+
+    def stop(self):
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+        self.__server, self.__thread = None, None
+
+    def respond(self, handler):
+        with self.mutex:
+            delay = self.__random.uniform(*self.latency)
+            draw = self.__random.random()
+        time.sleep(delay)
+        content = self.pages.get(handler.path, None)
+        if content is None:
+            status, kind, body = 404, "text/html", NORESULTS_PAGE
+            self.increment("missing")
+        elif draw < self.captcha:
+            status, kind, body = 200, "text/html", CAPTCHA_PAGE
+            self.increment("captcha")
+        elif draw < self.captcha + self.noresults:
+            status, kind, body = (404, "application/json", "{}") if str(content).lstrip().startswith("{") else (200, "text/html", NORESULTS_PAGE)
+            self.increment("noresults")
+        else:
+            status, kind, body = 200, "application/json" if str(content).lstrip().startswith("{") else "text/html", content
+            self.increment("success")
+        body = body.encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "{}; charset=utf-8".format(kind))
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def increment(self, outcome):
+        with self.mutex:
+            self.counts[outcome] += 1
+
+    @property
+    def address(self): return "http://{}:{:.0f}".format(*self.__server.server_address[:2]) if self.__server is not None else None
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def pages(self): return self.__pages
+    @property
+    def host(self): return self.__host
+    @property
+    def port(self): return self.__port
+    @property
+    def latency(self): return self.__latency
+    @property
+    def captcha(self): return self.__captcha
+    @property
+    def noresults(self): return self.__noresults
+    @property
+    def counts(self): return self.__counts
+
+
+def benchmark(dataset, *args, store=None, workers=4, repeat=1, date=None, latency=(0, 0), captcha=0.0, noresults=0.0, seed=None, file=None, **kwargs):
+    assert dataset in DATASETS
+    store = store if store is not None else SnapshotStore(directory=SNAPSHOT_DIR)
+    parser, local = benchmark_parsers[dataset], threading.local()
+    metrics = WebMetrics(name="benchmark[{}]".format(dataset))
+    latencys, outcomes, mutex = [], {}, threading.Lock()
+    with BenchmarkServer.load(store, dataset, date=date, latency=latency, captcha=captcha, noresults=noresults, seed=seed) as server:
+        urls = list(server.pages.keys()) * int(repeat)
+
+        def fetch(url):
+            if not hasattr(local, "session"):
+                local.session = requests.Session()
+            start = time.perf_counter()
+            with metrics.timer("load"):
+                response = local.session.get(host_parser(url, server.address), timeout=60)
+            with metrics.timer("extract"):
+                outcome, results = parser(url, response)
+            elapsed = time.perf_counter() - start
+            metrics.observe("query", elapsed)
+            metrics.count(outcome, kind="response")
+            with mutex:
+                latencys.append(elapsed)
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=int(workers)) as executor:
+            list(executor.map(fetch, urls))
+        elapsed = time.perf_counter() - start
+        served = dict(server.counts)
+    results = {"dataset": dataset, "scope": "parser", "timestamp": time.time(), "pages": len(urls), "workers": int(workers), "seconds": round(elapsed, 6), "throughput": len(urls) / elapsed if elapsed else None, "p50": percentile_parser(latencys, 0.5), "p99": percentile_parser(latencys, 0.99), "rss": rss_parser(), "outcomes": outcomes, "served": served}
+    LOGGER.info("Benchmark[{}|{:.0f}|parser only, not end-to-end]: {:.1f}pages/s|p50={}|p99={}|rss={}MB".format(dataset, len(urls), results["throughput"] or 0, results["p50"], results["p99"], results["rss"]))
+    metrics.report()
+    if file is not None:
+        os.makedirs(os.path.dirname(file) or ".", exist_ok=True)
+        with open(file, "a") as handle:
+            handle.write(json.dumps(results) + "\n")
+    return results
+
+
+def extraction(*args, store=None, browser=None, repeat=10, date=None, file=None, **kwargs):
+    store = store if store is not None else SnapshotStore(directory=SNAPSHOT_DIR)
+    browser = browser if browser is not None else Greatschools_Schools_HeadlessWebBrowser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
+    with BenchmarkServer.load(store, "schools", date=date) as server:
+        urls = {url: host_parser(url, server.address) for url in server.pages.keys()}
+        start = time.perf_counter()
+        for index in range(int(repeat)):
+            sources = {url: list(Greatschools_Schools_WebSource(server.pages[url], url=local)()) for url, local in urls.items()}
+        source = (time.perf_counter() - start) / max(int(repeat) * len(urls), 1)
+        loaders, loader = {}, 0
+        with browser() as driver:
+            page = Greatschools_Schools_WebPage(driver, name="GreatSchoolsPage", delayer=None)
+            for url, local in urls.items():
+                page.load(str(local), referer="https://www.google.com")
+                page.setup(*args, **kwargs)
+                start = time.perf_counter()
+                loaders[url] = list(page(*args, extraction="loader", **kwargs))
+                loader += time.perf_counter() - start
+        loader = loader / max(len(urls), 1)
+    mismatches = [url for url in urls.keys() if sources[url] != loaders[url]]
+    for url in mismatches:
+        LOGGER.warning("Mismatch[{}]: source={}|loader={}".format(str(url), str(sources[url]), str(loaders[url])))
+    results = {"dataset": "schools", "timestamp": time.time(), "pages": len(urls), "source": round(source, 6), "loader": round(loader, 6), "speedup": loader / source if source else None, "mismatches": len(mismatches)}
+    LOGGER.info("Extraction[{:.0f}]: source={:.2f}ms/page|loader={:.2f}ms/page|mismatches={:.0f}".format(len(urls), source * 1000, loader * 1000, len(mismatches)))
+    if file is not None:
+        os.makedirs(os.path.dirname(file) or ".", exist_ok=True)
+        with open(file, "a") as handle:
+            handle.write(json.dumps(results) + "\n")
+    return results
+
+
+def links_download(server, directory, *args, browser=None, **kwargs):
+    zipcodes = sorted(set([zipcode for location in server.pages.keys() for zipcode in parse_qs(urlsplit(location).query).get("zip", [])]))
+    browser = browser if browser is not None else Greatschools_Links_HeadlessWebBrowser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
+    delayer = Greatschools_Links_WebDelayer(name="BenchmarkDelayer", method="constant", wait=0)
+    scheduler = Benchmark_Links_WebScheduler(name="BenchmarkScheduler", randomize=False, size=5, file=os.path.join(directory, "links.csv"))
+    downloader = Benchmark_Links_WebDownloader(name="Benchmark", repository=directory, timeout=60*2)
+    return downloader, len(zipcodes), dict(browser=browser, scheduler=scheduler, delayer=delayer, zipcodes=zipcodes, paginate=False)
+
+
+def schools_download(server, directory, *args, browser=None, **kwargs):
+    links = {identity_parser(location): "https://www.greatschools.org{}".format(location) for location in server.pages.keys()}
+    file = os.path.join(directory, "schools.zip")
+    pd.DataFrame({"GID": list(links.keys()), "address": "", "link": list(links.values())}).to_csv(file, index=False, compression="zip")
+    browser = browser if browser is not None else Greatschools_Schools_HeadlessWebBrowser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
+    delayer = Greatschools_Schools_WebDelayer(name="BenchmarkDelayer", method="constant", wait=0)
+    scheduler = Benchmark_Schools_WebScheduler(name="BenchmarkScheduler", randomize=False, size=10, file=os.path.join(directory, "schools.csv"))
+    downloader = Benchmark_Schools_WebDownloader(name="Benchmark", repository=directory, timeout=60*2)
+    return downloader, len(links), dict(browser=browser, scheduler=scheduler, delayer=delayer, GIDs=list(links.keys()), queue_index=LinkIndex(file=file))
+
+
+def boundary_download(server, directory, *args, state, **kwargs):
+    GIDs = [identity_parser(location) for location in server.pages.keys() if parse_qs(urlsplit(location).query).get("state", [None])[0] == str(state)]
+    delayer = Greatschools_Boundary_WebDelayer(name="BenchmarkDelayer", method="constant", wait=0)
+    scheduler = Benchmark_Boundary_WebScheduler(name="BenchmarkScheduler", randomize=False, size=5, file=os.path.join(directory, "boundary.csv"))
+    session = Greatschools_Boundary_WebSession(name="BenchmarkSession", timeout=60)
+    downloader = Benchmark_Boundary_JSONWebDownloader(name="Benchmark", repository=directory, timeout=60*2)
+    return downloader, len(GIDs), dict(session=session, scheduler=scheduler, delayer=delayer, state=state, GIDs=GIDs)
+
+
+benchmark_downloads = {"links": links_download, "schools": schools_download, "boundary": boundary_download}
+
+
+def download(dataset, *args, store=None, browser=None, state="CA", date=None, latency=(0, 0), captcha=0.0, noresults=0.0, seed=None, file=None, **kwargs):
+    assert dataset in DATASETS
+    store = store if store is not None else SnapshotStore(directory=SNAPSHOT_DIR)
+    metrics = WebMetrics(name="benchmark[download|{}]".format(dataset))
+    with tempfile.TemporaryDirectory() as directory:
+        journal = WebJournal(file=os.path.join(directory, "{}.journal".format(dataset)))
+        indexes = dict(change_index=ChangeIndex(file=os.path.join(directory, "changes.db")), refresh_index=RefreshIndex(file=os.path.join(directory, "refresh.db"), dataset=dataset)) if dataset != "links" else {}
+        try:
+            with BenchmarkServer.load(store, dataset, date=date, latency=latency, captcha=captcha, noresults=noresults, seed=seed) as server:
+                downloader, pages, parameters = benchmark_downloads[dataset](server, directory, *args, browser=browser, state=state)
+                downloader(*args, journal=journal, host=server.address, metrics=metrics, **indexes, **parameters, **kwargs)
+                start = time.perf_counter()
+                downloader.start()
+                downloader.join()
+                elapsed = time.perf_counter() - start
+                served = dict(server.counts)
+        finally:
+            journal.stop()
+            for index in indexes.values():
+                index.close()
+    if bool(downloader.error):
+        raise downloader.error[1]
+    histogram = metrics.todict()["histograms"].get("query", {})
+    results = {"dataset": dataset, "scope": "end-to-end", "timestamp": time.time(), "pages": pages, "results": len(downloader.results), "seconds": round(elapsed, 6), "throughput": pages / elapsed if elapsed else None, "p50": histogram.get("p50", None), "p99": histogram.get("p99", None), "rss": rss_parser(), "served": served}
+    LOGGER.info("Benchmark[{}|{:.0f}|end-to-end]: {:.1f}pages/s|p50<={}|p99<={}|rss={}MB".format(dataset, pages, results["throughput"] or 0, results["p50"], results["p99"], results["rss"]))
+    metrics.report()
+    if file is not None:
+        os.makedirs(os.path.dirname(file) or ".", exist_ok=True)
+        with open(file, "a") as handle:
+            handle.write(json.dumps(results) + "\n")
+    return results
+
+
+def main(*args, datasets=DATASETS, workers=4, repeat=1, date=None, latency=0, captcha=0.0, noresults=0.0, seed=None, compare=False, endtoend=False, state="CA", **kwargs):
+    datasets = [datasets] if isinstance(datasets, str) else list(datasets)
+    latency = tuple(float(value) for value in str(latency).split(",")) if not isinstance(latency, tuple) else latency
+    latency = latency if len(latency) == 2 else (latency[0], latency[0])
+    for dataset in datasets:
+        benchmark(dataset, *args, workers=int(workers), repeat=int(repeat), date=date, latency=latency, captcha=float(captcha), noresults=float(noresults), seed=seed, file=BENCHMARK_FILE, **kwargs)
+    if str(compare).strip().lower() in ("true", "yes", "on", "1"):
+        extraction(*args, date=date, file=BENCHMARK_FILE)
+    if str(endtoend).strip().lower() in ("true", "yes", "on", "1"):
+        for dataset in datasets:
+            download(dataset, *args, state=state, date=date, latency=latency, captcha=float(captcha), noresults=float(noresults), seed=seed, file=BENCHMARK_FILE)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="[%(levelname)s, %(threadName)s]:  %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    inputparser = InputParser(proxys={"assign": "=", "space": "_"}, parsers={}, default=str)
+    inputparser(*sys.argv[1:])
+    main(*inputparser.arguments, **inputparser.parameters)
@@ -11,10 +11,17 @@ import os.path
 import warnings
 import logging
 import traceback
+import time
 import json
+import threading
+import functools
+import requests
 import regex as re
 from abc import ABC
 from seleniumwire.utils import decode
+from selenium.common.exceptions import TimeoutException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import date as Date
 from collections import OrderedDict as ODict
 
@@ -25,17 +32,24 @@ RESOURCE_DIR = os.path.join(ROOT_DIR, "resources")
 SAVE_DIR = os.path.join(ROOT_DIR, "save")
 REPOSITORY_DIR = os.path.join(SAVE_DIR, "greatschools")
 REPORT_FILE = os.path.join(REPOSITORY_DIR, "boundary.csv")
+JOURNAL_FILE = os.path.join(REPOSITORY_DIR, "boundary.journal")
+SNAPSHOT_DIR = os.path.join(REPOSITORY_DIR, "snapshots")
+LEASE_FILE = os.path.join(REPOSITORY_DIR, "leases.db")
 QUEUE_FILE = os.path.join(REPOSITORY_DIR, "boundary.zip")
+REFRESH_FILE = os.path.join(REPOSITORY_DIR, "refresh.db")
+CHANGE_FILE = os.path.join(REPOSITORY_DIR, "changes.db")
+QUEUE_DATASET = "boundary"
 DRIVER_EXE = os.path.join(RESOURCE_DIR, "chromedriver.exe")
 NORDVPN_EXE = os.path.join("C:/", "Program Files", "NordVPN", "NordVPN.exe")
 if ROOT_DIR not in sys.path:
     sys.path.append(ROOT_DIR)
+if MODULE_DIR not in sys.path:
+    sys.path.append(MODULE_DIR)
 
 from utilities.inputs import InputParser
 from utilities.shapes import Shape, Geometry
 from files.dataframes import DataframeFile
 from files.shapes import ShapeRecord
-from webscraping.webtimers import WebDelayer
 from webscraping.webvpn import Nord_WebVPN, WebVPNProcess
 from webscraping.webdrivers import WebBrowser
 from webscraping.weburl import WebURL
@@ -49,16 +63,34 @@ from webscraping.webdownloaders import WebDownloader
 from webscraping.webdata import WebCaptcha
 from webscraping.webactions import StaleWebActionError, InteractionWebActionError
 from webscraping.webvariables import Address
+from greatschools.indexes import LinkIndex
+from greatschools.addresses import address_filter
+from greatschools.delayers import FeedbackWebDelayer, AdaptiveWebDelayer, penalty_parser
+from greatschools.profiles import WebProfile
+from greatschools.journals import WebJournal, JournalMixin
+from greatschools.snapshots import SnapshotStore, snapshot_loader, snapshot_replay
+from greatschools.metrics import WebMetrics
+from greatschools.sessions import WebTabSession
+from greatschools.leases import LeaseStore, LeaseQueue
+from greatschools.refreshes import RefreshIndex
+from greatschools.priorities import WebPriority, weights_parser, weight_parser
+from greatschools.changes import ChangeIndex
+from greatschools.polygons import simplify
+from greatschools.parquets import ParquetRepository, ParquetMixin, address_filters
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["Greatschools_Boundary_WebDelayer", "Greatschools_Boundary_WebBrowser", "Greatschools_Boundary_WebDownloader", "Greatschools_Boundary_WebScheduler"]
+__all__ = ["Greatschools_Boundary_WebDelayer", "Greatschools_Boundary_AdaptiveWebDelayer", "Greatschools_Boundary_WebBrowser", "Greatschools_Boundary_HeadlessWebBrowser", "Greatschools_Boundary_WebSession", "Greatschools_Boundary_WebDownloader", "Greatschools_Boundary_JSONWebDownloader", "Greatschools_Boundary_ParquetWebDownloader", "Greatschools_Boundary_ParquetJSONWebDownloader", "Greatschools_Boundary_WebScheduler"]
 __copyright__ = "Copyright 2021, Jack Kirby Cook"
 __license__ = ""
 
 
 LOGGER = logging.getLogger(__name__)
 warnings.filterwarnings("ignore")
+queue_index = LinkIndex(file=QUEUE_FILE)
+webjournal = WebJournal(file=JOURNAL_FILE)
+change_index = ChangeIndex(file=CHANGE_FILE)
+refresh_index = RefreshIndex(file=REFRESH_FILE, dataset="boundary")
 
 
 QUERYS = ["GID"]
@@ -69,9 +101,39 @@ captcha_xpath = r"//*[contains(@class, 'Captcha') or contains(@id, 'Captcha')]"
 captcha_webloader = WebLoader(xpath=captcha_xpath, timeout=5)
 identity_pattern = "(?<=\/)\d+|(?<=schoolId=)\d+"
 identity_parser = lambda x: str(re.findall(identity_pattern, x)[0])
+flag_parser = lambda x: x if isinstance(x, bool) else str(x).strip().lower() in ("true", "yes", "on", "1")
+host_parser = lambda url, host: str(url).replace("https://www.greatschools.org", str(host).rstrip("/"), 1) if host else str(url)
+capture_pattern = re.compile(r"gsr/api/schools/")
+boundary_mapping = {"id": "GID", "districtId": "DID", "districtName": "district", "lat": "latitude", "lon": "longitude", "name": "name", "gradeLevels": "grades", "schooltype": "type"}
+session_headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0 Safari/537.36", "Accept": "application/json", "Connection": "keep-alive"}
 getitem_iterator = lambda contents, key, default: (key, contents.get(key, None)) if isinstance(key, str) else (key, getitem_iterator(contents[key[0]], key[1] if len(key) == 1 else key[1:], default))
 
 
+def boundary_parser(contents, *args, tolerance=None, **kwargs):
+    record = {key: contents.get(key, None) for key, content in boundary_mapping.items()}
+    record["address"] = Address(ODict([("street", contents["address"]["street1"]), ("city", contents["address"]["city"]), ("state", contents["state"]), ("zipcode", contents["address"]["zip"])]))
+    try:
+        values = [tuple(value) for value in list(contents["boundaries"].values())[0]["coordinates"][0][0]]
+        values = [tuple(value) for value in simplify(values, tolerance).tolist()] if tolerance else values
+        shape = Shape[Geometry.RING](values)
+        return ShapeRecord(shape, record)
+    except IndexError:
+        return None
+
+
+def boundary_outcome(response):
+    if response.status_code in (403, 429):
+        return "refusal", None
+    elif response.status_code == 404:
+        return "badrequest", None
+    elif not response.ok:
+        return "failure", None
+    try:
+        return "success", response.json()
+    except ValueError:
+        return "captcha", None
+
+
 class Greatschools_Boundary_HTMLWebURL(WebURL, protocol="https", domain="www.greatschools.org"):
     @staticmethod
     def path(*args, **kwargs): return ["school-district-boundaries-map"]
@@ -87,42 +149,162 @@ class Greatschools_Boundary_JSONWebURL(WebURL, protocol="https", domain="www.gre
 
 
 class Greatschools_Captcha(WebCaptcha, loader=captcha_webloader, optional=True): pass
-class Greatschools_Boundary_WebDelayer(WebDelayer): pass
+class Greatschools_Boundary_WebDelayer(FeedbackWebDelayer): pass
+class Greatschools_Boundary_AdaptiveWebDelayer(AdaptiveWebDelayer): pass
 class Greatschools_Boundary_WebBrowser(WebBrowser, files={"chrome": DRIVER_EXE}, options={"headless": False, "images": True, "incognito": False}): pass
+class Greatschools_Boundary_HeadlessWebBrowser(WebBrowser, files={"chrome": DRIVER_EXE}, options={"headless": True, "images": False, "incognito": False}): pass
 class Greatschools_Boundary_WebQueue(WebQueue): pass
-class Greatschools_Boundary_WebQuery(WebQuery, WebQueueable, fields=QUERYS): pass
+class Greatschools_Boundary_WebQuery(JournalMixin, WebQuery, WebQueueable, fields=QUERYS):
+    journal = webjournal
+    changes = change_index
+
+
 class Greatschools_Boundary_WebDataset(WebDataset, ABC, fields=DATASETS): pass
 
 
 class Greatschools_Boundary_WebScheduler(WebScheduler, fields=QUERYS):
     @staticmethod
-    def GID(*args, state, city=None, citys=[], zipcode=None, zipcodes=[], **kwargs):
-        if not os.path.exists(QUEUE_FILE):
+    def GID(*args, state, city=None, citys=[], zipcode=None, zipcodes=[], backend="zip", journal=None, queue_index=queue_index, refresh_index=refresh_index, refresh=None, priority=False, weights={}, scores={}, band=1.0, **kwargs):
+        if backend != "parquet" and not os.path.exists(QUEUE_FILE):
             return []
         assert all([isinstance(item, (str, type(None))) for item in (zipcode, city)])
         assert all([isinstance(item, list) for item in (zipcodes, citys)])
         zipcodes = list(set([item for item in [zipcode, *zipcodes] if item]))
         citys = list(set([item for item in [city, *citys] if item]))
-        parsers = {"address": Address.fromstr}
-        with DataframeFile(file=QUEUE_FILE, mode="r", parsers=parsers, parser=str) as reader:
-            dataframe = reader(header=["zipcode", "type", "city", "state", "county"])
-        dataframe["city"] = dataframe["address"].apply(lambda x: x.city if x else None)
-        dataframe["state"] = dataframe["address"].apply(lambda x: x.state if x else None)
-        dataframe["zipcode"] = dataframe["address"].apply(lambda x: x.zipcode if x else None)
-        if citys or zipcodes:
-            dataframe = dataframe[(dataframe["city"].isin(list(citys)) | dataframe["zipcode"].isin(list(zipcodes)))]
-        if state:
-            dataframe = dataframe[dataframe["state"] == state]
+        if backend == "parquet":
+            filters = address_filters(state=state, citys=citys, zipcodes=zipcodes)
+            dataframe = ParquetRepository(directory=REPOSITORY_DIR).read(QUEUE_DATASET, columns=["GID", "address", "link", "city", "state", "zipcode"], filters=filters)
+            dataframe[["GID", "address", "link"]] = dataframe[["GID", "address", "link"]].astype(str)
+        else:
+            with DataframeFile(file=QUEUE_FILE, mode="r", parsers={}, parser=str) as reader:
+                dataframe = reader(header=["zipcode", "type", "city", "state", "county"])
+        dataframe = address_filter(dataframe, state=state, citys=citys, zipcodes=zipcodes)
         dataframe = dataframe.drop_duplicates(subset="GID", keep="last", ignore_index=True)
-        return list(dataframe["GID"].to_numpy())
+        completed = journal.completed("GID") if journal is not None else set()
+        GIDs = [GID for GID in dataframe["GID"].to_numpy() if str(GID) not in completed]
+        GIDs = refresh_index.stale(GIDs, age=refresh) if refresh is not None else GIDs
+        if flag_parser(priority):
+            weights = weights_parser(weights)
+            values = {GID: weight_parser(weights, zipcode, city) for GID, zipcode, city in zip(dataframe["GID"].to_numpy(), dataframe["zipcode"].to_numpy(), dataframe["city"].to_numpy())}
+            GIDs = WebPriority(scores=scores, band=band)(GIDs, refresh_index.history(GIDs), values)
+        if refresh is not None:
+            refresh_index.attempt(GIDs)
+        queue_index.refresh()
+        return GIDs
 
     @staticmethod
-    def execute(querys, *args, **kwargs):
+    def execute(querys, *args, crawl=None, leases=LEASE_FILE, **kwargs):
+        if crawl is not None:
+            return LeaseQueue(querys, *args, store=LeaseStore(file=leases, dataset="boundary"), crawl=crawl, queryable=Greatschools_Boundary_WebQuery, queue=Greatschools_Boundary_WebQueue, name="GreatSchoolsQueue", report=REPORT_FILE, **kwargs)
         queueables = [Greatschools_Boundary_WebQuery(query, name="GreatSchoolsQuery") for query in querys]
         queue = Greatschools_Boundary_WebQueue(queueables, *args, name="GreatSchoolsQueue", **kwargs)
         return queue
 
 
+class Greatschools_Boundary_WebSession(object):
+    def __init__(self, *args, name, timeout=60, size=4, retrys=2, headers={}, **kwargs):
+        self.__name = name
+        self.__timeout = timeout
+        self.__size = size
+        self.__retrys = retrys
+        self.__headers = {**session_headers, **headers}
+        self.__session = None
+
+    def __repr__(self): return "{}(name={}, timeout={}, size={})".format(self.__class__.__name__, repr(self.name), repr(self.timeout), repr(self.size))
+    def __bool__(self): return self.session is not None
+    def __call__(self, *args, **kwargs): return self
+    def __enter__(self): return self.start()
+    def __exit__(self, error_type, error_value, error_traceback): self.stop()
+
+    def start(self):
+        retrys = Retry(total=self.retrys, connect=self.retrys, read=0, status=0, backoff_factor=0.5)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.size, max_retries=retrys)
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self.session = session
+        return self
+
+    def stop(self):
+        if self.session is not None:
+            self.session.close()
+        self.session = None
+
+    def reset(self):
+        self.stop()
+        self.start()
+
+    def get(self, url, *args, referer=None, **kwargs):
+        headers = {"Referer": str(referer)} if referer else {}
+        return self.session.get(str(url), headers=headers, timeout=self.timeout)
+
+    @property
+    def name(self): return self.__name
+    @property
+    def timeout(self): return self.__timeout
+    @property
+    def size(self): return self.__size
+    @property
+    def retrys(self): return self.__retrys
+    @property
+    def headers(self): return self.__headers
+
+    @property
+    def session(self): return self.__session
+    @session.setter
+    def session(self, session): self.__session = session
+
+
+class Greatschools_Boundary_WebCapture(object):
+    def __init__(self, *args, pattern=capture_pattern, size=8, **kwargs):
+        self.__mutex = threading.Lock()
+        self.__pattern = pattern
+        self.__size = int(size)
+        self.__responses = ODict()
+
+    def __repr__(self): return "{}(size={:.0f})".format(self.__class__.__name__, self.size)
+    def __len__(self): return len(self.responses)
+
+    def __call__(self, request, response):
+        if not self.pattern.search(request.url):
+            return
+        with self.mutex:
+            self.responses[request.url] = (response.headers.get("Content-Encoding", "utf-8"), bytes(response.body or b""))
+            self.responses.move_to_end(request.url)
+            while len(self.responses) > self.size:
+                self.responses.popitem(last=False)
+
+    def clear(self):
+        with self.mutex:
+            self.responses.clear()
+
+    def get(self, url, default=None):
+        with self.mutex:
+            return next((self.responses[key] for key in reversed(self.responses) if str(url) in key), default)
+
+    def wait(self, url, timeout=30, poll=0.1):
+        expires = time.monotonic() + timeout
+        while True:
+            response = self.get(url)
+            if response is not None:
+                return response
+            if time.monotonic() > expires:
+                raise TimeoutException(str(url))
+            time.sleep(poll)
+
+    @property
+    def urls(self): return list(self.responses.keys())
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def pattern(self): return self.__pattern
+    @property
+    def size(self): return self.__size
+    @property
+    def responses(self): return self.__responses
+
+
 class Greatschools_WebConditions(WebConditions):
     CAPTCHA = Greatschools_Captcha
 
@@ -132,97 +314,257 @@ page_contents = (Greatschools_WebConditions,)
 
 
 class Greatschools_Boundary_WebPage(WebBrowserPage, mixins=page_mixins, contents=page_contents):
+    def __init__(self, *args, size=8, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__responses = Greatschools_Boundary_WebCapture(size=size)
+
     @staticmethod
     def date(): return {"date": Date.today().strftime("%m/%d/%Y")}
     def query(self): return {"GID": str(identity_parser(self.url))}
     def setup(self, *args, **kwargs): pass
 
-    def execute(self, *args, state, **kwargs):
+    def capture(self):
+        self.responses.clear()
+        self.driver.response_interceptor = self.responses
+        del self.driver.requests
+
+    def execute(self, *args, state, timeout=30, tolerance=None, snapshots=None, **kwargs):
         query = self.query()
         url = Greatschools_Boundary_JSONWebURL(state=state, **query)
-        responses = {request.url: request.response for request in self.driver.requests}
         try:
-            response = responses[str(url)]
-        except KeyError:
+            encoding, body = self.responses.wait(str(url), timeout=timeout)
+        except TimeoutException:
             LOGGER.error("Response URL: {}".format(str(url)))
-            for index, key in enumerate(responses.keys()):
-                LOGGER.error("Response URL[{}]: {}".format(index, key))
+            for index, location in enumerate(self.responses.urls):
+                LOGGER.error("Response URL[{}]: {}".format(index, location))
             raise ExecuteError(self)
-        contents = json.loads(decode(response.body, response.headers.get('Content-Encoding', 'utf-8')))
-        mapping = {"id": "GID", "districtId": "DID", "districtName": "district", "lat": "latitude", "lon": "longitude", "name": "name", "gradeLevels": "grades", "schooltype": "type"}
-        record = {key: contents.get(key, None) for key, content in mapping.items()}
-        record["address"] = Address(ODict([("street", contents["address"]["street1"]), ("city", contents["address"]["city"]), ("state", contents["state"]), ("zipcode", contents["address"]["zip"])]))
-        try:
-            values = [tuple(value) for value in list(contents["boundaries"].values())[0]["coordinates"][0][0]]
-            shape = Shape[Geometry.RING](values)
-            return query, "shapes", ShapeRecord(shape, record)
-        except IndexError:
-            return query, "shapes", None
+        content = decode(body, encoding)
+        if snapshots is not None:
+            snapshots.save("boundary", str(url), content)
+        contents = json.loads(content)
+        return query, "shapes", boundary_parser(contents, tolerance=tolerance)
+
+    @property
+    def responses(self): return self.__responses
 
 
 class Greatschools_Boundary_WebDownloader(WebVPNProcess, WebDownloader):
-    def execute(self, *args, browser, scheduler, delayer, referer="https://www.google.com", **kwargs):
-        with scheduler(*args, **kwargs) as queue:
+    def execute(self, *args, browser, scheduler, delayer, journal=webjournal, queue_index=queue_index, change_index=change_index, refresh_index=refresh_index, backend="zip", profile=None, changes=False, metrics=None, referer="https://www.google.com", **kwargs):
+        metrics = metrics if metrics is not None else WebMetrics(name="boundary")
+        profile = profile.attach(metrics) if profile is not None else None
+        delayer.metrics = Greatschools_Boundary_WebQuery.metrics = metrics
+        delayer.vpn = self.vpn
+        Greatschools_Boundary_WebQuery.journal = journal
+        Greatschools_Boundary_WebQuery.changes = change_index
+        yield from self.replay(journal, backend)
+        with scheduler(*args, journal=journal, queue_index=queue_index, refresh_index=refresh_index, backend=backend, **kwargs) as queue:
             if not queue:
                 return
             with browser() as driver:
                 page = Greatschools_Boundary_WebPage(driver, name="GreatSchoolsPage", delayer=delayer)
                 with queue:
                     for query in queue:
+                        start = time.perf_counter()
                         if bool(self.vpn.terminated):
                             query.abandon()
                             self.terminate()
                         elif not bool(self.vpn.ready):
-                            ready = self.wait()
+                            with metrics.timer("wait"):
+                                ready = self.wait()
                             if not ready:
                                 query.abandon()
                                 self.terminate()
                         if not bool(driver):
                             driver.reset()
-                        url = self.url(**query.todict())
+                        if profile is not None:
+                            profile.install(driver)
+                        url = self.url(queue_index, **query.todict())
                         url = Greatschools_Boundary_HTMLWebURL.fromstr(str(url))
                         try:
-                            page.load(str(url), referer=referer)
-                            page.setup(*args, **kwargs)
-                            fields, dataset, data = page(*args, **kwargs)
-                            if bool(data):
-                                yield Greatschools_Boundary_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Boundary_WebDataset({dataset: data}, name="GreatschoolsDataset")
-                        except (WebPageError["refusal"], WebPageError["captcha"]):
+                            page.capture()
+                            with metrics.timer("load"):
+                                page.load(str(url), referer=referer)
+                            with metrics.timer("setup"):
+                                page.setup(*args, **kwargs)
+                            with metrics.timer("extract"):
+                                fields, dataset, data = page(*args, **kwargs)
+                            if bool(data) and (not flag_parser(changes) or change_index(dataset, query.todict()["GID"], data)):
+                                if journal is not None:
+                                    journal.result(fields, {dataset: data}, owner=query.todict())
+                                with metrics.timer("write"):
+                                    yield Greatschools_Boundary_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Boundary_WebDataset({dataset: data}, name="GreatschoolsDataset")
+                        except (WebPageError["refusal"], WebPageError["captcha"]) as error:
+                            delayer.feedback(penalty_parser(error))
                             driver.trip()
                             self.vpn.trip()
                             query.abandon()
                         except WebPageError["badrequest"]:
+                            delayer.feedback("badrequest")
                             query.success()
+                            refresh_index.success(query.todict()["GID"])
                         except (StaleWebActionError, InteractionWebActionError):
+                            delayer.feedback("failure")
                             query.failure()
+                            refresh_index.failure(query.todict()["GID"])
                         except BaseException as error:
                             query.error()
                             raise error
                         else:
+                            delayer.feedback("success")
                             query.success()
+                            refresh_index.success(query.todict()["GID"])
+                        finally:
+                            metrics.observe("query", time.perf_counter() - start)
+                            if profile is not None:
+                                profile.report(driver, query)
+
+    @staticmethod
+    def replay(journal, backend):
+        for fields, contents in (journal.pending(backend) if journal is not None else []):
+            yield Greatschools_Boundary_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Boundary_WebDataset(contents, name="GreatschoolsDataset")
+
+    @staticmethod
+    def url(index, *args, GID, **kwargs): return index.get(GID)
+
+
+class Greatschools_Boundary_ParquetWebDownloader(ParquetMixin, Greatschools_Boundary_WebDownloader): pass
+class Greatschools_Boundary_JSONWebDownloader(WebVPNProcess, WebDownloader):
+    def execute(self, *args, session, scheduler, delayer, state, host=None, tolerance=None, journal=webjournal, queue_index=queue_index, change_index=change_index, refresh_index=refresh_index, backend="zip", changes=False, snapshots=None, metrics=None, referer="https://www.greatschools.org", **kwargs):
+        metrics = metrics if metrics is not None else WebMetrics(name="boundary")
+        delayer.metrics = Greatschools_Boundary_WebQuery.metrics = metrics
+        delayer.vpn = self.vpn
+        Greatschools_Boundary_WebQuery.journal = journal
+        Greatschools_Boundary_WebQuery.changes = change_index
+        yield from self.replay(journal, backend)
+        with scheduler(*args, state=state, journal=journal, queue_index=queue_index, refresh_index=refresh_index, backend=backend, **kwargs) as queue:
+            if not queue:
+                return
+            with session() as client:
+                with queue:
+                    for query in queue:
+                        start = time.perf_counter()
+                        if bool(self.vpn.terminated):
+                            query.abandon()
+                            self.terminate()
+                        elif not bool(self.vpn.ready):
+                            with metrics.timer("wait"):
+                                ready = self.wait()
+                            if not ready:
+                                query.abandon()
+                                self.terminate()
+                        if not bool(client):
+                            client.reset()
+                        url = host_parser(Greatschools_Boundary_JSONWebURL(state=state, **query.todict()), host)
+                        try:
+                            delayer()
+                            with metrics.timer("load"):
+                                response = client.get(url, referer=referer)
+                            with metrics.timer("extract"):
+                                outcome, contents = boundary_outcome(response)
+                                data = boundary_parser(contents, tolerance=tolerance) if outcome == "success" else None
+                            if outcome == "success":
+                                if snapshots is not None:
+                                    snapshots.save("boundary", url, response.text)
+                                if bool(data) and (not flag_parser(changes) or change_index("shapes", query.todict()["GID"], data)):
+                                    if journal is not None:
+                                        journal.result(query.todict(), {"shapes": data}, owner=query.todict())
+                                    with metrics.timer("write"):
+                                        yield Greatschools_Boundary_WebQuery(query.todict(), name="GreatschoolsQuery"), Greatschools_Boundary_WebDataset({"shapes": data}, name="GreatschoolsDataset")
+                        except (requests.ConnectionError, requests.Timeout, KeyError):
+                            delayer.feedback("failure")
+                            query.failure()
+                            refresh_index.failure(query.todict()["GID"])
+                        except BaseException as error:
+                            query.error()
+                            raise error
+                        else:
+                            delayer.feedback(outcome)
+                            if outcome in ("refusal", "captcha"):
+                                client.reset()
+                                self.vpn.trip()
+                                query.abandon()
+                            elif outcome == "failure":
+                                query.failure()
+                                refresh_index.failure(query.todict()["GID"])
+                            else:
+                                query.success()
+                                refresh_index.success(query.todict()["GID"])
+                        finally:
+                            metrics.observe("query", time.perf_counter() - start)
 
     @staticmethod
-    def url(*args, GID, **kwargs):
-        with DataframeFile(file=QUEUE_FILE, mode="r", index=False, header=True, parsers={}, parser=str) as reader:
-            record = reader()
-            urls = record(index="GID", header="link").squeeze()
-        url = urls.get(GID)
-        return url
-
-
-def main(*args, **kwargs):
-    delayer = Greatschools_Boundary_WebDelayer(name="GreatSchoolsDelayer", method="random", wait=(30, 60))
-    browser = Greatschools_Boundary_WebBrowser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
-    scheduler = Greatschools_Boundary_WebScheduler(name="GreatSchoolsScheduler", randomize=True, size=5, file=REPORT_FILE)
-    downloader = Greatschools_Boundary_WebDownloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2)
+    def replay(journal, backend):
+        for fields, contents in (journal.pending(backend) if journal is not None else []):
+            yield Greatschools_Boundary_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Boundary_WebDataset(contents, name="GreatschoolsDataset")
+
+
+class Greatschools_Boundary_ParquetJSONWebDownloader(ParquetMixin, Greatschools_Boundary_JSONWebDownloader): pass
+
+
+def snapshot_parser(file, *args, tolerance=None, **kwargs):
+    try:
+        url, date, content = snapshot_loader(file)
+        data = boundary_parser(json.loads(content), tolerance=tolerance)
+        return [({"GID": str(identity_parser(url))}, "shapes", data)] if bool(data) else []
+    except Exception as error:
+        LOGGER.warning("Snapshot[{}]: {}".format(str(file), repr(error)))
+        return []
+
+
+def rebuild(*args, processes=None, date=None, encoding="wkb", tolerance=None, **kwargs):
+    repository = ParquetRepository(directory=REPOSITORY_DIR, encoding=encoding)
+    function = functools.partial(snapshot_parser, tolerance=float(tolerance)) if tolerance is not None else snapshot_parser
+    for fields, dataset, data in snapshot_replay(SnapshotStore(directory=SNAPSHOT_DIR), "boundary", function, processes=processes, date=date):
+        repository.append(dataset, data)
+    repository.flush()
+
+
+def main(*args, mode="browser", delay="random", backend="zip", encoding="wkb", tolerance=None, snapshot=False, export="prom", tabs=1, memory=None, clear=True, priority=False, resume=True, lookup=False, **kwargs):
+    tolerance = float(tolerance) if tolerance not in (None, "") else None
+    priority = flag_parser(priority)
+    if mode == "replay":
+        assert backend == "parquet"
+        rebuild(*args, encoding=encoding, tolerance=tolerance, **kwargs)
+        return
+    journal = webjournal if flag_parser(resume) else None
+    options = dict(encoding=encoding, tolerance=tolerance, journal=journal) if backend == "parquet" else {}
+    Delayer = Greatschools_Boundary_AdaptiveWebDelayer if delay == "adaptive" else Greatschools_Boundary_WebDelayer
+    adaptive = dict(lookup=flag_parser(lookup)) if delay == "adaptive" else {}
+    delayer = Delayer(name="GreatSchoolsDelayer", method="random", wait=(30, 60), **adaptive)
+    scheduler = Greatschools_Boundary_WebScheduler(name="GreatSchoolsScheduler", randomize=not priority, size=5, file=REPORT_FILE)
+    if mode == "json":
+        session = Greatschools_Boundary_WebSession(name="GreatSchoolsSession", timeout=60)
+        Downloader = Greatschools_Boundary_ParquetJSONWebDownloader if backend == "parquet" else Greatschools_Boundary_JSONWebDownloader
+        downloader = Downloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2, **options)
+        connections = dict(session=session)
+    elif mode == "production":
+        browser = Greatschools_Boundary_HeadlessWebBrowser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
+        browser = WebTabSession(browser=browser, tabs=tabs, memory=memory, clear=flag_parser(clear)) if int(tabs) > 1 else browser
+        profile = WebProfile(name="GreatSchoolsProfile")
+        Downloader = Greatschools_Boundary_ParquetWebDownloader if backend == "parquet" else Greatschools_Boundary_WebDownloader
+        downloader = Downloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2, **options)
+        connections = dict(browser=browser, profile=profile)
+    else:
+        browser = Greatschools_Boundary_WebBrowser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
+        browser = WebTabSession(browser=browser, tabs=tabs, memory=memory, clear=flag_parser(clear)) if int(tabs) > 1 else browser
+        Downloader = Greatschools_Boundary_ParquetWebDownloader if backend == "parquet" else Greatschools_Boundary_WebDownloader
+        downloader = Downloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2, **options)
+        connections = dict(browser=browser)
     vpn = Nord_WebVPN(name="NordVPN", file=NORDVPN_EXE, server="United States", timeout=60*2)
     vpn += downloader
-    downloader(*args, browser=browser, scheduler=scheduler, delayer=delayer, **kwargs)
+    snapshots = SnapshotStore(directory=SNAPSHOT_DIR) if flag_parser(snapshot) else None
+    metrics = WebMetrics(name="boundary", file=os.path.join(REPOSITORY_DIR, "boundary.{}".format(export)))
+    downloader(*args, scheduler=scheduler, priority=priority, delayer=delayer, journal=journal, backend=backend, tolerance=tolerance, snapshots=snapshots, metrics=metrics, **connections, **kwargs)
     vpn.start()
     downloader.start()
     downloader.join()
     vpn.stop()
     vpn.join()
+    if journal is not None:
+        journal.checkpoint() if not bool(downloader.error) and not bool(vpn.error) else journal.stop()
+    change_index.close()
+    metrics.export()
+    metrics.report()
     for query, results in downloader.results.items():
         LOGGER.info(str(query))
         LOGGER.info(str(results))
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Content Change Detection
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import json
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+import pandas as pd
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["ChangeIndex", "content_hash"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+IGNORED = ("date",)
+create_statement = "CREATE TABLE IF NOT EXISTS changes (dataset TEXT NOT NULL, GID INTEGER NOT NULL, hash BLOB NOT NULL, seen REAL NOT NULL, PRIMARY KEY (dataset, GID)) WITHOUT ROWID"
+select_statement = "SELECT hash FROM changes WHERE dataset = ? AND GID = ?"
+upsert_statement = "INSERT INTO changes (dataset, GID, hash, seen) VALUES (?, ?, ?, ?) ON CONFLICT (dataset, GID) DO UPDATE SET hash = excluded.hash, seen = excluded.seen"
+seen_statement = "UPDATE changes SET seen = ? WHERE dataset = ? AND GID = ?"
+
+
+def content_iterator(data):
+    if data is None:
+        yield b"\x00"
+    elif isinstance(data, pd.DataFrame):
+        dataframe = data.drop(columns=[column for column in IGNORED if column in data.columns])
+        dataframe = dataframe.reindex(sorted(dataframe.columns, key=str), axis=1).astype(str)
+        yield json.dumps([str(column) for column in dataframe.columns]).encode("utf-8")
+        yield pd.util.hash_pandas_object(dataframe, index=False).to_numpy().tobytes()
+    elif isinstance(data, dict):
+        yield json.dumps({str(key): str(value) for key, value in data.items() if key not in IGNORED}, sort_keys=True).encode("utf-8")
+    elif isinstance(data, (list, tuple)):
+        for item in data:
+            yield from content_iterator(item)
+    elif hasattr(data, "record") and hasattr(data, "shape"):
+        yield from content_iterator(dict(data.record))
+        yield json.dumps([list(map(float, value)) for value in list(data.shape)]).encode("utf-8")
+    else:
+        yield str(data).encode("utf-8")
+
+
+def content_hash(data):
+    digest = hashlib.blake2b(digest_size=16)
+    for content in content_iterator(data):
+        digest.update(content)
+    return digest.digest()
+
+
+class ChangeIndex(object):
+    def __init__(self, *args, file, **kwargs):
+        self.__mutex = threading.RLock()
+        self.__connection = None
+        self.__file = file
+        self.__counts = {"changed": 0, "unchanged": 0, "discarded": 0}
+        self.__staged = {}
+
+    def __repr__(self): return "{}(file={})".format(self.__class__.__name__, repr(self.file))
+
+    @property
+    def connection(self):
+        with self.mutex:
+            if self.__connection is None:
+                os.makedirs(os.path.dirname(self.file) or ".", exist_ok=True)
+                self.__connection = sqlite3.connect(self.file, timeout=60, check_same_thread=False, isolation_level=None)
+                self.__connection.execute("PRAGMA journal_mode=WAL")
+                self.__connection.execute("PRAGMA synchronous=NORMAL")
+                self.__connection.execute(create_statement)
+            return self.__connection
+
+    def __call__(self, dataset, GID, data):
+        current, now = content_hash(data), time.time()
+        with self.mutex:
+            row = self.connection.execute(select_statement, (str(dataset), int(GID))).fetchone()
+            if row is not None and bytes(row[0]) == current:
+                self.connection.execute(seen_statement, (now, str(dataset), int(GID)))
+                self.counts["unchanged"] += 1
+                return False
+            self.staged.setdefault(int(GID), {})[str(dataset)] = current
+            return True
+
+    def record(self, query, outcome):
+        GID = dict(query).get("GID", None)
+        if GID is None:
+            return
+        with self.mutex:
+            staged, now = self.staged.pop(int(GID), {}), time.time()
+            if outcome != "success":
+                self.counts["discarded"] += len(staged)
+                return
+            with self.connection:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(upsert_statement, [(dataset, int(GID), current, now) for dataset, current in staged.items()])
+            self.counts["changed"] += len(staged)
+
+    def close(self):
+        with self.mutex:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+        LOGGER.info("Changes: {}[changed={:.0f}|unchanged={:.0f}|discarded={:.0f}]".format(repr(self), self.counts["changed"], self.counts["unchanged"], self.counts["discarded"]))
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def file(self): return self.__file
+    @property
+    def counts(self): return self.__counts
+    @property
+    def staged(self): return self.__staged
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Adaptive Delayer Objects
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import os.path
+import time
+import json
+import random
+import logging
+import threading
+import urllib.request
+
+MAIN_DIR = os.path.dirname(os.path.realpath(__file__))
+MODULE_DIR = os.path.abspath(os.path.join(MAIN_DIR, os.pardir))
+ROOT_DIR = os.path.abspath(os.path.join(MODULE_DIR, os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from webscraping.webtimers import WebDelayer
+from webscraping.weberrors import WebPageError
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["FeedbackWebDelayer", "AdaptiveWebDelayer", "AIMDController", "RandomController", "WebEndpoint", "simulate", "replay"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+SUCCESSES = ("success", "badrequest")
+PENALTYS = ("captcha", "refusal")
+ADDRESS_URL = "https://api.ipify.org"
+penalty_parser = lambda error: "captcha" if isinstance(error, WebPageError["captcha"]) else "refusal"
+
+
+class AIMDController(object):
+    def __init__(self, *args, wait=(10, 20), bounds=(2, 300), step=0.5, backoff=2.0, jitter=0.25, **kwargs):
+        assert backoff > 1 and step > 0 and 0 <= jitter < 1
+        self.__mutex = threading.RLock()
+        self.__initial = sum(wait) / 2
+        self.__bounds = (min(bounds), max(bounds))
+        self.__step = step
+        self.__backoff = backoff
+        self.__jitter = jitter
+        self.__delays = {}
+
+    def __repr__(self): return "{}(step={}, backoff={}, jitter={})".format(self.__class__.__name__, self.step, self.backoff, self.jitter)
+    def seconds(self, endpoint=None): return self.__delays.get(endpoint, self.__initial)
+
+    def delay(self, endpoint=None):
+        seconds = self.seconds(endpoint)
+        return random.uniform(seconds * (1 - self.jitter), seconds * (1 + self.jitter))
+
+    def feedback(self, outcome, endpoint=None):
+        with self.mutex:
+            seconds = self.seconds(endpoint)
+            if outcome in SUCCESSES:
+                seconds = seconds - self.step
+            elif outcome in PENALTYS:
+                seconds = seconds * self.backoff
+            self.__delays[endpoint] = min(max(seconds, self.bounds[0]), self.bounds[1])
+            return self.__delays[endpoint]
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def bounds(self): return self.__bounds
+    @property
+    def step(self): return self.__step
+    @property
+    def backoff(self): return self.__backoff
+    @property
+    def jitter(self): return self.__jitter
+
+
+class RandomController(object):
+    def __init__(self, *args, wait=(10, 20), **kwargs): self.__wait = wait
+    def __repr__(self): return "{}(wait={})".format(self.__class__.__name__, repr(self.__wait))
+    def delay(self, endpoint=None): return random.uniform(*self.__wait)
+    def feedback(self, outcome, endpoint=None): pass
+
+
+class WebEndpoint(object):
+    resolvers = {}
+
+    def __init__(self, vpn, *args, lookup=False, url=ADDRESS_URL, timeout=5, ttl=60, **kwargs):
+        self.__mutex = threading.RLock()
+        self.__vpn = vpn
+        self.__lookup = bool(lookup)
+        self.__url = url
+        self.__timeout = float(timeout)
+        self.__ttl = float(ttl)
+        self.__address = None
+        self.__expires = 0
+
+    def __repr__(self): return "{}(lookup={}, url={}, ttl={})".format(self.__class__.__name__, repr(self.lookup), repr(self.url), repr(self.ttl))
+
+    def __call__(self):
+        if not self.lookup:
+            return self.server
+        with self.mutex:
+            if not bool(getattr(self.vpn, "ready", True)):
+                self.__expires = 0
+                return self.__address or self.server
+            if self.__address is None or time.monotonic() >= self.__expires:
+                self.__address = self.resolve()
+                self.__expires = time.monotonic() + self.ttl
+                LOGGER.debug("Endpoint: {}[{}]".format(repr(self), str(self.__address)))
+            return self.__address
+
+    @classmethod
+    def resolver(cls, vpn, *args, lookup=False, **kwargs):
+        if (id(vpn), bool(lookup)) not in cls.resolvers:
+            cls.resolvers[(id(vpn), bool(lookup))] = cls(vpn, *args, lookup=lookup, **kwargs)
+        return cls.resolvers[(id(vpn), bool(lookup))]
+
+    def resolve(self):
+        try:
+            with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+                return response.read().decode("utf-8").strip() or self.server
+        except Exception as error:
+            LOGGER.warning("Endpoint: {}[{}]".format(repr(self), repr(error)))
+            return self.server
+
+    @property
+    def server(self): return str(getattr(self.vpn, "connected", None) or getattr(self.vpn, "server", None) or self.vpn)
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def vpn(self): return self.__vpn
+    @property
+    def lookup(self): return self.__lookup
+    @property
+    def url(self): return self.__url
+    @property
+    def timeout(self): return self.__timeout
+    @property
+    def ttl(self): return self.__ttl
+
+
+class FeedbackWebDelayer(WebDelayer):
+    metrics = None
+    vpn = None
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.sleep(*args, **kwargs)
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe("delayer", time.perf_counter() - start)
+
+    def feedback(self, outcome, *args, endpoint=None, **kwargs):
+        if self.metrics is not None:
+            self.metrics.count(outcome, kind="response")
+        self.adapt(outcome, *args, endpoint=endpoint, **kwargs)
+
+    def sleep(self, *args, **kwargs): return super().__call__(*args, **kwargs)
+    def adapt(self, outcome, *args, endpoint=None, **kwargs): pass
+
+
+class AdaptiveWebDelayer(FeedbackWebDelayer):
+    def __init__(self, *args, name, method=None, wait=(10, 20), bounds=(2, 300), step=0.5, backoff=2.0, jitter=0.25, lookup=False, **kwargs):
+        super().__init__(*args, name=name, method="constant", wait=min(wait), **kwargs)
+        self.__controller = AIMDController(wait=wait, bounds=bounds, step=step, backoff=backoff, jitter=jitter)
+        self.__lookup = bool(lookup)
+        self.__endpoint = None
+
+    def sleep(self, *args, **kwargs):
+        self.endpoint = self.resolve()
+        seconds = self.controller.delay(self.endpoint)
+        time.sleep(seconds)
+        return seconds
+
+    def adapt(self, outcome, *args, endpoint=None, **kwargs):
+        self.endpoint = endpoint if endpoint is not None else self.resolve()
+        seconds = self.controller.feedback(outcome, self.endpoint)
+        LOGGER.debug("Feedback[{}]: {}|{:.2f}s".format(str(outcome), str(self.endpoint), seconds))
+
+    def resolve(self): return WebEndpoint.resolver(self.vpn, lookup=self.lookup)() if self.vpn is not None else self.endpoint
+
+    @property
+    def controller(self): return self.__controller
+    @property
+    def lookup(self): return self.__lookup
+    @property
+    def endpoint(self): return self.__endpoint
+    @endpoint.setter
+    def endpoint(self, endpoint): self.__endpoint = endpoint
+
+
+def simulate(controller, outcomes, *args, latency=5, **kwargs):
+    elapsed, counts = 0, {}
+    for endpoint, outcome in outcomes:
+        elapsed += controller.delay(endpoint) + latency
+        controller.feedback(outcome, endpoint)
+        counts[outcome] = counts.get(outcome, 0) + 1
+    successes = sum([counts.get(outcome, 0) for outcome in SUCCESSES])
+    return {"elapsed": elapsed, "throughput": successes * 3600 / max(elapsed, 1), **counts}
+
+
+def replay(file, *args, wait=(10, 20), **kwargs):
+    with open(file, "r") as reader:
+        records = [json.loads(line) for line in reader if line.strip()]
+    outcomes = [(record.get("endpoint", None), record["outcome"]) for record in records]
+    results = {}
+    for controller in (RandomController(wait=wait), AIMDController(*args, wait=wait, **kwargs)):
+        results[repr(controller)] = simulate(controller, outcomes, *args, **kwargs)
+        LOGGER.info("Simulation[{}]: {}".format(repr(controller), json.dumps(results[repr(controller)])))
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="[%(levelname)s, %(threadName)s]:  %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    replay(*sys.argv[1:])
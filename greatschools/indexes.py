@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Index Objects
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import os.path
+import time
+import logging
+import threading
+import numpy as np
+
+MAIN_DIR = os.path.dirname(os.path.realpath(__file__))
+MODULE_DIR = os.path.abspath(os.path.join(MAIN_DIR, os.pardir))
+ROOT_DIR = os.path.abspath(os.path.join(MODULE_DIR, os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from files.dataframes import DataframeFile
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["LinkIndex", "GIDSet"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LinkIndex(object):
+    def __init__(self, *args, file, prefix="https://www.greatschools.org", **kwargs):
+        self.__mutex = threading.RLock()
+        self.__file = file
+        self.__prefix = prefix
+        self.__mtime = None
+        self.__loaded = False
+        self.__keys = np.empty(0, dtype=np.int64)
+        self.__values = np.empty(0, dtype=object)
+
+    def __repr__(self): return "{}(file={}, prefix={})".format(self.__class__.__name__, repr(self.file), repr(self.prefix))
+    def __len__(self): return len(self.keys)
+    def __contains__(self, GID): return self.get(GID) is not None
+
+    def __getitem__(self, GID):
+        link = self.get(GID)
+        if link is None:
+            raise KeyError(GID)
+        return link
+
+    def get(self, GID, default=None):
+        try:
+            key = int(GID)
+        except (TypeError, ValueError):
+            return default
+        with self.mutex:
+            if not self.loaded:
+                self.refresh()
+            position = np.searchsorted(self.keys, key)
+            if position >= len(self.keys) or self.keys[position] != key:
+                return default
+            value = self.values[position]
+            return "".join([self.prefix, value]) if not str(value).startswith("https://") else value
+
+    def refresh(self):
+        with self.mutex:
+            mtime = os.stat(self.file).st_mtime_ns if os.path.exists(self.file) else None
+            if mtime != self.mtime or not self.loaded:
+                self.load()
+                self.mtime = mtime
+            self.__loaded = True
+
+    def load(self):
+        if not os.path.exists(self.file):
+            self.keys, self.values = np.empty(0, dtype=np.int64), np.empty(0, dtype=object)
+            return
+        with DataframeFile(file=self.file, mode="r", index=False, header=True, parsers={}, parser=str) as reader:
+            record = reader()
+            dataframe = record(index="GID", header="link").reset_index()
+        dataframe.columns = ["GID", "link"]
+        dataframe = dataframe.dropna(how="any").drop_duplicates(subset="GID", keep="last")
+        keys = dataframe["GID"].astype(np.int64).to_numpy()
+        values = dataframe["link"].astype(str).str.replace(self.prefix, "", n=1, regex=False).to_numpy(dtype=object)
+        order = np.argsort(keys, kind="stable")
+        self.keys, self.values = keys[order], values[order]
+        LOGGER.info("Loaded: {}[{:.0f}]".format(repr(self), len(self.keys)))
+
+    @property
+    def file(self): return self.__file
+    @property
+    def prefix(self): return self.__prefix
+    @property
+    def mutex(self): return self.__mutex
+
+    @property
+    def loaded(self): return self.__loaded
+    @property
+    def mtime(self): return self.__mtime
+    @mtime.setter
+    def mtime(self, mtime): self.__mtime = mtime
+    @property
+    def keys(self): return self.__keys
+    @keys.setter
+    def keys(self, keys): self.__keys = keys
+    @property
+    def values(self): return self.__values
+    @values.setter
+    def values(self, values): self.__values = values
+
+
+class GIDSet(object):
+    def __init__(self, *args, size=2**16, limit=2**27, **kwargs):
+        self.__mutex = threading.Lock()
+        self.__bits = bytearray(int(size) // 8)
+        self.__limit = int(limit)
+        self.__overflow = set()
+        self.__count = 0
+
+    def __repr__(self): return "{}(count={:.0f}, bytes={:.0f})".format(self.__class__.__name__, len(self), len(self.bits))
+    def __len__(self): return self.__count
+
+    def __contains__(self, GID):
+        key = int(GID)
+        if key < 0 or key >= self.limit:
+            return key in self.overflow
+        index = key >> 3
+        return index < len(self.bits) and bool(self.bits[index] & (1 << (key & 7)))
+
+    def add(self, GID):
+        key = int(GID)
+        with self.mutex:
+            if key < 0 or key >= self.limit:
+                if key in self.overflow:
+                    return False
+                self.overflow.add(key)
+            else:
+                index, mask = key >> 3, 1 << (key & 7)
+                if index >= len(self.bits):
+                    self.bits.extend(bytes(max(index + 1, 2 * len(self.bits)) - len(self.bits)))
+                if self.bits[index] & mask:
+                    return False
+                self.bits[index] |= mask
+            self.__count += 1
+            return True
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def bits(self): return self.__bits
+    @property
+    def limit(self): return self.__limit
+    @property
+    def overflow(self): return self.__overflow
+
+
+def benchmark(*args, directory, sizes=(10**3, 10**4, 10**5, 10**6), lookups=10**4, **kwargs):
+    import pandas as pd
+    results = {}
+    for size in sizes:
+        file = os.path.join(directory, "links_{:.0f}.zip".format(size))
+        GIDs = np.arange(size, dtype=np.int64) + 100000
+        links = ["https://www.greatschools.org/california/city/{:.0f}-School/".format(GID) for GID in GIDs]
+        pd.DataFrame({"GID": GIDs.astype(str), "address": "", "link": links}).to_csv(file, index=False, compression="zip")
+        index = LinkIndex(file=file)
+        index.refresh()
+        querys = np.random.choice(GIDs, size=lookups)
+        start = time.perf_counter()
+        for GID in querys:
+            index.get(str(GID))
+        results[size] = (time.perf_counter() - start) / lookups
+        LOGGER.info("LinkIndex[{:.0f}]: {:.2f}us/lookup".format(size, results[size] * 10**6))
+    return results
+
+
+if __name__ == "__main__":
+    import tempfile
+    logging.basicConfig(level="INFO", format="[%(levelname)s, %(threadName)s]:  %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    with tempfile.TemporaryDirectory() as directory:
+        benchmark(directory=directory)
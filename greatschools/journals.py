@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Write Ahead Journal
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import zlib
+import pickle
+import struct
+import logging
+import threading
+from queue import Queue, Empty
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebJournal", "JournalMixin"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+FRAME = struct.Struct("<II")
+OUTCOMES = ("success", "failure", "abandon", "error")
+query_parser = lambda query: tuple(sorted([(str(key), str(value)) for key, value in dict(query).items()]))
+
+
+class WebJournal(object):
+    def __init__(self, *args, file, size=256, interval=0.05, **kwargs):
+        self.__mutex = threading.RLock()
+        self.__queue = Queue()
+        self.__thread = None
+        self.__file = file
+        self.__size = int(size)
+        self.__interval = float(interval)
+        self.__outcomes = {}
+        self.__results = {}
+        self.__replayed = False
+
+    def __repr__(self): return "{}(file={})".format(self.__class__.__name__, repr(self.file))
+
+    def outcome(self, query, outcome, *args, sync=False, **kwargs):
+        assert outcome in OUTCOMES
+        self.append(("outcome", dict(query), str(outcome)), sync=sync)
+
+    def result(self, query, dataset, *args, owner=None, sync=False, **kwargs):
+        self.append(("result", dict(owner if owner is not None else query), (dict(query), dict(dataset))), sync=sync)
+
+    def commit(self, backend):
+        self.append(("commit", {"backend": str(backend)}, None), sync=True)
+
+    def append(self, entry, *args, sync=False, **kwargs):
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        event = threading.Event() if sync else None
+        self.start()
+        self.queue.put((FRAME.pack(len(payload), zlib.crc32(payload)) + payload, event))
+        if event is not None:
+            event.wait()
+
+    def start(self):
+        with self.mutex:
+            if self.__thread is None or not self.__thread.is_alive():
+                self.replay()
+                os.makedirs(os.path.dirname(self.file) or ".", exist_ok=True)
+                self.__thread = threading.Thread(target=self.write, name="GreatSchoolsJournal", daemon=True)
+                self.__thread.start()
+
+    def write(self):
+        with open(self.file, "ab", buffering=0) as handle:
+            while True:
+                try:
+                    batch = [self.queue.get(timeout=self.interval)]
+                except Empty:
+                    continue
+                while len(batch) < self.size:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except Empty:
+                        break
+                closing = any([frame is None for frame, event in batch])
+                handle.write(b"".join([frame for frame, event in batch if frame is not None]))
+                os.fsync(handle.fileno())
+                for frame, event in batch:
+                    if event is not None:
+                        event.set()
+                if closing:
+                    return
+
+    def stop(self):
+        with self.mutex:
+            if self.__thread is not None and self.__thread.is_alive():
+                event = threading.Event()
+                self.queue.put((None, event))
+                event.wait()
+                self.__thread.join()
+            self.__thread = None
+
+    def replay(self):
+        with self.mutex:
+            if self.__replayed:
+                return
+            self.__replayed = True
+            if not os.path.exists(self.file):
+                return
+            with open(self.file, "rb") as handle:
+                content = handle.read()
+            position, entries, finished = 0, 0, set()
+            while position + FRAME.size <= len(content):
+                length, checksum = FRAME.unpack_from(content, position)
+                payload = content[position + FRAME.size:position + FRAME.size + length]
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break
+                kind, query, value, *persisted = pickle.loads(payload)
+                if kind == "outcome":
+                    self.outcomes[query_parser(query)] = (query, value)
+                    finished.add(query_parser(query))
+                    if value != "success":
+                        self.results.pop(query_parser(query), None)
+                elif kind == "result":
+                    if query_parser(query) in finished:
+                        self.results.pop(query_parser(query), None)
+                        finished.discard(query_parser(query))
+                    self.results.setdefault(query_parser(query), []).append((value, set(persisted[0]) if persisted else set()))
+                else:
+                    for values in self.results.values():
+                        for value, backends in values:
+                            backends.add(dict(query).get("backend", "parquet"))
+                position, entries = position + FRAME.size + length, entries + 1
+            for key in [key for key in self.results.keys() if self.outcomes.get(key, (None, None))[1] != "success"]:
+                del self.results[key]
+            self.compact()
+            if position < len(content):
+                LOGGER.warning("Truncated: {}[{:.0f}]".format(repr(self), len(content) - position))
+            LOGGER.info("Replayed: {}[entries={:.0f}|completed={:.0f}|results={:.0f}]".format(repr(self), entries, len(self.completed()), len(self.pending())))
+
+    def compact(self):
+        temporary = "{}.tmp".format(self.file)
+        with open(temporary, "wb") as handle:
+            for key, (query, outcome) in self.outcomes.items():
+                if outcome != "success":
+                    continue
+                entries = [("result", query, value, sorted(backends)) for value, backends in self.results.get(key, [])] + [("outcome", query, outcome)]
+                for entry in entries:
+                    payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+                    handle.write(FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self.file)
+        for key in [key for key, (query, outcome) in self.outcomes.items() if outcome != "success"]:
+            del self.outcomes[key]
+
+    def completed(self, field=None):
+        self.replay()
+        queries = [dict(query) for query, outcome in self.outcomes.values() if outcome == "success"]
+        return set([query[field] for query in queries if field in query]) if field is not None else queries
+
+    def pending(self, backend=None):
+        self.replay()
+        return [value for key, values in self.results.items() for value, backends in values if backend not in backends]
+
+    def checkpoint(self):
+        with self.mutex:
+            self.stop()
+            if os.path.exists(self.file):
+                os.remove(self.file)
+            self.outcomes.clear()
+            self.results.clear()
+            LOGGER.info("Checkpoint: {}".format(repr(self)))
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def queue(self): return self.__queue
+    @property
+    def file(self): return self.__file
+    @property
+    def size(self): return self.__size
+    @property
+    def interval(self): return self.__interval
+    @property
+    def outcomes(self): return self.__outcomes
+    @property
+    def results(self): return self.__results
+
+
+class JournalMixin(object):
+    journal = None
+    metrics = None
+    leases = None
+    changes = None
+
+    def success(self, *args, **kwargs):
+        self.record("success")
+        return super().success(*args, **kwargs)
+
+    def failure(self, *args, **kwargs):
+        self.record("failure")
+        return super().failure(*args, **kwargs)
+
+    def abandon(self, *args, **kwargs):
+        self.record("abandon")
+        return super().abandon(*args, **kwargs)
+
+    def error(self, *args, **kwargs):
+        self.record("error", sync=True)
+        return super().error(*args, **kwargs)
+
+    def record(self, outcome, *args, **kwargs):
+        if self.metrics is not None:
+            self.metrics.count(outcome, kind="query")
+        if self.journal is not None:
+            self.journal.outcome(self.todict(), outcome, *args, **kwargs)
+        if self.leases is not None:
+            self.leases.commit(self.todict(), outcome)
+        if self.changes is not None:
+            self.changes.record(self.todict(), outcome)
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Shared Lease Queue Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import os.path
+import csv
+import time
+import json
+import uuid
+import socket
+import sqlite3
+import logging
+import threading
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["LeaseStore", "LeaseQueue"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+STATES = ("pending", "leased", "success", "failure")
+create_statement = "CREATE TABLE IF NOT EXISTS leases (crawl TEXT NOT NULL, dataset TEXT NOT NULL, item TEXT NOT NULL, state TEXT NOT NULL, owner TEXT, expires REAL, attempts INTEGER NOT NULL DEFAULT 0, updated REAL NOT NULL, PRIMARY KEY (crawl, dataset, item))"
+index_statement = "CREATE INDEX IF NOT EXISTS leases_state ON leases (crawl, dataset, state, expires)"
+seed_statement = "INSERT OR IGNORE INTO leases (crawl, dataset, item, state, attempts, updated) VALUES (?, ?, ?, 'pending', 0, ?)"
+lapsed_statement = "UPDATE leases SET state = 'pending', owner = NULL, expires = NULL, updated = ? WHERE crawl = ? AND dataset = ? AND state = 'leased' AND expires < ?"
+select_statement = "SELECT item FROM leases WHERE crawl = ? AND dataset = ? AND state = 'pending' ORDER BY attempts, rowid LIMIT ?"
+lease_statement = "UPDATE leases SET state = 'leased', owner = ?, expires = ?, updated = ? WHERE crawl = ? AND dataset = ? AND item = ? AND state = 'pending'"
+heartbeat_statement = "UPDATE leases SET expires = ?, updated = ? WHERE crawl = ? AND dataset = ? AND owner = ? AND state = 'leased'"
+success_statement = "UPDATE leases SET state = 'success', owner = NULL, expires = NULL, updated = ? WHERE crawl = ? AND dataset = ? AND item = ? AND owner = ? AND state = 'leased'"
+failure_statement = "UPDATE leases SET state = CASE WHEN attempts + 1 >= ? THEN 'failure' ELSE 'pending' END, attempts = attempts + 1, owner = NULL, expires = NULL, updated = ? WHERE crawl = ? AND dataset = ? AND item = ? AND owner = ? AND state = 'leased'"
+release_statement = "UPDATE leases SET state = 'pending', owner = NULL, expires = NULL, updated = ? WHERE crawl = ? AND dataset = ? AND item = ? AND owner = ? AND state = 'leased'"
+releaseall_statement = "UPDATE leases SET state = 'pending', owner = NULL, expires = NULL, updated = ? WHERE crawl = ? AND dataset = ? AND owner = ? AND state = 'leased'"
+reclaim_statement = "UPDATE leases SET state = 'pending', owner = NULL, expires = NULL, updated = ? WHERE crawl = ? AND dataset = ? AND owner != ? AND state = 'leased'"
+remaining_statement = "SELECT COUNT(*) FROM leases WHERE crawl = ? AND dataset = ? AND state IN ('pending', 'leased')"
+counts_statement = "SELECT state, COUNT(*) FROM leases WHERE crawl = ? AND dataset = ? GROUP BY state"
+available_statement = "SELECT COUNT(*) FROM leases WHERE crawl = ? AND dataset = ? AND (state = 'pending' OR (state = 'leased' AND expires < ?))"
+report_statement = "SELECT item, state, attempts FROM leases WHERE crawl = ? AND dataset = ? ORDER BY rowid"
+item_parser = lambda query: json.dumps({str(key): str(value) for key, value in dict(query).items()}, sort_keys=True)
+owner_parser = lambda: "{}:{:.0f}:{}".format(socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+flag_parser = lambda x: x if isinstance(x, bool) else str(x).strip().lower() in ("true", "yes", "on", "1")
+
+
+class LeaseStore(object):
+    def __init__(self, *args, file, dataset, timeout=60*10, retrys=3, **kwargs):
+        self.__mutex = threading.RLock()
+        self.__connection = None
+        self.__file = file
+        self.__dataset = dataset
+        self.__timeout = float(timeout)
+        self.__retrys = int(retrys)
+
+    def __repr__(self): return "{}(file={}, dataset={})".format(self.__class__.__name__, repr(self.file), repr(self.dataset))
+
+    @property
+    def connection(self):
+        with self.mutex:
+            if self.__connection is None:
+                os.makedirs(os.path.dirname(self.file) or ".", exist_ok=True)
+                self.__connection = sqlite3.connect(self.file, timeout=60, check_same_thread=False, isolation_level=None)
+                self.__connection.execute("PRAGMA journal_mode=DELETE")
+                self.__connection.execute("PRAGMA synchronous=FULL")
+                self.__connection.execute(create_statement)
+                self.__connection.execute(index_statement)
+            return self.__connection
+
+    def transaction(self, function, *args, **kwargs):
+        with self.mutex:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                results = function(self.connection, *args, **kwargs)
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+            return results
+
+    def seed(self, crawl, querys):
+        now = time.time()
+        items = [(str(crawl), self.dataset, item_parser(query), now) for query in querys]
+        self.transaction(lambda connection: connection.executemany(seed_statement, items))
+
+    def lease(self, crawl, owner, size):
+        def function(connection):
+            now = time.time()
+            lapsed = connection.execute(lapsed_statement, (now, str(crawl), self.dataset, now)).rowcount
+            items = [item for (item,) in connection.execute(select_statement, (str(crawl), self.dataset, int(size)))]
+            connection.executemany(lease_statement, [(str(owner), now + self.timeout, now, str(crawl), self.dataset, item) for item in items])
+            return lapsed, items
+        lapsed, items = self.transaction(function)
+        if lapsed:
+            LOGGER.warning("Lapsed: {}[{}|{:.0f}]".format(repr(self), str(crawl), lapsed))
+        return [json.loads(item) for item in items]
+
+    def heartbeat(self, crawl, owner):
+        now = time.time()
+        with self.mutex:
+            return self.connection.execute(heartbeat_statement, (now + self.timeout, now, str(crawl), self.dataset, str(owner))).rowcount
+
+    def commit(self, crawl, owner, query, outcome):
+        now, parameters = time.time(), (str(crawl), self.dataset, item_parser(query), str(owner))
+        with self.mutex:
+            if outcome == "success":
+                committed = self.connection.execute(success_statement, (now, *parameters)).rowcount
+            elif outcome == "failure":
+                committed = self.connection.execute(failure_statement, (self.retrys, now, *parameters)).rowcount
+            else:
+                committed = self.connection.execute(release_statement, (now, *parameters)).rowcount
+        if not committed:
+            LOGGER.warning("Lease Lost: {}[{}|{}|{}]".format(repr(self), str(crawl), item_parser(query), str(outcome)))
+        return bool(committed)
+
+    def release(self, crawl, owner):
+        with self.mutex:
+            return self.connection.execute(releaseall_statement, (time.time(), str(crawl), self.dataset, str(owner))).rowcount
+
+    def reclaim(self, crawl, owner):
+        with self.mutex:
+            reclaimed = self.connection.execute(reclaim_statement, (time.time(), str(crawl), self.dataset, str(owner))).rowcount
+        if reclaimed:
+            LOGGER.warning("Reclaimed: {}[{}|{:.0f}]".format(repr(self), str(crawl), reclaimed))
+        return reclaimed
+
+    def available(self, crawl):
+        with self.mutex:
+            return self.connection.execute(available_statement, (str(crawl), self.dataset, time.time())).fetchone()[0]
+
+    def remaining(self, crawl):
+        with self.mutex:
+            return self.connection.execute(remaining_statement, (str(crawl), self.dataset)).fetchone()[0]
+
+    def counts(self, crawl):
+        with self.mutex:
+            counts = dict(self.connection.execute(counts_statement, (str(crawl), self.dataset)).fetchall())
+        return {state: counts.get(state, 0) for state in STATES}
+
+    def report(self, crawl):
+        with self.mutex:
+            rows = self.connection.execute(report_statement, (str(crawl), self.dataset)).fetchall()
+        return [{**json.loads(item), "state": state, "attempts": attempts} for item, state, attempts in rows]
+
+    def close(self):
+        with self.mutex:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def file(self): return self.__file
+    @property
+    def dataset(self): return self.__dataset
+    @property
+    def timeout(self): return self.__timeout
+    @property
+    def retrys(self): return self.__retrys
+
+
+class LeaseQueue(object):
+    def __init__(self, querys, *args, store, crawl, queryable, queue, name, report=None, reclaim=False, size=10, heartbeat=60, poll=5, backoff=60, **kwargs):
+        self.__mutex = threading.RLock()
+        self.__stop = threading.Event()
+        self.__thread = None
+        self.__depth = 0
+        self.__store = store
+        self.__crawl = str(crawl)
+        self.__owner = owner_parser()
+        self.__queryable = queryable
+        self.__queue = queue
+        self.__name = name
+        self.__report = report
+        self.__reclaim = flag_parser(reclaim)
+        self.__parameters = kwargs
+        self.__size = int(size)
+        self.__heartbeat = float(heartbeat)
+        self.__poll = float(poll)
+        self.__backoff = float(backoff)
+        self.store.seed(self.crawl, querys)
+
+    def __repr__(self): return "{}(name={}, crawl={}, owner={})".format(self.__class__.__name__, repr(self.name), repr(self.crawl), repr(self.owner))
+    def __bool__(self): return bool(self.store.available(self.crawl))
+    def __len__(self): return self.store.available(self.crawl)
+
+    def __enter__(self):
+        with self.mutex:
+            self.__depth += 1
+            if self.__depth == 1:
+                self.queryable.leases = self
+                self.__stop.clear()
+                self.__thread = threading.Thread(target=self.beat, name="GreatSchoolsLeases", daemon=True)
+                self.__thread.start()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        with self.mutex:
+            self.__depth -= 1
+            if self.__depth > 0:
+                return
+            self.__stop.set()
+            self.__thread.join()
+            self.__thread = None
+            self.queryable.leases = None
+            released = self.store.release(self.crawl, self.owner)
+        if self.report is not None:
+            self.write(self.report)
+        LOGGER.info("Leases: {}[released={:.0f}|{}]".format(repr(self), released, "|".join(["{}={:.0f}".format(state, count) for state, count in self.store.counts(self.crawl).items()])))
+
+    def __iter__(self):
+        wait = self.poll
+        while True:
+            querys = self.store.lease(self.crawl, self.owner, self.size)
+            if not querys:
+                if not self.store.remaining(self.crawl):
+                    return
+                if self.reclaim and self.store.reclaim(self.crawl, self.owner):
+                    continue
+                LOGGER.info("Waiting: {}[{:.0f}s]".format(repr(self), wait))
+                time.sleep(wait)
+                wait = min(wait * 2, self.backoff)
+                continue
+            wait = self.poll
+            LOGGER.info("Leased: {}[{:.0f}]".format(repr(self), len(querys)))
+            queue = self.queue([self.queryable(query, name="GreatSchoolsQuery") for query in querys], name=self.name, **self.parameters)
+            with queue:
+                yield from queue
+
+    def beat(self):
+        while not self.__stop.wait(self.heartbeat):
+            self.store.heartbeat(self.crawl, self.owner)
+
+    def commit(self, query, outcome): return self.store.commit(self.crawl, self.owner, query, outcome)
+
+    def write(self, file):
+        rows = self.store.report(self.crawl)
+        header = list(dict.fromkeys([key for row in rows for key in row.keys()]))
+        os.makedirs(os.path.dirname(file) or ".", exist_ok=True)
+        with open(file, "w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=header)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def store(self): return self.__store
+    @property
+    def crawl(self): return self.__crawl
+    @property
+    def owner(self): return self.__owner
+    @property
+    def queryable(self): return self.__queryable
+    @property
+    def queue(self): return self.__queue
+    @property
+    def name(self): return self.__name
+    @property
+    def report(self): return self.__report
+    @property
+    def reclaim(self): return self.__reclaim
+    @property
+    def parameters(self): return self.__parameters
+    @property
+    def size(self): return self.__size
+    @property
+    def heartbeat(self): return self.__heartbeat
+    @property
+    def poll(self): return self.__poll
+    @property
+    def backoff(self): return self.__backoff
@@ -11,8 +11,14 @@ import os.path
 import warnings
 import logging
 import traceback
+import math
+import time
+import lxml.html
 import regex as re
 from abc import ABC
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as Date
 
 MAIN_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -22,15 +28,19 @@ RESOURCE_DIR = os.path.join(ROOT_DIR, "resources")
 SAVE_DIR = os.path.join(ROOT_DIR, "save")
 REPOSITORY_DIR = os.path.join(SAVE_DIR, "greatschools")
 REPORT_FILE = os.path.join(REPOSITORY_DIR, "links.csv")
+JOURNAL_FILE = os.path.join(REPOSITORY_DIR, "links.journal")
+SNAPSHOT_DIR = os.path.join(REPOSITORY_DIR, "snapshots")
+LEASE_FILE = os.path.join(REPOSITORY_DIR, "leases.db")
 QUEUE_FILE = os.path.join(RESOURCE_DIR, "zipcodes.zip")
 DRIVER_EXE = os.path.join(RESOURCE_DIR, "chromedriver.exe")
 NORDVPN_EXE = os.path.join("C:/", "Program Files", "NordVPN", "NordVPN.exe")
 if ROOT_DIR not in sys.path:
     sys.path.append(ROOT_DIR)
+if MODULE_DIR not in sys.path:
+    sys.path.append(MODULE_DIR)
 
 from utilities.inputs import InputParser
 from files.dataframes import DataframeFile
-from webscraping.webtimers import WebDelayer
 from webscraping.webvpn import Nord_WebVPN, WebVPNProcess
 from webscraping.webdrivers import WebBrowser
 from webscraping.weburl import WebURL
@@ -44,16 +54,27 @@ from webscraping.webdownloaders import WebDownloader, CacheMixin
 from webscraping.webdata import WebClickable, WebText, WebLink, WebClickables, WebBadRequest, WebCaptcha
 from webscraping.webactions import WebMoveToClick, StaleWebActionError, InteractionWebActionError
 from webscraping.webvariables import Address
+from greatschools.delayers import FeedbackWebDelayer, AdaptiveWebDelayer, penalty_parser
+from greatschools.profiles import WebProfile
+from greatschools.journals import WebJournal, JournalMixin
+from greatschools.indexes import GIDSet
+from greatschools.snapshots import SnapshotStore, snapshot_loader, snapshot_replay
+from greatschools.sources import text_parser
+from greatschools.parquets import ParquetRepository, ParquetMixin
+from greatschools.metrics import WebMetrics
+from greatschools.sessions import WebTabSession
+from greatschools.leases import LeaseStore, LeaseQueue
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["Greatschools_Links_WebDelayer", "Greatschools_Links_WebBrowser", "Greatschools_Links_WebDownloader", "Greatschools_Links_WebScheduler"]
+__all__ = ["Greatschools_Links_WebDelayer", "Greatschools_Links_AdaptiveWebDelayer", "Greatschools_Links_WebBrowser", "Greatschools_Links_HeadlessWebBrowser", "Greatschools_Links_WebDownloader", "Greatschools_Links_PaginationWebDownloader", "Greatschools_Links_ParquetWebDownloader", "Greatschools_Links_ParquetPaginationWebDownloader", "Greatschools_Links_WebScheduler"]
 __copyright__ = "Copyright 2021, Jack Kirby Cook"
 __license__ = ""
 
 
 LOGGER = logging.getLogger(__name__)
 warnings.filterwarnings("ignore")
+webjournal = WebJournal(file=JOURNAL_FILE)
 
 
 QUERYS = ["dataset", "zipcode"]
@@ -98,8 +119,11 @@ type_parser = lambda x: str(re.findall(re.compile(r"Public district|Public chart
 address_parser = lambda x: str(Address.fromsearch(x))
 zipcode_parser = lambda x: str(re.findall(r"\d{5}$", x)[0])
 results_parser = lambda x: str(re.findall(r"(?<=of )[\d\,]+(?= schools)", x)[0])
+flag_parser = lambda x: x if isinstance(x, bool) else str(x).strip().lower() in ("true", "yes", "on", "1")
 link_parser = lambda x: "".join(["https://www.greatschools.org", x]) if not str(x).startswith("https://www.greatschools.org") else x
+host_parser = lambda url, host: str(url).replace("https://www.greatschools.org", str(host).rstrip("/"), 1) if host else str(url)
 pagination_parser = lambda x: str(int(str(x).strip()))
+snapshot_urlparser = lambda url, pagenumber: "{}#page={:.0f}".format(str(url).split("#")[0], int(pagenumber))
 
 
 class Greatschools_Captcha(WebCaptcha, loader=captcha_webloader, optional=True): pass
@@ -135,16 +159,18 @@ class Greatschools_Links_WebURL(WebURL, protocol="https", domain="www.greatschoo
     def parm(*args, zipcode, pagination=1, **kwargs): return {"page": str(int(pagination)) if pagination > 1 else None, "sort": "rating", "zip": "{:05.0f}".format(int(zipcode))}
 
 
-class Greatschools_Links_WebDelayer(WebDelayer): pass
+class Greatschools_Links_WebDelayer(FeedbackWebDelayer): pass
+class Greatschools_Links_AdaptiveWebDelayer(AdaptiveWebDelayer): pass
 class Greatschools_Links_WebBrowser(WebBrowser, files={"chrome": DRIVER_EXE}, options={"headless": False, "images": True, "incognito": False}): pass
+class Greatschools_Links_HeadlessWebBrowser(WebBrowser, files={"chrome": DRIVER_EXE}, options={"headless": True, "images": False, "incognito": False}): pass
 class Greatschools_Links_WebQueue(WebQueue): pass
-class Greatschools_Links_WebQuery(WebQuery, WebQueueable, fields=QUERYS): pass
+class Greatschools_Links_WebQuery(JournalMixin, WebQuery, WebQueueable, fields=QUERYS): journal = webjournal
 class Greatschools_Links_WebDataset(WebDataset, ABC, fields=DATASETS): pass
 
 
 class Greatschools_Links_WebScheduler(WebScheduler, fields=QUERYS, dataset=["school"]):
     @staticmethod
-    def zipcode(*args, state, county=None, countys=[], city=None, citys=[], **kwargs):
+    def zipcode(*args, state, county=None, countys=[], city=None, citys=[], journal=None, **kwargs):
         assert all([isinstance(item, (str, type(None))) for item in (county, city)])
         assert all([isinstance(item, list) for item in (countys, citys)])
         countys = list(set([item for item in [county, *countys] if item]))
@@ -157,10 +183,13 @@ class Greatschools_Links_WebScheduler(WebScheduler, fields=QUERYS, dataset=["sch
             dataframe = dataframe[(dataframe["city"].isin(list(citys)) | dataframe["county"].isin(list(countys)))]
         if state:
             dataframe = dataframe[dataframe["state"] == state]
-        return list(dataframe["zipcode"].to_numpy())
+        completed = journal.completed("zipcode") if journal is not None else set()
+        return [zipcode for zipcode in dataframe["zipcode"].to_numpy() if str(zipcode) not in completed]
 
     @staticmethod
-    def execute(querys, *args, **kwargs):
+    def execute(querys, *args, crawl=None, leases=LEASE_FILE, **kwargs):
+        if crawl is not None:
+            return LeaseQueue(querys, *args, store=LeaseStore(file=leases, dataset="links"), crawl=crawl, queryable=Greatschools_Links_WebQuery, queue=Greatschools_Links_WebQueue, name="GreatSchoolsQueue", report=REPORT_FILE, **kwargs)
         queueables = [Greatschools_Links_WebQuery(query, name="GreatSchoolsQuery") for query in querys]
         queue = Greatschools_Links_WebQueue(queueables, *args, name="GreatSchoolsQueue", **kwargs)
         return queue
@@ -191,78 +220,312 @@ class Greatschools_Links_WebPage(WebBrowserPage, mixins=page_mixins, contents=pa
     def query(self): return {"dataset": "school", "zipcode": str(self[Greatschools_WebData.ZIPCODE].data())}
     def setup(self, *args, **kwargs): pass
 
-    def execute(self, *args, **kwargs):
+    def pages(self, size):
+        if not bool(self[Greatschools_WebData.RESULTS]) or not size:
+            return 1
+        results = int(str(self[Greatschools_WebData.RESULTS].data()).replace(",", ""))
+        return max(int(math.ceil(results / size)), 1)
+
+    def execute(self, *args, paginate=True, snapshots=None, pagenumber=1, **kwargs):
+        if snapshots is not None:
+            snapshots.save("links", snapshot_urlparser(self.driver.current_url, pagenumber), self.driver.page_source)
         if not bool(self[Greatschools_WebData.RESULTS]):
             return
         query = self.query()
         data = [{"GID": content["link"].key(), "address": content["address"].data(), "link": content["link"].link()} for content in iter(self)]
         yield query, "links", data
+        if not paginate:
+            return
         nextpage = next(self)
         if bool(nextpage):
             nextpage.setup(*args, **kwargs)
-            yield from nextpage(*args, **kwargs)
+            yield from nextpage(*args, snapshots=snapshots, pagenumber=pagenumber + 1, **kwargs)
         else:
             return
 
 
+class Greatschools_Links_WebSource(object):
+    def __init__(self, source, *args, url, date=None, **kwargs):
+        self.__tree = lxml.html.fromstring(source)
+        self.__url = url
+
+    def __call__(self, *args, **kwargs):
+        if not self.tree.xpath(results_xpath) or self.tree.xpath(badrequest_xpath):
+            return
+        query = self.query()
+        data = [self.content(element) for element in self.tree.xpath(contents_xpath)]
+        yield query, "links", [content for content in data if content is not None]
+
+    def query(self):
+        zipcode = zipcode_parser(text_parser(self.tree.xpath(zipcode_xpath)[0]))
+        return {"dataset": "school", "zipcode": str(zipcode)}
+
+    @staticmethod
+    def content(element):
+        links = [link for link in element.xpath(link_contents_xpath) if link.get("href")]
+        if not links:
+            return None
+        addresses = element.xpath(address_contents_xpath)
+        link = link_parser(links[0].get("href"))
+        address = address_parser(text_parser(addresses[0])) if addresses else None
+        return {"GID": identity_parser(link), "address": address, "link": link}
+
+    @property
+    def tree(self): return self.__tree
+    @property
+    def url(self): return self.__url
+
+
 class Greatschools_Links_WebDownloader(CacheMixin, WebVPNProcess, WebDownloader, basis="GID"):
-    def execute(self, *args, browser, scheduler, delayer, referer="https://www.google.com", **kwargs):
-        with scheduler(*args, **kwargs) as queue:
+    def execute(self, *args, browser, scheduler, delayer, journal=webjournal, host=None, backend="zip", profile=None, metrics=None, referer="https://www.google.com", **kwargs):
+        metrics = metrics if metrics is not None else WebMetrics(name="links")
+        profile = profile.attach(metrics) if profile is not None else None
+        delayer.metrics = Greatschools_Links_WebQuery.metrics = metrics
+        delayer.vpn = self.vpn
+        Greatschools_Links_WebQuery.journal = journal
+        yield from self.replay(journal, backend)
+        with scheduler(*args, journal=journal, backend=backend, **kwargs) as queue:
             if not queue:
                 return
             with browser() as driver:
                 page = Greatschools_Links_WebPage(driver, name="GreatSchoolsPage", delayer=delayer)
+                seen, drops = GIDSet(), dict()
                 with queue:
                     for query in queue:
                         url = Greatschools_Links_WebURL(**query.todict())
-                        reload = False
+                        reload, start = False, time.perf_counter()
                         while True:
                             if bool(self.vpn.terminated):
                                 query.abandon()
                                 self.terminate()
                             elif not bool(self.vpn.ready):
-                                ready = self.wait()
+                                with metrics.timer("wait"):
+                                    ready = self.wait()
                                 if not ready:
                                     query.abandon()
                                     self.terminate()
                             if not bool(driver):
                                 driver.reset()
+                            if profile is not None:
+                                profile.install(driver)
                             try:
-                                page.reload(referer=referer) if reload else page.load(str(url), referer=referer)
-                                page.setup(*args, **kwargs)
-                                for fields, dataset, data in page(*args, **kwargs):
-                                    yield Greatschools_Links_WebQuery(fields, name="GreatSchoolsQuery"), Greatschools_Links_WebDataset({dataset: data}, name="GreatSchoolsDataset")
-                            except (WebPageError["refusal"], WebPageError["captcha"]):
+                                with metrics.timer("load"):
+                                    page.reload(referer=referer) if reload else page.load(host_parser(url, host), referer=referer)
+                                with metrics.timer("setup"):
+                                    page.setup(*args, **kwargs)
+                                for fields, dataset, data in metrics.iterate("extract", page(*args, **kwargs)):
+                                    data = self.deduplicate(fields, data, seen=seen, drops=drops)
+                                    if journal is not None:
+                                        journal.result(fields, {dataset: data}, owner=query.todict())
+                                    with metrics.timer("write"):
+                                        yield Greatschools_Links_WebQuery(fields, name="GreatSchoolsQuery"), Greatschools_Links_WebDataset({dataset: data}, name="GreatSchoolsDataset")
+                            except (WebPageError["refusal"], WebPageError["captcha"]) as error:
+                                delayer.feedback(penalty_parser(error))
                                 driver.trip()
                                 self.vpn.trip()
                                 reload = True
                             except WebPageError["badrequest"]:
+                                delayer.feedback("badrequest")
                                 query.success()
                                 break
                             except (WebPageError["pagination"], StaleWebActionError, InteractionWebActionError):
+                                delayer.feedback("failure")
                                 query.failure()
                                 break
                             except BaseException as error:
                                 query.error()
                                 raise error
                             else:
+                                delayer.feedback("success")
                                 query.success()
                                 break
+                            finally:
+                                if profile is not None:
+                                    profile.report(driver, query)
+                        metrics.observe("query", time.perf_counter() - start)
+                self.report(drops)
 
+    @staticmethod
+    def deduplicate(fields, data, *args, seen, drops, **kwargs):
+        records = [record for record in (data or []) if seen.add(record["GID"])]
+        zipcode = str(fields.get("zipcode", None))
+        drops[zipcode] = drops.get(zipcode, 0) + len(data or []) - len(records)
+        return records
+
+    @staticmethod
+    def report(drops):
+        for zipcode, dropped in sorted(drops.items()):
+            if dropped:
+                LOGGER.info("Duplicates[{}]: {:.0f}".format(zipcode, dropped))
+        LOGGER.info("Duplicates: {:.0f}".format(sum(drops.values())))
 
-def main(*args, **kwargs):
-    delayer = Greatschools_Links_WebDelayer(name="GreatSchoolsDelayer", method="random", wait=(10, 20))
-    browser = Greatschools_Links_WebBrowser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
+    @staticmethod
+    def replay(journal, backend):
+        for fields, contents in (journal.pending(backend) if journal is not None else []):
+            yield Greatschools_Links_WebQuery(fields, name="GreatSchoolsQuery"), Greatschools_Links_WebDataset(contents, name="GreatSchoolsDataset")
+
+
+class Greatschools_Links_PaginationWebDownloader(Greatschools_Links_WebDownloader, basis="GID"):
+    def execute(self, *args, browsers, scheduler, delayers, retrys=3, journal=webjournal, backend="zip", profile=None, metrics=None, referer="https://www.google.com", **kwargs):
+        metrics = metrics if metrics is not None else WebMetrics(name="links")
+        profile = profile.attach(metrics) if profile is not None else None
+        Greatschools_Links_WebQuery.metrics = metrics
+        Greatschools_Links_WebQuery.journal = journal
+        for delayer in delayers:
+            delayer.metrics = metrics
+            delayer.vpn = self.vpn
+        yield from self.replay(journal, backend)
+        assert len(browsers) == len(delayers)
+        with scheduler(*args, journal=journal, backend=backend, **kwargs) as queue:
+            if not queue:
+                return
+            with ExitStack() as stack:
+                drivers = [stack.enter_context(browser()) for browser in browsers]
+                pages = [Greatschools_Links_WebPage(driver, name="GreatSchoolsPage[{}]".format(index), delayer=delayer) for index, (driver, delayer) in enumerate(zip(drivers, delayers))]
+                workers = list(zip(drivers, pages, delayers))
+                seen, drops = GIDSet(), dict()
+                with queue:
+                    for query in queue:
+                        start = time.perf_counter()
+                        if bool(self.vpn.terminated):
+                            query.abandon()
+                            self.terminate()
+                        elif not bool(self.vpn.ready):
+                            with metrics.timer("wait"):
+                                ready = self.wait()
+                            if not ready:
+                                query.abandon()
+                                self.terminate()
+                        try:
+                            urls = [(1, Greatschools_Links_WebURL(**query.todict()))]
+                            results, failures = self.pagination(urls, workers[:1], *args, retrys=retrys, profile=profile, metrics=metrics, referer=referer, **kwargs)
+                            if not failures:
+                                size = sum([len(data) for fields, dataset, data in results[1]])
+                                urls = [(number, Greatschools_Links_WebURL(**query.todict(), pagination=number)) for number in range(2, workers[0][1].pages(size) + 1)]
+                                remaining, failures = self.pagination(urls, workers, *args, retrys=retrys, profile=profile, metrics=metrics, referer=referer, **kwargs)
+                                results.update(remaining)
+                            for number in sorted(results.keys()):
+                                for fields, dataset, data in results[number]:
+                                    data = self.deduplicate(fields, data, seen=seen, drops=drops)
+                                    if journal is not None:
+                                        journal.result(fields, {dataset: data}, owner=query.todict())
+                                    with metrics.timer("write"):
+                                        yield Greatschools_Links_WebQuery(fields, name="GreatSchoolsQuery"), Greatschools_Links_WebDataset({dataset: data}, name="GreatSchoolsDataset")
+                        except BaseException as error:
+                            query.error()
+                            raise error
+                        if bool(failures):
+                            LOGGER.warning("Pagination Failures: {}[{}]".format(str(query), ", ".join([str(number) for number in failures])))
+                            query.failure()
+                        else:
+                            query.success()
+                        metrics.observe("query", time.perf_counter() - start)
+                self.report(drops)
+
+    def pagination(self, urls, workers, *args, retrys, profile, metrics, referer, **kwargs):
+        tasks, results, failures = deque([(number, url, 0) for number, url in urls]), dict(), list()
+        with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+            futures = [executor.submit(self.paginate, tasks, results, failures, *args, driver=driver, page=page, delayer=delayer, retrys=retrys, profile=profile, metrics=metrics, referer=referer, **kwargs) for driver, page, delayer in workers]
+            for future in futures:
+                future.result()
+        return results, sorted(failures)
+
+    def paginate(self, tasks, results, failures, *args, driver, page, delayer, retrys, profile, metrics, referer, **kwargs):
+        while True:
+            try:
+                number, url, attempt = tasks.popleft()
+            except IndexError:
+                return
+            if not bool(driver):
+                driver.reset()
+            if profile is not None:
+                profile.install(driver)
+            try:
+                with metrics.timer("load"):
+                    page.load(str(url), referer=referer)
+                with metrics.timer("setup"):
+                    page.setup(*args, **kwargs)
+                with metrics.timer("extract"):
+                    results[number] = list(page(*args, paginate=False, **kwargs))
+            except (WebPageError["refusal"], WebPageError["captcha"]) as error:
+                delayer.feedback(penalty_parser(error))
+                driver.trip()
+                self.vpn.trip()
+                tasks.append((number, url, attempt + 1)) if attempt + 1 < retrys else failures.append(number)
+            except WebPageError["badrequest"]:
+                delayer.feedback("badrequest")
+                results[number] = []
+            except (WebPageError["pagination"], StaleWebActionError, InteractionWebActionError):
+                delayer.feedback("failure")
+                tasks.append((number, url, attempt + 1)) if attempt + 1 < retrys else failures.append(number)
+            else:
+                delayer.feedback("success")
+            finally:
+                if profile is not None:
+                    profile.report(driver, str(url))
+
+
+class Greatschools_Links_ParquetWebDownloader(ParquetMixin, Greatschools_Links_WebDownloader, basis="GID"): pass
+class Greatschools_Links_ParquetPaginationWebDownloader(ParquetMixin, Greatschools_Links_PaginationWebDownloader, basis="GID"): pass
+
+
+def snapshot_parser(file):
+    try:
+        url, date, content = snapshot_loader(file)
+        return list(Greatschools_Links_WebSource(content, url=url, date=date)())
+    except Exception as error:
+        LOGGER.warning("Snapshot[{}]: {}".format(str(file), repr(error)))
+        return []
+
+
+def rebuild(*args, processes=None, date=None, **kwargs):
+    repository = ParquetRepository(directory=REPOSITORY_DIR)
+    seen = GIDSet()
+    for fields, dataset, data in snapshot_replay(SnapshotStore(directory=SNAPSHOT_DIR), "links", snapshot_parser, processes=processes, date=date):
+        repository.append(dataset, [record for record in data if seen.add(record["GID"])])
+    repository.flush()
+
+
+def main(*args, pagination="click", pool=1, delay="random", mode="default", backend="zip", snapshot=False, export="prom", tabs=1, memory=None, clear=True, resume=True, lookup=False, **kwargs):
+    if mode == "replay":
+        assert backend == "parquet"
+        rebuild(*args, **kwargs)
+        return
+    Browser = Greatschools_Links_HeadlessWebBrowser if mode == "production" else Greatschools_Links_WebBrowser
+    profile = WebProfile(name="GreatSchoolsProfile") if mode == "production" else None
     scheduler = Greatschools_Links_WebScheduler(name="GreatSchoolsScheduler", randomize=True, size=5, file=REPORT_FILE)
-    downloader = Greatschools_Links_WebDownloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2)
+    journal = webjournal if flag_parser(resume) else None
+    options = dict(journal=journal) if backend == "parquet" else {}
+    Delayer = Greatschools_Links_AdaptiveWebDelayer if delay == "adaptive" else Greatschools_Links_WebDelayer
+    adaptive = dict(lookup=flag_parser(lookup)) if delay == "adaptive" else {}
+    if pagination == "url":
+        delayers = [Delayer(name="GreatSchoolsDelayer[{}]".format(index), method="random", wait=(10, 20), **adaptive) for index in range(int(pool))]
+        browsers = [Browser(name="GreatSchoolsBrowser[{}]".format(index), browser="chrome", timeout=60) for index in range(int(pool))]
+        browsers = [WebTabSession(browser=browser, tabs=tabs, memory=memory, clear=flag_parser(clear)) for browser in browsers] if int(tabs) > 1 else browsers
+        Downloader = Greatschools_Links_ParquetPaginationWebDownloader if backend == "parquet" else Greatschools_Links_PaginationWebDownloader
+        downloader = Downloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2, **options)
+        connections = dict(browsers=browsers, delayers=delayers)
+    else:
+        delayer = Delayer(name="GreatSchoolsDelayer", method="random", wait=(10, 20), **adaptive)
+        browser = Browser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
+        browser = WebTabSession(browser=browser, tabs=tabs, memory=memory, clear=flag_parser(clear)) if int(tabs) > 1 else browser
+        Downloader = Greatschools_Links_ParquetWebDownloader if backend == "parquet" else Greatschools_Links_WebDownloader
+        downloader = Downloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2, **options)
+        connections = dict(browser=browser, delayer=delayer)
     vpn = Nord_WebVPN(name="NordVPN", file=NORDVPN_EXE, server="United States", timeout=60*2)
     vpn += downloader
-    downloader(*args, browser=browser, scheduler=scheduler, delayer=delayer, **kwargs)
+    snapshots = SnapshotStore(directory=SNAPSHOT_DIR) if flag_parser(snapshot) else None
+    metrics = WebMetrics(name="links", file=os.path.join(REPOSITORY_DIR, "links.{}".format(export)))
+    downloader(*args, scheduler=scheduler, profile=profile, journal=journal, backend=backend, snapshots=snapshots, metrics=metrics, **connections, **kwargs)
     vpn.start()
     downloader.start()
     downloader.join()
     vpn.stop()
     vpn.join()
+    if journal is not None:
+        journal.checkpoint() if not bool(downloader.error) and not bool(vpn.error) else journal.stop()
+    metrics.export()
+    metrics.report()
     for query, results in downloader.results.items():
         LOGGER.info(str(query))
         LOGGER.info(str(results))
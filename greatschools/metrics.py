@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Latency Metrics Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import os.path
+import time
+import json
+import uuid
+import bisect
+import logging
+import threading
+from contextlib import contextmanager
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebMetrics", "WebHistogram"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+STAGES = ("load", "setup", "extract", "delayer", "wait", "write", "query", "pageload")
+OUTCOMES = ("captcha", "refusal", "badrequest", "failure", "abandon")
+
+
+class WebHistogram(object):
+    def __init__(self, *args, buckets=BUCKETS, **kwargs):
+        self.__buckets = tuple(sorted(buckets))
+        self.__counts = [0] * (len(self.__buckets) + 1)
+        self.__total = 0.0
+        self.__count = 0
+
+    def __repr__(self): return "{}(count={:.0f}, sum={:.3f})".format(self.__class__.__name__, self.count, self.total)
+
+    def observe(self, seconds):
+        self.__counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.__total += seconds
+        self.__count += 1
+
+    def quantile(self, fraction):
+        if not self.count:
+            return None
+        target, cumulative = fraction * self.count, 0
+        for bucket, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return bucket
+        return float("inf")
+
+    def todict(self): return {"count": self.count, "sum": round(self.total, 6), "buckets": dict(zip([str(bucket) for bucket in self.buckets] + ["+Inf"], self.counts)), "p50": self.quantile(0.5), "p99": self.quantile(0.99)}
+
+    @property
+    def buckets(self): return self.__buckets
+    @property
+    def counts(self): return self.__counts
+    @property
+    def total(self): return self.__total
+    @property
+    def count(self): return self.__count
+
+
+class WebMetrics(object):
+    def __init__(self, *args, name, file=None, interval=60, buckets=BUCKETS, **kwargs):
+        self.__mutex = threading.Lock()
+        self.__name = name
+        self.__file = file
+        self.__interval = float(interval)
+        self.__buckets = buckets
+        self.__histograms = {}
+        self.__counters = {}
+        self.__exported = time.monotonic()
+
+    def __repr__(self): return "{}(name={}, file={})".format(self.__class__.__name__, repr(self.name), repr(self.file))
+
+    def observe(self, stage, seconds):
+        with self.mutex:
+            if stage not in self.histograms:
+                self.histograms[stage] = WebHistogram(buckets=self.buckets)
+            self.histograms[stage].observe(float(seconds))
+            due = self.file is not None and time.monotonic() - self.__exported >= self.interval
+            if due:
+                self.__exported = time.monotonic()
+        if due:
+            self.export(claimed=True)
+
+    def count(self, outcome, kind="outcome", value=1):
+        with self.mutex:
+            key = (str(kind), str(outcome))
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def iterate(self, stage, generator):
+        iterator = iter(generator)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.observe(stage, time.perf_counter() - start)
+                return
+            self.observe(stage, time.perf_counter() - start)
+            yield item
+
+    def todict(self):
+        with self.mutex:
+            histograms = {stage: histogram.todict() for stage, histogram in self.histograms.items()}
+            counters = {"{}|{}".format(kind, outcome): value for (kind, outcome), value in self.counters.items()}
+        return {"name": self.name, "timestamp": time.time(), "histograms": histograms, "counters": counters}
+
+    def prometheus(self):
+        lines, name = [], "greatschools"
+        with self.mutex:
+            lines.append("# TYPE {}_stage_seconds histogram".format(name))
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bucket, count in zip([str(bucket) for bucket in histogram.buckets] + ["+Inf"], histogram.counts):
+                    cumulative += count
+                    lines.append('{}_stage_seconds_bucket{{downloader="{}",stage="{}",le="{}"}} {:.0f}'.format(name, self.name, stage, bucket, cumulative))
+                lines.append('{}_stage_seconds_sum{{downloader="{}",stage="{}"}} {:.6f}'.format(name, self.name, stage, histogram.total))
+                lines.append('{}_stage_seconds_count{{downloader="{}",stage="{}"}} {:.0f}'.format(name, self.name, stage, histogram.count))
+            lines.append("# TYPE {}_outcomes_total counter".format(name))
+            for (kind, outcome), value in sorted(self.counters.items()):
+                lines.append('{}_outcomes_total{{downloader="{}",kind="{}",outcome="{}"}} {:.0f}'.format(name, self.name, kind, outcome, value))
+        return "\n".join(lines) + "\n"
+
+    def export(self, file=None, claimed=False):
+        file = file if file is not None else self.file
+        if file is None:
+            return
+        if not claimed:
+            with self.mutex:
+                self.__exported = time.monotonic()
+        os.makedirs(os.path.dirname(file) or ".", exist_ok=True)
+        if str(file).endswith(".prom"):
+            temporary = "{}.{:.0f}.{}.tmp".format(file, os.getpid(), uuid.uuid4().hex[:8])
+            with open(temporary, "w") as handle:
+                handle.write(self.prometheus())
+            os.replace(temporary, file)
+        else:
+            with open(file, "a") as handle:
+                handle.write(json.dumps(self.todict()) + "\n")
+
+    def report(self):
+        for stage, histogram in sorted(self.todict()["histograms"].items()):
+            LOGGER.info("Metrics[{}|{}]: count={:.0f}|sum={:.2f}s|p50<={}|p99<={}".format(self.name, stage, histogram["count"], histogram["sum"], histogram["p50"], histogram["p99"]))
+        for counter, value in sorted(self.todict()["counters"].items()):
+            LOGGER.info("Metrics[{}|{}]: {:.0f}".format(self.name, counter, value))
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def name(self): return self.__name
+    @property
+    def file(self): return self.__file
+    @property
+    def interval(self): return self.__interval
+    @property
+    def buckets(self): return self.__buckets
+    @property
+    def histograms(self): return self.__histograms
+    @property
+    def counters(self): return self.__counters
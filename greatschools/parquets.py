@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Parquet Repository Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import time
+import uuid
+import struct
+import logging
+import threading
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from greatschools.addresses import address_pattern
+from greatschools.polygons import compact_parser
+from greatschools.records import LongRecords, SECTIONS
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["ParquetRepository", "ParquetMixin", "address_filters", "wkb_parser", "geometry_parsers"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+ADDRESS = {"address": "string", "city": "category", "state": "category", "zipcode": "string"}
+LONG = {"GID": "integer", "section": "category", "metric": "category", "value": "real", "date": "date"}
+SCHEMAS = {
+    "links": {"GID": "integer", **ADDRESS, "link": "string"},
+    "schools": {"GID": "integer", **ADDRESS, "name": "string", "type": "category", "grades": "category", "date": "date"},
+    "scores": LONG,
+    "testing": LONG,
+    "demographics": LONG,
+    "teachers": LONG,
+    "boundary": {"GID": "integer", **ADDRESS, "link": "string"},
+    "shapes": {"GID": "integer", "DID": "integer", "district": "category", "latitude": "float", "longitude": "float", "name": "string", "grades": "category", "type": "category", **ADDRESS, "geometry": "binary", "encoding": "category"}}
+type_parsers = {
+    "integer": lambda series: pd.to_numeric(series, errors="coerce").astype("Int64"),
+    "float": lambda series: pd.to_numeric(series, errors="coerce").astype("float64"),
+    "real": lambda series: pd.to_numeric(series, errors="coerce").astype("float32"),
+    "date": lambda series: pd.to_datetime(series, format="%m/%d/%Y", errors="coerce").dt.date,
+    "category": lambda series: series.astype("string").astype("category"),
+    "string": lambda series: series.astype("string"),
+    "binary": lambda series: series.astype(object)}
+filter_iterator = lambda filters: [item for group in (filters or []) for item in (group if isinstance(group, list) else [group])]
+wkb_parser = lambda coordinates: struct.pack("<BII", 1, 3, 1) + struct.pack("<I", len(coordinates)) + b"".join([struct.pack("<dd", float(x), float(y)) for x, y in coordinates])
+geometry_parsers = {"wkb": lambda coordinates, tolerance: wkb_parser(coordinates), "compact": lambda coordinates, tolerance: bytes(compact_parser(coordinates, tolerance=tolerance))}
+
+
+class ParquetRepository(object):
+    def __init__(self, *args, directory, size=10**4, encoding="wkb", tolerance=None, **kwargs):
+        assert encoding in geometry_parsers.keys()
+        self.__mutex = threading.RLock()
+        self.__directory = directory
+        self.__size = size
+        self.__encoding = encoding
+        self.__tolerance = tolerance
+        self.__buffers = {}
+
+    def __repr__(self): return "{}(directory={})".format(self.__class__.__name__, repr(self.directory))
+    def __contains__(self, dataset): return bool(self.files(dataset))
+    def path(self, dataset): return os.path.join(self.directory, "{}.parquet".format(str(dataset)))
+    def files(self, dataset): return sorted([os.path.join(self.path(dataset), file) for file in os.listdir(self.path(dataset)) if file.endswith(".parquet")]) if os.path.isdir(self.path(dataset)) else []
+
+    def append(self, dataset, data):
+        dataframe = self.records(dataset, data, encoding=self.encoding, tolerance=self.tolerance)
+        if dataframe is None or dataframe.empty:
+            return
+        with self.mutex:
+            self.buffers.setdefault(dataset, []).append(dataframe)
+            if sum([len(buffer) for buffer in self.buffers[dataset]]) >= self.size:
+                self.flush(dataset)
+
+    def flush(self, dataset=None):
+        with self.mutex:
+            datasets = [dataset] if dataset is not None else list(self.buffers.keys())
+            for dataset in datasets:
+                buffers = self.buffers.pop(dataset, [])
+                if not buffers:
+                    continue
+                dataframe = self.types(dataset, pd.concat(buffers, axis=0, ignore_index=True))
+                table = pa.Table.from_pandas(dataframe, preserve_index=False)
+                os.makedirs(self.path(dataset), exist_ok=True)
+                file = os.path.join(self.path(dataset), "part-{:.0f}-{}.parquet".format(time.time() * 1000, uuid.uuid4().hex[:8]))
+                pq.write_table(table, file, row_group_size=self.size, compression="zstd")
+                LOGGER.info("Flushed: {}[{}|{:.0f}]".format(repr(self), str(dataset), len(dataframe)))
+
+    def read(self, dataset, *args, columns=None, filters=None, **kwargs):
+        required = set([item[0] for item in filter_iterator(filters)])
+        dataframes = []
+        for file in self.files(dataset):
+            schema = pq.read_schema(file)
+            if not required.issubset(set(schema.names)):
+                LOGGER.warning("Skipped: {}[{}|{}|missing={}]".format(repr(self), str(dataset), os.path.basename(file), ",".join(sorted(required - set(schema.names)))))
+                continue
+            projection = [column for column in columns if column in schema.names] if columns is not None else None
+            dataframes.append(pq.read_table(file, columns=projection, filters=filters).to_pandas())
+        if not dataframes:
+            return pd.DataFrame(columns=columns or [])
+        return pd.concat(dataframes, axis=0, ignore_index=True)
+
+    @staticmethod
+    def records(dataset, data, *args, encoding="wkb", tolerance=None, **kwargs):
+        if data is None:
+            return None
+        if dataset in SECTIONS:
+            records = LongRecords()
+            records.append(dataset, [data] if not isinstance(data, list) else data)
+            return records.dataframe()
+        if dataset == "shapes":
+            data = [data] if not isinstance(data, list) else data
+            data = [{**{key: value for key, value in dict(item.record).items() if key != "address"}, "address": str(dict(item.record).get("address", "")), "geometry": geometry_parsers[encoding](list(item.shape), tolerance), "encoding": encoding} for item in data]
+        dataframe = pd.DataFrame.from_records(data)
+        if "address" in dataframe.columns and "state" not in dataframe.columns:
+            splits = dataframe["address"].astype(str).str.strip().str.extract(address_pattern)
+            dataframe[["city", "state", "zipcode"]] = splits[["city", "state", "zipcode"]]
+            unsplit = dataframe["address"].notna() & splits["state"].isna()
+            if unsplit.any():
+                LOGGER.warning("Unsplit: {}[{:.0f}|{}]".format(str(dataset), int(unsplit.sum()), str(dataframe.loc[unsplit, "address"].iloc[0])))
+        return dataframe
+
+    @staticmethod
+    def types(dataset, dataframe):
+        schema = SCHEMAS.get(str(dataset), {})
+        for column, kind in schema.items():
+            if column not in dataframe.columns:
+                dataframe[column] = pd.Series([None] * len(dataframe), index=dataframe.index, dtype=object)
+            dataframe[column] = type_parsers[kind](dataframe[column])
+        for column in [column for column in dataframe.columns if column not in schema]:
+            dataframe[column] = type_parsers["string"](dataframe[column])
+        return dataframe[[*schema.keys(), *sorted([column for column in dataframe.columns if column not in schema])]]
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def directory(self): return self.__directory
+    @property
+    def size(self): return self.__size
+    @property
+    def buffers(self): return self.__buffers
+    @property
+    def encoding(self): return self.__encoding
+    @property
+    def tolerance(self): return self.__tolerance
+
+
+def address_filters(*args, state=None, citys=[], zipcodes=[], **kwargs):
+    filters = [("state", "=", str(state))] if state else []
+    if citys or zipcodes:
+        groups = [[*filters, ("city", "in", list(citys))]] if citys else []
+        groups = groups + ([[*filters, ("zipcode", "in", list(zipcodes))]] if zipcodes else [])
+        return groups
+    return filters if filters else None
+
+
+class ParquetMixin(object):
+    def __init__(self, *args, repository, encoding="wkb", tolerance=None, journal=None, journals=[], **kwargs):
+        super().__init__(*args, repository=repository, **kwargs)
+        self.__parquet = ParquetRepository(directory=repository, encoding=encoding, tolerance=tolerance)
+        self.__journals = [item for item in [journal, *journals] if item is not None]
+
+    def execute(self, *args, **kwargs):
+        try:
+            for query, dataset in super().execute(*args, **kwargs):
+                for name, data in dataset.todict().items():
+                    self.parquet.append(name, data)
+        finally:
+            self.parquet.flush()
+            for journal in self.journals:
+                journal.commit("parquet")
+        yield from ()
+
+    @property
+    def parquet(self): return self.__parquet
+    @property
+    def journals(self): return self.__journals
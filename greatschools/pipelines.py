@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Pipeline Download Application
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import os.path
+import time
+import warnings
+import logging
+import traceback
+import threading
+from queue import Queue, Empty, Full
+
+MAIN_DIR = os.path.dirname(os.path.realpath(__file__))
+MODULE_DIR = os.path.abspath(os.path.join(MAIN_DIR, os.pardir))
+ROOT_DIR = os.path.abspath(os.path.join(MODULE_DIR, os.pardir))
+RESOURCE_DIR = os.path.join(ROOT_DIR, "resources")
+SAVE_DIR = os.path.join(ROOT_DIR, "save")
+REPOSITORY_DIR = os.path.join(SAVE_DIR, "greatschools")
+REPORT_FILE = os.path.join(REPOSITORY_DIR, "pipeline.csv")
+NORDVPN_EXE = os.path.join("C:/", "Program Files", "NordVPN", "NordVPN.exe")
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+if MODULE_DIR not in sys.path:
+    sys.path.append(MODULE_DIR)
+
+from utilities.inputs import InputParser
+from webscraping.webvpn import Nord_WebVPN, WebVPNProcess
+from webscraping.weberrors import WebPageError
+from webscraping.webdownloaders import WebDownloader, CacheMixin
+from webscraping.webactions import StaleWebActionError, InteractionWebActionError
+from greatschools.delayers import penalty_parser
+from greatschools.indexes import GIDSet
+from greatschools.links import Greatschools_Links_WebURL, Greatschools_Links_WebPage, Greatschools_Links_WebQuery, Greatschools_Links_WebDataset
+from greatschools.links import Greatschools_Links_WebScheduler, Greatschools_Links_WebDelayer, Greatschools_Links_WebBrowser, Greatschools_Links_WebDownloader
+from greatschools.schools import Greatschools_Schools_WebURL, Greatschools_Schools_WebPage, Greatschools_Schools_WebQuery, Greatschools_Schools_WebDataset
+from greatschools.schools import Greatschools_Schools_WebDelayer, Greatschools_Schools_WebBrowser, Greatschools_Schools_WebDownloader
+from greatschools.schools import refresh_index as schools_refresh_index
+from greatschools.boundarys import Greatschools_Boundary_HTMLWebURL, Greatschools_Boundary_WebPage, Greatschools_Boundary_WebQuery, Greatschools_Boundary_WebDataset
+from greatschools.boundarys import Greatschools_Boundary_WebDelayer, Greatschools_Boundary_WebBrowser, Greatschools_Boundary_WebDownloader
+from greatschools.boundarys import refresh_index as boundary_refresh_index
+from greatschools.metrics import WebMetrics
+from greatschools.parquets import ParquetMixin
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["Greatschools_Pipeline_WebDownloader", "Greatschools_Pipeline_ParquetWebDownloader"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+warnings.filterwarnings("ignore")
+
+
+STAGES = ["links", "schools", "boundarys"]
+QUERYABLES = [Greatschools_Links_WebQuery, Greatschools_Schools_WebQuery, Greatschools_Boundary_WebQuery]
+
+
+class Greatschools_Pipeline_WebDownloader(CacheMixin, WebVPNProcess, WebDownloader, basis="GID"):
+    def execute(self, *args, browsers, scheduler, delayers, state, backend="zip", size=100, metrics=None, referer="https://www.google.com", **kwargs):
+        assert all([stage in browsers and stage in delayers for stage in STAGES])
+        metrics = metrics if metrics is not None else {stage: WebMetrics(name=stage) for stage in STAGES}
+        for stage, queryable in zip(STAGES, QUERYABLES):
+            delayers[stage].metrics = queryable.metrics = metrics[stage]
+            delayers[stage].vpn = self.vpn
+        yield from self.replay(backend)
+        with scheduler(*args, state=state, journal=Greatschools_Links_WebQuery.journal, backend=backend, **kwargs) as queue:
+            if not queue:
+                return
+            with queue:
+                schools, boundarys, results, stop = Queue(maxsize=size), Queue(maxsize=size), Queue(), threading.Event()
+                parameters = dict(results=results, stop=stop, state=state, referer=referer)
+                stages = {"links": dict(querys=iter(queue), destination=schools), "schools": dict(source=schools, destination=boundarys), "boundarys": dict(source=boundarys, destination=None)}
+                workers = [threading.Thread(target=self.stage, args=(getattr(self, stage), *args), kwargs={**kwargs, **parameters, **stages[stage], "browser": browsers[stage], "delayer": delayers[stage], "metrics": metrics[stage]}, name="GreatSchoolsStage[{}]".format(stage), daemon=True) for stage in STAGES]
+                for worker in workers:
+                    worker.start()
+                try:
+                    finished = 0
+                    while finished < len(workers):
+                        result = results.get()
+                        if result is None:
+                            finished += 1
+                        elif isinstance(result, BaseException):
+                            raise result
+                        else:
+                            result, written = result
+                            yield result
+                            written.set()
+                finally:
+                    stop.set()
+                    for worker in workers:
+                        worker.join()
+
+    @classmethod
+    def stage(cls, function, *args, browser, delayer, results, stop, destination, metrics, **kwargs):
+        try:
+            with browser() as driver:
+                for result in function(*args, driver=driver, delayer=delayer, stop=stop, destination=destination, metrics=metrics, **kwargs):
+                    written = threading.Event()
+                    results.put((result, written))
+                    while not written.wait(1) and not stop.is_set():
+                        continue
+        except BaseException as error:
+            results.put(error)
+        finally:
+            if destination is not None:
+                cls.put(destination, None, stop)
+            results.put(None)
+
+    def links(self, *args, driver, delayer, querys, destination, stop, metrics, referer, **kwargs):
+        page = Greatschools_Links_WebPage(driver, name="GreatSchoolsPage[links]", delayer=delayer)
+        seen = GIDSet()
+        for query in querys:
+            start = time.perf_counter()
+            if stop.is_set():
+                query.abandon()
+                return
+            if not self.ready(metrics):
+                query.abandon()
+                self.terminate()
+            if not bool(driver):
+                driver.reset()
+            url = Greatschools_Links_WebURL(**query.todict())
+            try:
+                with metrics.timer("load"):
+                    page.load(str(url), referer=referer)
+                with metrics.timer("setup"):
+                    page.setup(*args, **kwargs)
+                for fields, dataset, data in metrics.iterate("extract", page(*args, **kwargs)):
+                    if query.journal is not None:
+                        query.journal.result(fields, {dataset: data}, owner=query.todict())
+                    yield Greatschools_Links_WebQuery(fields, name="GreatSchoolsQuery"), Greatschools_Links_WebDataset({dataset: data}, name="GreatSchoolsDataset")
+                    self.forward(data, destination, stop, seen=seen, metrics=metrics)
+            except (WebPageError["refusal"], WebPageError["captcha"]) as error:
+                delayer.feedback(penalty_parser(error))
+                driver.trip()
+                self.vpn.trip()
+                query.abandon()
+            except WebPageError["badrequest"]:
+                delayer.feedback("badrequest")
+                query.success()
+            except (WebPageError["pagination"], StaleWebActionError, InteractionWebActionError):
+                delayer.feedback("failure")
+                query.failure()
+            except BaseException as error:
+                query.error()
+                raise error
+            else:
+                delayer.feedback("success")
+                query.success()
+            finally:
+                metrics.observe("query", time.perf_counter() - start)
+
+    def schools(self, *args, driver, delayer, source, destination, stop, metrics, referer, **kwargs):
+        page = Greatschools_Schools_WebPage(driver, name="GreatSchoolsPage[schools]", delayer=delayer)
+        seen = GIDSet()
+        for record in self.take(source, stop):
+            start = time.perf_counter()
+            query = Greatschools_Schools_WebQuery({"GID": str(record["GID"])}, name="GreatschoolsQuery")
+            if not self.ready(metrics):
+                query.record("abandon")
+                self.terminate()
+            if not bool(driver):
+                driver.reset()
+            url = Greatschools_Schools_WebURL.fromstr(str(record["link"]))
+            try:
+                with metrics.timer("load"):
+                    page.load(str(url), referer=referer)
+                with metrics.timer("setup"):
+                    page.setup(*args, **kwargs)
+                for fields, dataset, data in metrics.iterate("extract", page(*args, **kwargs)):
+                    if query.journal is not None:
+                        query.journal.result(fields, {dataset: data}, owner=query.todict())
+                    yield Greatschools_Schools_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Schools_WebDataset({dataset: data}, name="GreatschoolsDataset")
+                    if dataset == "boundary":
+                        self.forward(data, destination, stop, seen=seen, metrics=metrics)
+            except (WebPageError["refusal"], WebPageError["captcha"]) as error:
+                delayer.feedback(penalty_parser(error))
+                driver.trip()
+                self.vpn.trip()
+                query.record("abandon")
+            except WebPageError["badrequest"]:
+                delayer.feedback("badrequest")
+                query.record("success")
+                schools_refresh_index.success(record["GID"])
+            except (StaleWebActionError, InteractionWebActionError):
+                delayer.feedback("failure")
+                query.record("failure")
+                schools_refresh_index.failure(record["GID"])
+            except BaseException as error:
+                query.record("error", sync=True)
+                raise error
+            else:
+                delayer.feedback("success")
+                query.record("success")
+                schools_refresh_index.success(record["GID"])
+            finally:
+                metrics.observe("query", time.perf_counter() - start)
+
+    def boundarys(self, *args, driver, delayer, source, destination, stop, metrics, referer, **kwargs):
+        page = Greatschools_Boundary_WebPage(driver, name="GreatSchoolsPage[boundarys]", delayer=delayer)
+        for record in self.take(source, stop):
+            start = time.perf_counter()
+            query = Greatschools_Boundary_WebQuery({"GID": str(record["GID"])}, name="GreatschoolsQuery")
+            if not self.ready(metrics):
+                query.record("abandon")
+                self.terminate()
+            if not bool(driver):
+                driver.reset()
+            url = Greatschools_Boundary_HTMLWebURL.fromstr(str(record["link"]))
+            try:
+                page.capture()
+                with metrics.timer("load"):
+                    page.load(str(url), referer=referer)
+                with metrics.timer("setup"):
+                    page.setup(*args, **kwargs)
+                with metrics.timer("extract"):
+                    fields, dataset, data = page(*args, **kwargs)
+                if bool(data):
+                    if query.journal is not None:
+                        query.journal.result(fields, {dataset: data}, owner=query.todict())
+                    yield Greatschools_Boundary_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Boundary_WebDataset({dataset: data}, name="GreatschoolsDataset")
+            except (WebPageError["refusal"], WebPageError["captcha"]) as error:
+                delayer.feedback(penalty_parser(error))
+                driver.trip()
+                self.vpn.trip()
+                query.record("abandon")
+            except WebPageError["badrequest"]:
+                delayer.feedback("badrequest")
+                query.record("success")
+                boundary_refresh_index.success(record["GID"])
+            except (StaleWebActionError, InteractionWebActionError):
+                delayer.feedback("failure")
+                query.record("failure")
+                boundary_refresh_index.failure(record["GID"])
+            except BaseException as error:
+                query.record("error", sync=True)
+                raise error
+            else:
+                delayer.feedback("success")
+                query.record("success")
+                boundary_refresh_index.success(record["GID"])
+            finally:
+                metrics.observe("query", time.perf_counter() - start)
+
+    @staticmethod
+    def replay(backend):
+        yield from Greatschools_Links_WebDownloader.replay(Greatschools_Links_WebQuery.journal, backend)
+        yield from Greatschools_Schools_WebDownloader.replay(Greatschools_Schools_WebQuery.journal, backend)
+        yield from Greatschools_Boundary_WebDownloader.replay(Greatschools_Boundary_WebQuery.journal, backend)
+
+    def ready(self, metrics):
+        if bool(self.vpn.terminated):
+            return False
+        elif not bool(self.vpn.ready):
+            with metrics.timer("wait"):
+                return bool(self.wait())
+        return True
+
+    @classmethod
+    def forward(cls, records, destination, stop, *args, seen, metrics=None, **kwargs):
+        for record in [record for record in (records or []) if seen.add(record["GID"])]:
+            if not cls.put(destination, record, stop, metrics=metrics):
+                return False
+        return True
+
+    @staticmethod
+    def put(queue, item, stop, timeout=1, metrics=None):
+        start = time.perf_counter()
+        try:
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=timeout)
+                    return True
+                except Full:
+                    continue
+            return False
+        finally:
+            if metrics is not None:
+                metrics.observe("backpressure", time.perf_counter() - start)
+
+    @staticmethod
+    def take(queue, stop, timeout=1):
+        while not stop.is_set():
+            try:
+                item = queue.get(timeout=timeout)
+            except Empty:
+                continue
+            if item is None:
+                return
+            yield item
+
+
+class Greatschools_Pipeline_ParquetWebDownloader(ParquetMixin, Greatschools_Pipeline_WebDownloader, basis="GID"): pass
+
+
+def main(*args, backend="zip", encoding="wkb", tolerance=None, export="prom", **kwargs):
+    tolerance = float(tolerance) if tolerance not in (None, "") else None
+    journals = [queryable.journal for queryable in QUERYABLES]
+    options = dict(encoding=encoding, tolerance=tolerance, journals=journals) if backend == "parquet" else {}
+    delayers = {"links": Greatschools_Links_WebDelayer(name="GreatSchoolsDelayer[links]", method="random", wait=(10, 20)), "schools": Greatschools_Schools_WebDelayer(name="GreatSchoolsDelayer[schools]", method="random", wait=(30, 60)), "boundarys": Greatschools_Boundary_WebDelayer(name="GreatSchoolsDelayer[boundarys]", method="random", wait=(30, 60))}
+    browsers = {"links": Greatschools_Links_WebBrowser(name="GreatSchoolsBrowser[links]", browser="chrome", timeout=60), "schools": Greatschools_Schools_WebBrowser(name="GreatSchoolsBrowser[schools]", browser="chrome", timeout=60), "boundarys": Greatschools_Boundary_WebBrowser(name="GreatSchoolsBrowser[boundarys]", browser="chrome", timeout=60)}
+    scheduler = Greatschools_Links_WebScheduler(name="GreatSchoolsScheduler", randomize=True, size=5, file=REPORT_FILE)
+    Downloader = Greatschools_Pipeline_ParquetWebDownloader if backend == "parquet" else Greatschools_Pipeline_WebDownloader
+    downloader = Downloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2, **options)
+    metrics = {stage: WebMetrics(name=stage, file=os.path.join(REPOSITORY_DIR, "pipeline.{}.{}".format(stage, export))) for stage in STAGES}
+    vpn = Nord_WebVPN(name="NordVPN", file=NORDVPN_EXE, server="United States", timeout=60*2)
+    vpn += downloader
+    downloader(*args, browsers=browsers, scheduler=scheduler, delayers=delayers, backend=backend, metrics=metrics, **kwargs)
+    vpn.start()
+    downloader.start()
+    downloader.join()
+    vpn.stop()
+    vpn.join()
+    for journal in journals:
+        journal.checkpoint() if not bool(downloader.error) and not bool(vpn.error) else journal.stop()
+    for stage in STAGES:
+        metrics[stage].export()
+        metrics[stage].report()
+    for query, results in downloader.results.items():
+        LOGGER.info(str(query))
+        LOGGER.info(str(results))
+    if bool(vpn.error):
+        traceback.print_exception(*vpn.error)
+    if bool(downloader.error):
+        traceback.print_exception(*downloader.error)
+
+
+if __name__ == "__main__":
+    sys.argv += ["state=CA", "city=Bakersfield"]
+    logging.basicConfig(level="INFO", format="[%(levelname)s, %(threadName)s]:  %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    logging.getLogger("seleniumwire").setLevel(logging.ERROR)
+    inputparser = InputParser(proxys={"assign": "=", "space": "_"}, parsers={}, default=str)
+    inputparser(*sys.argv[1:])
+    main(*inputparser.arguments, **inputparser.parameters)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Polygon Simplification & Encoding
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import time
+import struct
+import logging
+import numpy as np
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["CompactRing", "selection", "simplify", "deviation", "compact_parser", "error_bound"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+PRECISION = 6
+HEADER = struct.Struct("<BIqq")
+quantize_error = lambda precision: np.sqrt(2) * 0.5 * 10 ** -int(precision)
+error_bound = lambda tolerance, precision: float(tolerance or 0) + quantize_error(precision)
+
+
+def distances(coordinates, start, stop):
+    segment = coordinates[stop] - coordinates[start]
+    offsets = coordinates - coordinates[start]
+    length = float(np.dot(segment, segment))
+    if length == 0:
+        return np.hypot(offsets[:, 0], offsets[:, 1])
+    ratios = np.clip(offsets @ segment / length, 0, 1)
+    projections = offsets - ratios[:, np.newaxis] * segment
+    return np.hypot(projections[:, 0], projections[:, 1])
+
+
+def selection(coordinates, tolerance):
+    coordinates = np.asarray(coordinates, dtype=np.float64)[:, :2]
+    closed = len(coordinates) > 1 and np.array_equal(coordinates[0], coordinates[-1])
+    if len(coordinates) <= 4 or not tolerance:
+        return np.arange(len(coordinates))
+    tolerance = float(tolerance)
+    last = len(coordinates) - 1
+    anchor = int(np.argmax(np.hypot(*(coordinates - coordinates[0]).T))) if closed else last
+    keep = np.zeros(len(coordinates), dtype=bool)
+    keep[[0, anchor, last]] = True
+    stack = [(0, anchor), (anchor, last)]
+    while stack:
+        start, stop = stack.pop()
+        if stop - start < 2:
+            continue
+        errors = distances(coordinates[start:stop + 1], 0, stop - start)[1:-1]
+        index = int(np.argmax(errors))
+        if errors[index] > tolerance:
+            index = start + 1 + index
+            keep[index] = True
+            stack.extend([(start, index), (index, stop)])
+    return np.flatnonzero(keep)
+
+
+def simplify(coordinates, tolerance):
+    coordinates = np.asarray(coordinates, dtype=np.float64)[:, :2]
+    return coordinates[selection(coordinates, tolerance)]
+
+
+def deviation(coordinates, simplified, indexes):
+    coordinates, simplified = np.asarray(coordinates, dtype=np.float64)[:, :2], np.asarray(simplified, dtype=np.float64)[:, :2]
+    assert len(simplified) == len(indexes)
+    error = float(np.hypot(*(coordinates[indexes] - simplified).T).max()) if len(indexes) else 0.0
+    for (start, stop), (first, second) in zip(zip(indexes[:-1], indexes[1:]), zip(simplified[:-1], simplified[1:])):
+        if stop - start < 2:
+            continue
+        error = max(error, float(distances(np.vstack([first, coordinates[start + 1:stop], second]), 0, stop - start)[1:-1].max()))
+    return error
+
+
+class CompactRing(object):
+    def __init__(self, origin, deltas, *args, precision=PRECISION, **kwargs):
+        self.__origin = np.asarray(origin, dtype=np.int64).reshape(2)
+        self.__deltas = np.asarray(deltas, dtype=np.int32).reshape(-1, 2)
+        self.__precision = int(precision)
+
+    def __repr__(self): return "{}(points={:.0f}, bytes={:.0f})".format(self.__class__.__name__, len(self), self.nbytes)
+    def __len__(self): return len(self.deltas) + 1
+    def __iter__(self): return iter([tuple(coordinate) for coordinate in self.decode().tolist()])
+    def __bytes__(self): return HEADER.pack(self.precision, len(self.deltas), *self.origin.tolist()) + self.deltas.astype("<i4").tobytes()
+
+    @classmethod
+    def encode(cls, coordinates, *args, precision=PRECISION, **kwargs):
+        coordinates = np.asarray(coordinates, dtype=np.float64)[:, :2]
+        quantized = np.rint(coordinates * 10 ** int(precision)).astype(np.int64)
+        deltas = np.diff(quantized, axis=0)
+        assert np.all(np.abs(deltas) < 2**31)
+        return cls(quantized[0], deltas, precision=precision)
+
+    @classmethod
+    def frombytes(cls, content):
+        precision, size, x, y = HEADER.unpack_from(content, 0)
+        deltas = np.frombuffer(content, dtype="<i4", count=size * 2, offset=HEADER.size).reshape(-1, 2)
+        return cls((x, y), deltas, precision=precision)
+
+    def decode(self):
+        quantized = np.vstack([self.origin[np.newaxis, :], self.origin + np.cumsum(self.deltas, axis=0, dtype=np.int64)])
+        return quantized / 10 ** self.precision
+
+    @property
+    def nbytes(self): return HEADER.size + self.deltas.nbytes
+    @property
+    def origin(self): return self.__origin
+    @property
+    def deltas(self): return self.__deltas
+    @property
+    def precision(self): return self.__precision
+
+
+def compact_parser(coordinates, *args, tolerance=None, precision=PRECISION, **kwargs):
+    coordinates = np.asarray(coordinates, dtype=np.float64)[:, :2]
+    indexes = selection(coordinates, tolerance)
+    return CompactRing.encode(coordinates[indexes], precision=precision)
+
+
+def benchmark(*args, shapes=100, vertices=20000, tolerance=1e-4, precision=PRECISION, **kwargs):
+    angles = np.linspace(0, 2 * np.pi, int(vertices), endpoint=False)
+    rings = []
+    for x, y in np.random.uniform(-120, -80, size=(int(shapes), 2)):
+        radius = 0.1 + 0.02 * np.cumsum(np.random.normal(0, 0.01, size=int(vertices)))
+        ring = np.stack([x + radius * np.cos(angles), y + radius * np.sin(angles)], axis=-1)
+        rings.append(np.vstack([ring, ring[:1]]))
+    start = time.perf_counter()
+    compacts = [compact_parser(ring, tolerance=tolerance, precision=precision) for ring in rings]
+    encoding = time.perf_counter() - start
+    contents = [bytes(compact) for compact in compacts]
+    start = time.perf_counter()
+    decoded = [CompactRing.frombytes(content).decode() for content in contents]
+    decoding = time.perf_counter() - start
+    original = sum([len(ring) * 16 for ring in rings])
+    compressed = sum([len(content) for content in contents])
+    error = max([deviation(ring, values, selection(ring, tolerance)) for ring, values in zip(rings, decoded)])
+    LOGGER.info("Polygons[{:.0f}|{:.0f}]: bytes={:.0f}->{:.0f}|points={:.0f}->{:.0f}|encode={:.2f}s|decode={:.3f}s|error={:.3g}".format(int(shapes), int(vertices), original, compressed, sum(map(len, rings)), sum(map(len, compacts)), encoding, decoding, error))
+    return {"original": original, "compressed": compressed, "encode": encoding, "decode": decoding, "error": error}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="[%(levelname)s, %(threadName)s]:  %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    benchmark()
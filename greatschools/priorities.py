@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Priority Ordering Objects
+@author: Jack Kirby Cook
+
+"""
+
+import time
+import math
+import heapq
+import random
+import logging
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebPriority", "weights_parser", "weight_parser"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DAY = 60 * 60 * 24
+SCORES = {"staleness": 1.0, "failures": -1.0, "weight": 1.0}
+weights_parser = lambda weights: {str(key).strip(): float(value) for key, value in (dict(weights).items() if isinstance(weights, dict) else [item.split(":") for item in str(weights).split(",") if item])}
+weight_parser = lambda weights, *keys: max([weights[str(key)] for key in keys if str(key) in weights], default=1.0)
+
+
+class WebPriority(object):
+    def __init__(self, *args, scores={}, band=1.0, period=30, horizon=365, seed=None, **kwargs):
+        assert float(band) > 0
+        self.__scores = {**SCORES, **weights_parser(scores)}
+        self.__band = float(band)
+        self.__period = float(period)
+        self.__horizon = float(horizon)
+        self.__random = random.Random(seed)
+
+    def __repr__(self): return "{}(scores={}, band={})".format(self.__class__.__name__, repr(self.scores), repr(self.band))
+
+    def __call__(self, GIDs, history, weights={}, *args, **kwargs):
+        now, heap = time.time(), []
+        for index, GID in enumerate(GIDs):
+            scraped, failures = history.get(GID, (None, 0))
+            score = self.score(now, scraped, failures, weights.get(GID, 1.0))
+            heap.append((-math.floor(score / self.band), self.__random.random(), index, GID))
+        heapq.heapify(heap)
+        ordered = [heapq.heappop(heap) for index in range(len(heap))]
+        bands = len(set([band for band, draw, index, GID in ordered]))
+        LOGGER.info("Priority: {}[{:.0f}|bands={:.0f}]".format(repr(self), len(ordered), bands))
+        return [GID for band, draw, index, GID in ordered]
+
+    def score(self, now, scraped, failures, weight):
+        age = min((now - float(scraped)) / DAY, self.horizon) if scraped is not None else self.horizon
+        staleness = age / self.period
+        return self.scores["staleness"] * staleness + self.scores["failures"] * float(failures or 0) + self.scores["weight"] * math.log2(max(float(weight), 1e-6))
+
+    @property
+    def scores(self): return self.__scores
+    @property
+    def band(self): return self.__band
+    @property
+    def period(self): return self.__period
+    @property
+    def horizon(self): return self.__horizon
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Browser Profile Objects
+@author: Jack Kirby Cook
+
+"""
+
+import time
+import logging
+import regex as re
+from urllib.parse import urlparse
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebProfile"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+BLOCKED_DESTINATIONS = ("image", "font", "video", "audio", "track", "object", "embed")
+BLOCKED_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".bmp", ".woff", ".woff2", ".ttf", ".otf", ".eot", ".mp4", ".webm", ".mp3", ".m4a", ".ogg")
+BLOCKED_HOSTS = ("doubleclick.net", "googlesyndication.com", "googleadservices.com", "google-analytics.com", "googletagmanager.com", "googletagservices.com", "adservice.google.com", "facebook.net", "facebook.com", "adnxs.com", "amazon-adsystem.com", "scorecardresearch.com", "hotjar.com", "optimizely.com", "quantserve.com", "moatads.com", "criteo.com", "criteo.net", "taboola.com", "outbrain.com", "pubmatic.com", "rubiconproject.com", "casalemedia.com", "newrelic.com", "nr-data.net", "segment.io", "segment.com", "chartbeat.com", "pinterest.com", "twitter.com")
+ALLOWED_PATTERNS = (r"gsr/api/schools",)
+timing_script = "var t = window.performance.timing; return t.loadEventEnd > 0 ? t.loadEventEnd - t.navigationStart : Date.now() - t.navigationStart;"
+
+
+class WebProfile(object):
+    def __init__(self, *args, name, blocked=BLOCKED_HOSTS, allowed=ALLOWED_PATTERNS, destinations=BLOCKED_DESTINATIONS, extensions=BLOCKED_EXTENSIONS, **kwargs):
+        self.__name = name
+        self.__blocked = tuple(blocked)
+        self.__allowed = re.compile("|".join(allowed)) if allowed else None
+        self.__destinations = tuple(destinations)
+        self.__extensions = tuple(extensions)
+        self.__starts = {}
+        self.__metrics = None
+
+    def __repr__(self): return "{}(name={})".format(self.__class__.__name__, repr(self.name))
+
+    def __call__(self, request):
+        if self.allowed is not None and self.allowed.search(request.url):
+            return
+        url = urlparse(request.url)
+        host, path = str(url.hostname or ""), str(url.path).lower()
+        if any([host == blocked or host.endswith("." + blocked) for blocked in self.blocked]):
+            request.abort()
+        elif request.headers.get("Sec-Fetch-Dest", None) in self.destinations:
+            request.abort()
+        elif path.endswith(self.extensions):
+            request.abort()
+
+    def attach(self, metrics):
+        self.__metrics = metrics
+        return self
+
+    def install(self, driver):
+        driver.request_interceptor = self
+        self.starts[id(driver)] = time.perf_counter()
+
+    def report(self, driver, query):
+        start = self.starts.pop(id(driver), None)
+        elapsed = time.perf_counter() - start if start is not None else None
+        try:
+            requests = [request for request in driver.requests if request.response is not None]
+            transferred = sum([int(request.response.headers.get("Content-Length", None) or len(request.response.body or b"")) for request in requests])
+            loading = float(driver.execute_script(timing_script)) / 1000
+            del driver.requests
+        except Exception:
+            return None
+        if self.metrics is not None:
+            self.metrics.observe("pageload", loading)
+            self.metrics.count("requests", kind="profile", value=len(requests))
+            self.metrics.count("bytes", kind="profile", value=transferred)
+        LOGGER.info("Profile[{}]: {}|requests={:.0f}|bytes={:.0f}|load={:.2f}s|elapsed={}".format(self.name, str(query), len(requests), transferred, loading, "{:.2f}s".format(elapsed) if elapsed is not None else None))
+        return {"requests": len(requests), "bytes": transferred, "load": loading, "elapsed": elapsed}
+
+    @property
+    def name(self): return self.__name
+    @property
+    def blocked(self): return self.__blocked
+    @property
+    def allowed(self): return self.__allowed
+    @property
+    def destinations(self): return self.__destinations
+    @property
+    def extensions(self): return self.__extensions
+    @property
+    def starts(self): return self.__starts
+    @property
+    def metrics(self): return self.__metrics
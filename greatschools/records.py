@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Long Format Records
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import os.path
+import time
+import logging
+import threading
+import numpy as np
+import pandas as pd
+
+MAIN_DIR = os.path.dirname(os.path.realpath(__file__))
+MODULE_DIR = os.path.abspath(os.path.join(MAIN_DIR, os.pardir))
+ROOT_DIR = os.path.abspath(os.path.join(MODULE_DIR, os.pardir))
+SAVE_DIR = os.path.join(ROOT_DIR, "save")
+REPOSITORY_DIR = os.path.join(SAVE_DIR, "greatschools")
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from files.dataframes import DataframeFile
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["MetricDictionary", "LongRecords", "SECTIONS", "ingest"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+SECTIONS = ("scores", "testing", "demographics", "teachers")
+KEYS = ("GID", "date")
+value_pattern = r"(-?\d+(?:\.\d+)?)"
+value_parser = lambda values: pd.to_numeric(pd.Series(values, dtype="string").str.replace(",", "", regex=False).str.extract(value_pattern, expand=False), errors="coerce").astype("float32")
+
+
+class MetricDictionary(object):
+    def __init__(self, *args, metrics=[], **kwargs):
+        self.__mutex = threading.RLock()
+        self.__codes = {}
+        self.__metrics = []
+        for metric in metrics:
+            self[metric]
+
+    def __repr__(self): return "{}(metrics={:.0f})".format(self.__class__.__name__, len(self))
+    def __len__(self): return len(self.metrics)
+    def __iter__(self): return iter(self.metrics)
+
+    def __getitem__(self, metric):
+        metric = sys.intern(" ".join(str(metric).split()))
+        code = self.codes.get(metric, None)
+        if code is None:
+            with self.mutex:
+                code = self.codes.setdefault(metric, len(self.metrics))
+                if code == len(self.metrics):
+                    self.metrics.append(metric)
+        return code
+
+    def categories(self): return pd.CategoricalDtype(categories=list(self.metrics), ordered=False)
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def codes(self): return self.__codes
+    @property
+    def metrics(self): return self.__metrics
+
+
+class LongRecords(object):
+    def __init__(self, *args, dictionary=None, **kwargs):
+        self.__mutex = threading.RLock()
+        self.__dictionary = dictionary if dictionary is not None else MetricDictionary()
+        self.__columns = {"GID": [], "section": [], "metric": [], "value": [], "date": []}
+
+    def __repr__(self): return "{}(records={:.0f}, metrics={:.0f})".format(self.__class__.__name__, len(self), len(self.dictionary))
+    def __len__(self): return len(self.columns["GID"])
+
+    def append(self, section, data):
+        if section not in SECTIONS or not data:
+            return
+        section = SECTIONS.index(section)
+        with self.mutex:
+            for record in data:
+                GID, date = int(record["GID"]), str(record.get("date", ""))
+                items = [(key, value) for key, value in record.items() if key not in KEYS]
+                self.columns["GID"].extend([GID] * len(items))
+                self.columns["section"].extend([section] * len(items))
+                self.columns["metric"].extend([self.dictionary[key] for key, value in items])
+                self.columns["value"].extend([value for key, value in items])
+                self.columns["date"].extend([date] * len(items))
+
+    def extend(self, section, dataframe):
+        if section not in SECTIONS or dataframe is None or dataframe.empty:
+            return
+        dataframe = dataframe.melt(id_vars=[key for key in KEYS if key in dataframe.columns], var_name="metric", value_name="value").dropna(subset=["value"])
+        section = SECTIONS.index(section)
+        with self.mutex:
+            self.columns["GID"].extend(dataframe["GID"].astype(np.int64).tolist())
+            self.columns["section"].extend([section] * len(dataframe))
+            self.columns["metric"].extend([self.dictionary[metric] for metric in dataframe["metric"].tolist()])
+            self.columns["value"].extend(dataframe["value"].tolist())
+            self.columns["date"].extend(dataframe["date"].astype(str).tolist() if "date" in dataframe.columns else [""] * len(dataframe))
+
+    def dataframe(self):
+        with self.mutex:
+            columns = {key: list(values) for key, values in self.columns.items()}
+        dataframe = pd.DataFrame({"GID": np.asarray(columns["GID"], dtype=np.uint32)})
+        dataframe["section"] = pd.Categorical.from_codes(np.asarray(columns["section"], dtype=np.int8), categories=list(SECTIONS))
+        dataframe["metric"] = pd.Categorical.from_codes(np.asarray(columns["metric"], dtype=np.int32), dtype=self.dictionary.categories())
+        dataframe["value"] = value_parser(columns["value"]).to_numpy()
+        dataframe["date"] = pd.to_datetime(pd.Series(columns["date"], dtype="string"), format="%m/%d/%Y", errors="coerce").to_numpy()
+        return dataframe
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def dictionary(self): return self.__dictionary
+    @property
+    def columns(self): return self.__columns
+
+
+def ingest(*args, directory=REPOSITORY_DIR, sections=SECTIONS, **kwargs):
+    records = LongRecords()
+    for section in sections:
+        file = os.path.join(directory, "{}.zip".format(section))
+        if not os.path.exists(file):
+            continue
+        with DataframeFile(file=file, mode="r", index=False, header=True, parsers={}, parser=str) as reader:
+            dataframe = reader()
+        records.extend(section, dataframe)
+    return records.dataframe()
+
+
+def benchmark(*args, schools=10**4, metrics=60, width=20, **kwargs):
+    labels = ["Metric {:.0f}".format(index) for index in range(int(metrics))]
+    datas = []
+    for GID in range(int(schools)):
+        chosen = np.random.choice(labels, size=int(width), replace=False)
+        datas.append({"GID": str(GID + 100000), **{label: "{:.0f}%".format(value) for label, value in zip(chosen, np.random.randint(0, 100, size=int(width)))}, "date": "10/18/2026"})
+    results = {}
+    for name, function in (("wide", lambda: pd.concat([pd.DataFrame([data]) for data in datas], axis=0, ignore_index=True)), ("long", lambda: long_function(datas))):
+        start = time.perf_counter()
+        dataframe = function()
+        elapsed = time.perf_counter() - start
+        memory = dataframe.memory_usage(deep=True).sum()
+        results[name] = {"elapsed": elapsed, "memory": int(memory), "shape": dataframe.shape}
+        LOGGER.info("Records[{}]: {:.2f}s|{:.1f}MB|{}".format(name, elapsed, memory / 2**20, str(dataframe.shape)))
+    return results
+
+
+def long_function(datas):
+    records = LongRecords()
+    for data in datas:
+        records.append("testing", [data])
+    return records.dataframe()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="[%(levelname)s, %(threadName)s]:  %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    benchmark()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Incremental Refresh Index
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import time
+import sqlite3
+import logging
+import threading
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["RefreshIndex"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DAY = 60 * 60 * 24
+create_statement = "CREATE TABLE IF NOT EXISTS refresh (dataset TEXT NOT NULL, GID INTEGER NOT NULL, attempted REAL, scraped REAL, failures INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (dataset, GID)) WITHOUT ROWID"
+migrate_statement = "ALTER TABLE refresh ADD COLUMN failures INTEGER NOT NULL DEFAULT 0"
+attempt_statement = "INSERT INTO refresh (dataset, GID, attempted) VALUES (?, ?, ?) ON CONFLICT (dataset, GID) DO UPDATE SET attempted = excluded.attempted"
+success_statement = "INSERT INTO refresh (dataset, GID, attempted, scraped) VALUES (?, ?, ?, ?) ON CONFLICT (dataset, GID) DO UPDATE SET scraped = excluded.scraped, failures = 0"
+failure_statement = "INSERT INTO refresh (dataset, GID, attempted, failures) VALUES (?, ?, ?, 1) ON CONFLICT (dataset, GID) DO UPDATE SET failures = failures + 1"
+history_statement = "SELECT GID, scraped, failures FROM refresh WHERE dataset = ?"
+fresh_statement = "SELECT GID FROM refresh WHERE dataset = ? AND scraped IS NOT NULL AND scraped >= ? AND (attempted IS NULL OR attempted <= scraped)"
+
+
+class RefreshIndex(object):
+    def __init__(self, *args, file, dataset, **kwargs):
+        self.__mutex = threading.RLock()
+        self.__connection = None
+        self.__file = file
+        self.__dataset = dataset
+
+    def __repr__(self): return "{}(file={}, dataset={})".format(self.__class__.__name__, repr(self.file), repr(self.dataset))
+
+    @property
+    def connection(self):
+        with self.mutex:
+            if self.__connection is None:
+                os.makedirs(os.path.dirname(self.file) or ".", exist_ok=True)
+                self.__connection = sqlite3.connect(self.file, timeout=60, check_same_thread=False, isolation_level=None)
+                self.__connection.execute("PRAGMA journal_mode=WAL")
+                self.__connection.execute("PRAGMA synchronous=NORMAL")
+                self.__connection.execute(create_statement)
+                if "failures" not in [column for (index, column, *values) in self.__connection.execute("PRAGMA table_info(refresh)")]:
+                    self.__connection.execute(migrate_statement)
+            return self.__connection
+
+    def stale(self, GIDs, *args, age, **kwargs):
+        cutoff = time.time() - float(age) * DAY
+        with self.mutex:
+            fresh = set([GID for (GID,) in self.connection.execute(fresh_statement, (self.dataset, cutoff))])
+        stale = [GID for GID in GIDs if int(GID) not in fresh]
+        LOGGER.info("Refresh: {}[{:.0f}|{:.0f}]".format(repr(self), len(stale), len(GIDs)))
+        return stale
+
+    def attempt(self, GIDs):
+        now = time.time()
+        with self.mutex:
+            with self.connection:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(attempt_statement, [(self.dataset, int(GID), now) for GID in GIDs])
+
+    def success(self, GID):
+        now = time.time()
+        with self.mutex:
+            self.connection.execute(success_statement, (self.dataset, int(GID), now, now))
+
+    def failure(self, GID):
+        now = time.time()
+        with self.mutex:
+            self.connection.execute(failure_statement, (self.dataset, int(GID), now))
+
+    def history(self, GIDs):
+        with self.mutex:
+            rows = {int(GID): (scraped, failures) for GID, scraped, failures in self.connection.execute(history_statement, (self.dataset,))}
+        return {GID: rows.get(int(GID), (None, 0)) for GID in GIDs}
+
+    def close(self):
+        with self.mutex:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def file(self): return self.__file
+    @property
+    def dataset(self): return self.__dataset
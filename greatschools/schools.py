@@ -11,8 +11,12 @@ import os.path
 import warnings
 import logging
 import traceback
+import threading
+import time
+import lxml.html
 import regex as re
 from abc import ABC
+from queue import Queue
 from datetime import date as Date
 
 MAIN_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -22,15 +26,22 @@ RESOURCE_DIR = os.path.join(ROOT_DIR, "resources")
 SAVE_DIR = os.path.join(ROOT_DIR, "save")
 REPOSITORY_DIR = os.path.join(SAVE_DIR, "greatschools")
 REPORT_FILE = os.path.join(REPOSITORY_DIR, "schools.csv")
+JOURNAL_FILE = os.path.join(REPOSITORY_DIR, "schools.journal")
+SNAPSHOT_DIR = os.path.join(REPOSITORY_DIR, "snapshots")
+LEASE_FILE = os.path.join(REPOSITORY_DIR, "leases.db")
 QUEUE_FILE = os.path.join(REPOSITORY_DIR, "links.zip")
+REFRESH_FILE = os.path.join(REPOSITORY_DIR, "refresh.db")
+CHANGE_FILE = os.path.join(REPOSITORY_DIR, "changes.db")
+QUEUE_DATASET = "links"
 DRIVER_EXE = os.path.join(RESOURCE_DIR, "chromedriver.exe")
 NORDVPN_EXE = os.path.join("C:/", "Program Files", "NordVPN", "NordVPN.exe")
 if ROOT_DIR not in sys.path:
     sys.path.append(ROOT_DIR)
+if MODULE_DIR not in sys.path:
+    sys.path.append(MODULE_DIR)
 
 from utilities.inputs import InputParser
 from files.dataframes import DataframeFile
-from webscraping.webtimers import WebDelayer
 from webscraping.webvpn import Nord_WebVPN, WebVPNProcess
 from webscraping.webdrivers import WebBrowser
 from webscraping.weburl import WebURL
@@ -44,16 +55,34 @@ from webscraping.webdownloaders import WebDownloader, CacheMixin
 from webscraping.webdata import WebClickable, WebText, WebLink, WebTexts, WebCaptcha
 from webscraping.webactions import WebScroll, WebMoveToClick, StaleWebActionError, InteractionWebActionError
 from webscraping.webvariables import Address, Price
+from greatschools.indexes import LinkIndex
+from greatschools.addresses import address_filter
+from greatschools.delayers import FeedbackWebDelayer, AdaptiveWebDelayer, penalty_parser
+from greatschools.profiles import WebProfile
+from greatschools.journals import WebJournal, JournalMixin
+from greatschools.snapshots import SnapshotStore, snapshot_loader, snapshot_replay
+from greatschools.sources import text_parser
+from greatschools.metrics import WebMetrics
+from greatschools.sessions import WebTabSession
+from greatschools.leases import LeaseStore, LeaseQueue
+from greatschools.refreshes import RefreshIndex
+from greatschools.priorities import WebPriority, weights_parser, weight_parser
+from greatschools.changes import ChangeIndex
+from greatschools.parquets import ParquetRepository, ParquetMixin, address_filters
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["Greatschools_Schools_WebDelayer", "Greatschools_Schools_WebBrowser", "Greatschools_Schools_WebDownloader", "Greatschools_Schools_WebScheduler"]
+__all__ = ["Greatschools_Schools_WebDelayer", "Greatschools_Schools_AdaptiveWebDelayer", "Greatschools_Schools_WebBrowser", "Greatschools_Schools_HeadlessWebBrowser", "Greatschools_Schools_WebDownloader", "Greatschools_Schools_PoolWebDownloader", "Greatschools_Schools_ParquetWebDownloader", "Greatschools_Schools_ParquetPoolWebDownloader", "Greatschools_Schools_WebScheduler"]
 __copyright__ = "Copyright 2021, Jack Kirby Cook"
 __license__ = ""
 
 
 LOGGER = logging.getLogger(__name__)
 warnings.filterwarnings("ignore")
+queue_index = LinkIndex(file=QUEUE_FILE)
+webjournal = WebJournal(file=JOURNAL_FILE)
+change_index = ChangeIndex(file=CHANGE_FILE)
+refresh_index = RefreshIndex(file=REFRESH_FILE, dataset="schools")
 
 
 QUERYS = ["GID"]
@@ -96,7 +125,9 @@ teacher_more_webloader = WebLoader(xpath=teacher_more_xpath)
 
 identity_pattern = "(?<=\/)\d+|(?<=schoolId=)\d+"
 identity_parser = lambda x: str(re.findall(identity_pattern, x)[0])
+flag_parser = lambda x: x if isinstance(x, bool) else str(x).strip().lower() in ("true", "yes", "on", "1")
 link_parser = lambda x: "".join(["https://www.greatschools.org", x]) if not str(x).startswith("https://www.greatschools.org") else x
+host_parser = lambda url, host: str(url).replace("https://www.greatschools.org", str(host).rstrip("/"), 1) if host else str(url)
 address_parser = lambda x: str(Address.fromsearch(x))
 price_parser = lambda x: str(Price.fromsearch(x))
 type_pattern = "[A-Za-z]+(?= school)"
@@ -105,6 +136,8 @@ grade_pattern = "(?<=Grades |Grade )[0-9A-Z-]+"
 grade_parser = lambda x: str(re.findall(grade_pattern, x)[0]).replace("-", "|")
 boundary_keyparser = identity_parser
 boundary_linkparser = link_parser
+scroll_sections = ("Test_scores", "Students", "Teachers_staff")
+scroll_script = "window.scrollBy(0, window.innerHeight); return [arguments[0].every(function(x) { return document.getElementById(x) !== null; }), document.body.scrollHeight, window.pageYOffset + window.innerHeight];"
 
 
 class Greatschools_Captcha(WebCaptcha, loader=captcha_webloader, optional=True): pass
@@ -135,37 +168,53 @@ class Greatschools_Schools_WebURL(WebURL, protocol="https", domain="www.greatsch
         return [address.state, address.city, "{GID}_{name}".format(GID=str(GID), name="-".join(str(name).split(" ")))]
 
 
-class Greatschools_Schools_WebDelayer(WebDelayer): pass
+class Greatschools_Schools_WebDelayer(FeedbackWebDelayer): pass
+class Greatschools_Schools_AdaptiveWebDelayer(AdaptiveWebDelayer): pass
 class Greatschools_Schools_WebBrowser(WebBrowser, files={"chrome": DRIVER_EXE}, options={"headless": False, "images": True, "incognito": False}): pass
+class Greatschools_Schools_HeadlessWebBrowser(WebBrowser, files={"chrome": DRIVER_EXE}, options={"headless": True, "images": False, "incognito": False}): pass
 class Greatschools_Schools_WebQueue(WebQueue): pass
-class Greatschools_Schools_WebQuery(WebQuery, WebQueueable, fields=QUERYS): pass
+class Greatschools_Schools_WebQuery(JournalMixin, WebQuery, WebQueueable, fields=QUERYS):
+    journal = webjournal
+    changes = change_index
+
+
 class Greatschools_Schools_WebDataset(WebDataset, ABC, fields=DATASETS): pass
 
 
 class Greatschools_Schools_WebScheduler(WebScheduler, fields=QUERYS):
     @staticmethod
-    def GID(*args, state, city=None, citys=[], zipcode=None, zipcodes=[], **kwargs):
-        if not os.path.exists(QUEUE_FILE):
+    def GID(*args, state, city=None, citys=[], zipcode=None, zipcodes=[], backend="zip", journal=None, queue_index=queue_index, refresh_index=refresh_index, refresh=None, priority=False, weights={}, scores={}, band=1.0, **kwargs):
+        if backend != "parquet" and not os.path.exists(QUEUE_FILE):
             return []
         assert all([isinstance(item, (str, type(None))) for item in (zipcode, city)])
         assert all([isinstance(item, list) for item in (zipcodes, citys)])
         zipcodes = list(set([item for item in [zipcode, *zipcodes] if item]))
         citys = list(set([item for item in [city, *citys] if item]))
-        parsers = {"address": Address.fromstr}
-        with DataframeFile(file=QUEUE_FILE, mode="r", parsers=parsers, parser=str) as reader:
-            dataframe = reader(header=["zipcode", "type", "city", "state", "county"])
-        dataframe["city"] = dataframe["address"].apply(lambda x: x.city if x else None)
-        dataframe["state"] = dataframe["address"].apply(lambda x: x.state if x else None)
-        dataframe["zipcode"] = dataframe["address"].apply(lambda x: x.zipcode if x else None)
-        if citys or zipcodes:
-            dataframe = dataframe[(dataframe["city"].isin(list(citys)) | dataframe["zipcode"].isin(list(zipcodes)))]
-        if state:
-            dataframe = dataframe[dataframe["state"] == state]
+        if backend == "parquet":
+            filters = address_filters(state=state, citys=citys, zipcodes=zipcodes)
+            dataframe = ParquetRepository(directory=REPOSITORY_DIR).read(QUEUE_DATASET, columns=["GID", "address", "link", "city", "state", "zipcode"], filters=filters)
+            dataframe[["GID", "address", "link"]] = dataframe[["GID", "address", "link"]].astype(str)
+        else:
+            with DataframeFile(file=QUEUE_FILE, mode="r", parsers={}, parser=str) as reader:
+                dataframe = reader(header=["zipcode", "type", "city", "state", "county"])
+        dataframe = address_filter(dataframe, state=state, citys=citys, zipcodes=zipcodes)
         dataframe = dataframe.drop_duplicates(subset="GID", keep="last", ignore_index=True)
-        return list(dataframe["GID"].to_numpy())
+        completed = journal.completed("GID") if journal is not None else set()
+        GIDs = [GID for GID in dataframe["GID"].to_numpy() if str(GID) not in completed]
+        GIDs = refresh_index.stale(GIDs, age=refresh) if refresh is not None else GIDs
+        if flag_parser(priority):
+            weights = weights_parser(weights)
+            values = {GID: weight_parser(weights, zipcode, city) for GID, zipcode, city in zip(dataframe["GID"].to_numpy(), dataframe["zipcode"].to_numpy(), dataframe["city"].to_numpy())}
+            GIDs = WebPriority(scores=scores, band=band)(GIDs, refresh_index.history(GIDs), values)
+        if refresh is not None:
+            refresh_index.attempt(GIDs)
+        queue_index.refresh()
+        return GIDs
 
     @staticmethod
-    def execute(querys, *args, **kwargs):
+    def execute(querys, *args, crawl=None, leases=LEASE_FILE, **kwargs):
+        if crawl is not None:
+            return LeaseQueue(querys, *args, store=LeaseStore(file=leases, dataset="schools"), crawl=crawl, queryable=Greatschools_Schools_WebQuery, queue=Greatschools_Schools_WebQueue, name="GreatSchoolsQueue", report=REPORT_FILE, **kwargs)
         queueables = [Greatschools_Schools_WebQuery(query, name="GreatSchoolsQuery") for query in querys]
         queue = Greatschools_Schools_WebQueue(queueables, *args, name="GreatSchoolsQueue", **kwargs)
         return queue
@@ -218,12 +267,34 @@ class Greatschools_Schools_WebPage(WebBrowserPage, mixins=page_mixins, contents=
     def date(): return {"date": Date.today().strftime("%m/%d/%Y")}
     def query(self): return {"GID": str(identity_parser(self.url))}
 
-    def setup(self, *args, **kwargs):
-        self[Greatschools_WebActions.SCROLL](*args, commands={"pagedown": 20}, **kwargs)
+    def setup(self, *args, scrolling="fixed", **kwargs):
+        start = time.perf_counter()
+        if scrolling == "adaptive":
+            self.scroll(*args, **kwargs)
+        else:
+            self[Greatschools_WebActions.SCROLL](*args, commands={"pagedown": 20}, **kwargs)
         if bool(self[Greatschools_WebActions.OPEN]):
             self[Greatschools_WebActions.OPEN](*args, **kwargs)
-
-    def execute(self, *args, **kwargs):
+        LOGGER.info("Setup[{}]: {}[{:.2f}s]".format(str(scrolling), str(self.query()["GID"]), time.perf_counter() - start))
+
+    def scroll(self, *args, sections=scroll_sections, interval=0.5, timeout=30, **kwargs):
+        start, height = time.perf_counter(), None
+        while time.perf_counter() - start < timeout:
+            present, current, position = self.driver.execute_script(scroll_script, list(sections))
+            if bool(present):
+                return True
+            if current == height and position >= current:
+                return False
+            height = current
+            time.sleep(interval)
+        return False
+
+    def execute(self, *args, extraction="loader", snapshots=None, **kwargs):
+        if snapshots is not None:
+            snapshots.save("schools", str(self.url), self.driver.page_source)
+        if extraction == "source":
+            yield from Greatschools_Schools_WebSource(self.driver.page_source, url=self.url)(*args, **kwargs)
+            return
         query = self.query()
         yield query, "schools", self.schools()
         yield query, "scores", self.scores()
@@ -272,68 +343,269 @@ class Greatschools_Schools_WebPage(WebBrowserPage, mixins=page_mixins, contents=
     def boundary(self): return [{"GID": self[Greatschools_WebData.BOUNDARY].key(), "address": self[Greatschools_WebData.ADDRESS].data(), "link": self[Greatschools_WebData.BOUNDARY].link()}]
 
 
+class Greatschools_Schools_WebSource(object):
+    def __init__(self, source, *args, url, date=None, **kwargs):
+        self.__tree = lxml.html.fromstring(source)
+        self.__elements = {}
+        self.__url = url
+        self.__date = date
+
+    def __call__(self, *args, **kwargs):
+        query = self.query()
+        yield query, "schools", self.schools()
+        yield query, "scores", self.scores()
+        yield query, "testing", self.testing()
+        yield query, "demographics", self.demographics()
+        yield query, "teachers", self.teachers()
+        yield query, "boundary", self.boundary()
+
+    def elements(self, xpath):
+        if xpath not in self.__elements:
+            self.__elements[xpath] = self.tree.xpath(xpath)
+        return self.__elements[xpath]
+
+    def texts(self, xpath, parser=str.strip): return [parser(text_parser(element)) for element in self.elements(xpath)]
+    def text(self, xpath, parser=str.strip): return next(iter(self.texts(xpath, parser)), None)
+    def href(self, xpath): return next(iter([element.get("href") for element in self.elements(xpath) if element.get("href")]), None)
+    def items(self, keys, values): return {key: value for key, value in zip(self.texts(keys), self.texts(values))}
+
+    def date(self): return {"date": self.__date if self.__date is not None else Date.today().strftime("%m/%d/%Y")}
+    def query(self): return {"GID": str(identity_parser(self.url))}
+
+    def schools(self):
+        schools = {"address": self.text(address_xpath, address_parser), "name": self.text(name_xpath, str.strip), "type": self.text(details_xpath, type_parser), "grades": self.text(details_xpath, grade_parser)}
+        schools = {key: str(value) for key, value in schools.items() if value is not None}
+        return [{**self.query(), **schools, **self.date()}] if bool(schools) else None
+
+    def scores(self):
+        scores = self.items(score_keys_xpath, score_values_xpath)
+        return [{**self.query(), **scores, **self.date()}] if bool(self.elements(score_keys_xpath)) else None
+
+    def testing(self):
+        testing = self.items(test_keys_xpath, test_values_xpath)
+        return [{**self.query(), **testing, **self.date()}] if bool(self.elements(test_keys_xpath)) else None
+
+    def demographics(self):
+        demographics = self.items(demographic_keys_xpath, demographic_values_xpath)
+        return [{**self.query(), **demographics, **self.date()}] if bool(self.elements(demographic_keys_xpath)) else None
+
+    def teachers(self):
+        teachers = self.items(teacher_keys_xpath, teacher_values_xpath)
+        return [{**self.query(), **teachers, **self.date()}] if bool(self.elements(teacher_keys_xpath)) else None
+
+    def boundary(self):
+        link = self.href(boundary_xpath)
+        if link is None:
+            return None
+        return [{"GID": boundary_keyparser(link), "address": self.text(address_xpath, address_parser), "link": boundary_linkparser(link)}]
+
+    @property
+    def tree(self): return self.__tree
+    @property
+    def url(self): return self.__url
+
+
 class Greatschools_Schools_WebDownloader(CacheMixin, WebVPNProcess, WebDownloader):
-    def execute(self, *args, browser, scheduler, delayer, referer="https://www.google.com", **kwargs):
-        with scheduler(*args, **kwargs) as queue:
+    def execute(self, *args, browser, scheduler, delayer, journal=webjournal, queue_index=queue_index, change_index=change_index, refresh_index=refresh_index, host=None, backend="zip", profile=None, metrics=None, referer="https://www.google.com", **kwargs):
+        metrics = metrics if metrics is not None else WebMetrics(name="schools")
+        profile = profile.attach(metrics) if profile is not None else None
+        delayer.metrics = Greatschools_Schools_WebQuery.metrics = metrics
+        delayer.vpn = self.vpn
+        Greatschools_Schools_WebQuery.journal = journal
+        Greatschools_Schools_WebQuery.changes = change_index
+        yield from self.replay(journal, backend)
+        indexes = dict(queue_index=queue_index, change_index=change_index, refresh_index=refresh_index)
+        with scheduler(*args, journal=journal, queue_index=queue_index, refresh_index=refresh_index, backend=backend, **kwargs) as queue:
             if not queue:
                 return
             with browser() as driver:
                 page = Greatschools_Schools_WebPage(driver, name="GreatSchoolsPage", delayer=delayer)
                 with queue:
                     for query in queue:
-                        if bool(self.vpn.terminated):
-                            query.abandon()
-                            self.terminate()
-                        elif not bool(self.vpn.ready):
-                            ready = self.wait()
-                            if not ready:
-                                query.abandon()
-                                self.terminate()
-                        if not bool(driver):
-                            driver.reset()
-                        url = self.url(**query.todict())
-                        url = Greatschools_Schools_WebURL.fromstr(str(url))
-                        try:
-                            page.load(str(url), referer=referer)
-                            page.setup(*args, **kwargs)
-                            for fields, dataset, data in page(*args, **kwargs):
-                                yield Greatschools_Schools_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Schools_WebDataset({dataset: data}, name="GreatschoolsDataset")
-                        except (WebPageError["refusal"], WebPageError["captcha"]):
-                            driver.trip()
-                            self.vpn.trip()
-                            query.abandon()
-                        except WebPageError["badrequest"]:
-                            query.success()
-                        except (StaleWebActionError, InteractionWebActionError):
-                            query.failure()
-                        except BaseException as error:
-                            query.error()
-                            raise error
-                        else:
-                            query.success()
+                        yield from self.download(query, *args, driver=driver, page=page, delayer=delayer, journal=journal, profile=profile, referer=referer, metrics=metrics, host=host, **indexes, **kwargs)
+
+    def download(self, query, *args, driver, page, delayer, journal, queue_index, change_index, refresh_index, profile, referer, metrics, host=None, changes=False, **kwargs):
+        start = time.perf_counter()
+        if bool(self.vpn.terminated):
+            query.abandon()
+            self.terminate()
+        elif not bool(self.vpn.ready):
+            with metrics.timer("wait"):
+                ready = self.wait()
+            if not ready:
+                query.abandon()
+                self.terminate()
+        if not bool(driver):
+            driver.reset()
+        if profile is not None:
+            profile.install(driver)
+        url = self.url(queue_index, **query.todict())
+        url = Greatschools_Schools_WebURL.fromstr(str(url))
+        try:
+            with metrics.timer("load"):
+                page.load(host_parser(url, host), referer=referer)
+            with metrics.timer("setup"):
+                page.setup(*args, **kwargs)
+            for fields, dataset, data in metrics.iterate("extract", page(*args, **kwargs)):
+                if flag_parser(changes) and not change_index(dataset, query.todict()["GID"], data):
+                    continue
+                if journal is not None:
+                    journal.result(fields, {dataset: data}, owner=query.todict())
+                with metrics.timer("write"):
+                    yield Greatschools_Schools_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Schools_WebDataset({dataset: data}, name="GreatschoolsDataset")
+        except (WebPageError["refusal"], WebPageError["captcha"]) as error:
+            delayer.feedback(penalty_parser(error))
+            driver.trip()
+            self.vpn.trip()
+            query.abandon()
+        except WebPageError["badrequest"]:
+            delayer.feedback("badrequest")
+            query.success()
+            refresh_index.success(query.todict()["GID"])
+        except (StaleWebActionError, InteractionWebActionError):
+            delayer.feedback("failure")
+            query.failure()
+            refresh_index.failure(query.todict()["GID"])
+        except BaseException as error:
+            query.error()
+            raise error
+        else:
+            delayer.feedback("success")
+            query.success()
+            refresh_index.success(query.todict()["GID"])
+        finally:
+            metrics.observe("query", time.perf_counter() - start)
+            if profile is not None:
+                profile.report(driver, query)
 
     @staticmethod
-    def url(*args, GID, **kwargs):
-        with DataframeFile(file=QUEUE_FILE, mode="r", index=False, header=True, parsers={}, parser=str) as reader:
-            record = reader()
-            urls = record(index="GID", header="link").squeeze()
-        url = urls.get(GID)
-        return url
-
-
-def main(*args, **kwargs):
-    delayer = Greatschools_Schools_WebDelayer(name="GreatSchoolsDelayer", method="random", wait=(30, 60))
-    browser = Greatschools_Schools_WebBrowser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
-    scheduler = Greatschools_Schools_WebScheduler(name="GreatSchoolsScheduler", randomize=True, size=10, file=REPORT_FILE)
-    downloader = Greatschools_Schools_WebDownloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2)
+    def replay(journal, backend):
+        for fields, contents in (journal.pending(backend) if journal is not None else []):
+            yield Greatschools_Schools_WebQuery(fields, name="GreatschoolsQuery"), Greatschools_Schools_WebDataset(contents, name="GreatschoolsDataset")
+
+    @staticmethod
+    def url(index, *args, GID, **kwargs): return index.get(GID)
+
+
+class Greatschools_Schools_ParquetWebDownloader(ParquetMixin, Greatschools_Schools_WebDownloader): pass
+class Greatschools_Schools_PoolWebDownloader(Greatschools_Schools_WebDownloader):
+    def execute(self, *args, browsers, scheduler, delayers, journal=webjournal, queue_index=queue_index, change_index=change_index, refresh_index=refresh_index, host=None, backend="zip", profile=None, metrics=None, referer="https://www.google.com", **kwargs):
+        metrics = metrics if metrics is not None else WebMetrics(name="schools")
+        profile = profile.attach(metrics) if profile is not None else None
+        Greatschools_Schools_WebQuery.metrics = metrics
+        Greatschools_Schools_WebQuery.journal = journal
+        Greatschools_Schools_WebQuery.changes = change_index
+        yield from self.replay(journal, backend)
+        assert len(browsers) == len(delayers)
+        with scheduler(*args, journal=journal, queue_index=queue_index, refresh_index=refresh_index, backend=backend, **kwargs) as queue:
+            if not queue:
+                return
+            with queue:
+                querys, results, mutex, stop = iter(queue), Queue(), threading.Lock(), threading.Event()
+                parameters = dict(querys=querys, results=results, mutex=mutex, stop=stop, journal=journal, queue_index=queue_index, change_index=change_index, refresh_index=refresh_index, host=host, profile=profile, metrics=metrics, referer=referer)
+                workers = [threading.Thread(target=self.worker, args=args, kwargs={**kwargs, **parameters, "browser": browser, "delayer": delayer}, name="GreatSchoolsWorker[{}]".format(index), daemon=True) for index, (browser, delayer) in enumerate(zip(browsers, delayers))]
+                for worker in workers:
+                    worker.start()
+                try:
+                    finished = 0
+                    while finished < len(workers):
+                        result = results.get()
+                        if result is None:
+                            finished += 1
+                        elif isinstance(result, BaseException):
+                            raise result
+                        else:
+                            result, written = result
+                            yield result
+                            written.set()
+                finally:
+                    stop.set()
+                    for worker in workers:
+                        worker.join()
+
+    def worker(self, *args, querys, results, mutex, stop, browser, delayer, journal, profile, metrics, referer, **kwargs):
+        delayer.metrics = metrics
+        delayer.vpn = self.vpn
+        try:
+            with browser() as driver:
+                page = Greatschools_Schools_WebPage(driver, name="GreatSchoolsPage", delayer=delayer)
+                while not stop.is_set():
+                    with mutex:
+                        query = next(querys, None)
+                    if query is None:
+                        break
+                    for result in self.download(query, *args, driver=driver, page=page, delayer=delayer, journal=journal, profile=profile, metrics=metrics, referer=referer, **kwargs):
+                        written = threading.Event()
+                        results.put((result, written))
+                        while not written.wait(1) and not stop.is_set():
+                            continue
+        except BaseException as error:
+            results.put(error)
+        finally:
+            results.put(None)
+
+
+class Greatschools_Schools_ParquetPoolWebDownloader(ParquetMixin, Greatschools_Schools_PoolWebDownloader): pass
+
+
+def snapshot_parser(file):
+    try:
+        url, date, content = snapshot_loader(file)
+        return list(Greatschools_Schools_WebSource(content, url=url, date=date)())
+    except Exception as error:
+        LOGGER.warning("Snapshot[{}]: {}".format(str(file), repr(error)))
+        return []
+
+
+def rebuild(*args, processes=None, date=None, **kwargs):
+    repository = ParquetRepository(directory=REPOSITORY_DIR)
+    for fields, dataset, data in snapshot_replay(SnapshotStore(directory=SNAPSHOT_DIR), "schools", snapshot_parser, processes=processes, date=date):
+        repository.append(dataset, data)
+    repository.flush()
+
+
+def main(*args, pool=1, delay="random", mode="default", backend="zip", snapshot=False, export="prom", tabs=1, memory=None, clear=True, priority=False, resume=True, lookup=False, **kwargs):
+    priority = flag_parser(priority)
+    if mode == "replay":
+        assert backend == "parquet"
+        rebuild(*args, **kwargs)
+        return
+    Browser = Greatschools_Schools_HeadlessWebBrowser if mode == "production" else Greatschools_Schools_WebBrowser
+    profile = WebProfile(name="GreatSchoolsProfile") if mode == "production" else None
+    scheduler = Greatschools_Schools_WebScheduler(name="GreatSchoolsScheduler", randomize=not priority, size=10, file=REPORT_FILE)
+    journal = webjournal if flag_parser(resume) else None
+    options = dict(journal=journal) if backend == "parquet" else {}
+    Delayer = Greatschools_Schools_AdaptiveWebDelayer if delay == "adaptive" else Greatschools_Schools_WebDelayer
+    adaptive = dict(lookup=flag_parser(lookup)) if delay == "adaptive" else {}
+    if int(pool) > 1:
+        delayers = [Delayer(name="GreatSchoolsDelayer[{}]".format(index), method="random", wait=(30, 60), **adaptive) for index in range(int(pool))]
+        browsers = [Browser(name="GreatSchoolsBrowser[{}]".format(index), browser="chrome", timeout=60) for index in range(int(pool))]
+        browsers = [WebTabSession(browser=browser, tabs=tabs, memory=memory, clear=flag_parser(clear)) for browser in browsers] if int(tabs) > 1 else browsers
+        Downloader = Greatschools_Schools_ParquetPoolWebDownloader if backend == "parquet" else Greatschools_Schools_PoolWebDownloader
+        downloader = Downloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2, **options)
+        connections = dict(browsers=browsers, delayers=delayers)
+    else:
+        delayer = Delayer(name="GreatSchoolsDelayer", method="random", wait=(30, 60), **adaptive)
+        browser = Browser(name="GreatSchoolsBrowser", browser="chrome", timeout=60)
+        browser = WebTabSession(browser=browser, tabs=tabs, memory=memory, clear=flag_parser(clear)) if int(tabs) > 1 else browser
+        Downloader = Greatschools_Schools_ParquetWebDownloader if backend == "parquet" else Greatschools_Schools_WebDownloader
+        downloader = Downloader(name="GreatSchools", repository=REPOSITORY_DIR, timeout=60*2, **options)
+        connections = dict(browser=browser, delayer=delayer)
     vpn = Nord_WebVPN(name="NordVPN", file=NORDVPN_EXE, server="United States", timeout=60*2)
     vpn += downloader
-    downloader(*args, browser=browser, scheduler=scheduler, delayer=delayer, **kwargs)
+    snapshots = SnapshotStore(directory=SNAPSHOT_DIR) if flag_parser(snapshot) else None
+    metrics = WebMetrics(name="schools", file=os.path.join(REPOSITORY_DIR, "schools.{}".format(export)))
+    downloader(*args, scheduler=scheduler, priority=priority, profile=profile, journal=journal, backend=backend, snapshots=snapshots, metrics=metrics, **connections, **kwargs)
     vpn.start()
     downloader.start()
     downloader.join()
     vpn.stop()
     vpn.join()
+    if journal is not None:
+        journal.checkpoint() if not bool(downloader.error) and not bool(vpn.error) else journal.stop()
+    change_index.close()
+    metrics.export()
+    metrics.report()
     for query, results in downloader.results.items():
         LOGGER.info(str(query))
         LOGGER.info(str(results))
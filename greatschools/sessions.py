@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Browser Tab Session Objects
+@author: Jack Kirby Cook
+
+"""
+
+import logging
+import threading
+from selenium.common.exceptions import WebDriverException, InvalidSessionIdException, NoSuchWindowException
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebTabSession", "WebTabDriver"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+FATAL_MESSAGES = ("chrome not reachable", "disconnected", "session deleted", "target crashed", "tab crashed", "connection refused", "max retries exceeded")
+memory_script = "return window.performance && window.performance.memory ? window.performance.memory.usedJSHeapSize : 0;"
+fatal_parser = lambda error: isinstance(error, InvalidSessionIdException) or (isinstance(error, WebDriverException) and not isinstance(error, NoSuchWindowException) and any([message in str(error.msg or "").lower() for message in FATAL_MESSAGES]))
+
+
+class WebTab(object):
+    def __init__(self, handle, *args, **kwargs):
+        self.__handle = handle
+        self.__tripped = False
+        self.__loads = 0
+
+    def __repr__(self): return "{}(handle={}, loads={:.0f}, tripped={})".format(self.__class__.__name__, repr(self.handle), self.loads, self.tripped)
+    def __bool__(self): return not self.tripped
+
+    def trip(self): self.__tripped = True
+    def load(self): self.__loads += 1
+
+    @property
+    def handle(self): return self.__handle
+    @property
+    def tripped(self): return self.__tripped
+    @property
+    def loads(self): return self.__loads
+
+
+class WebTabDriver(object):
+    def __init__(self, driver, *args, tabs=4, memory=None, interval=25, clear=True, **kwargs):
+        assert int(tabs) >= 1
+        self.__mutex = threading.RLock()
+        self.__driver = driver
+        self.__size = int(tabs)
+        self.__memory = float(memory) * 1024 ** 2 if memory is not None else None
+        self.__interval = int(interval)
+        self.__clear = bool(clear)
+        self.__tabs = []
+        self.__index = 0
+        self.__active = None
+        self.__fatal = False
+        self.__exceeded = False
+        self.__loads = 0
+        self.__counts = {"loads": 0, "recycles": 0, "restarts": 0}
+
+    def __repr__(self): return "{}(tabs={:.0f}, memory={}, loads={:.0f}, recycles={:.0f}, restarts={:.0f})".format(self.__class__.__name__, self.size, repr(self.memory), self.counts["loads"], self.counts["recycles"], self.counts["restarts"])
+    def __bool__(self): return bool(self.driver) and not self.fatal and not self.exceeded and bool(self.tab)
+
+    def __getattr__(self, attribute):
+        if attribute.startswith("_WebTabDriver__"):
+            raise AttributeError(attribute)
+        with self.mutex:
+            self.switch()
+            value = getattr(self.driver, attribute)
+        return self.wrapper(value) if callable(value) else value
+
+    def __setattr__(self, attribute, value):
+        if attribute.startswith("_WebTabDriver__"):
+            object.__setattr__(self, attribute, value)
+        else:
+            setattr(self.driver, attribute, value)
+
+    def __delattr__(self, attribute):
+        if attribute.startswith("_WebTabDriver__"):
+            object.__delattr__(self, attribute)
+        else:
+            delattr(self.driver, attribute)
+
+    def wrapper(self, function):
+        def wrapped(*args, **kwargs):
+            with self.mutex:
+                self.switch()
+                try:
+                    return function(*args, **kwargs)
+                except NoSuchWindowException:
+                    self.tab.trip()
+                    raise
+                except WebDriverException as error:
+                    self.__fatal = self.fatal or fatal_parser(error)
+                    raise
+        return wrapped
+
+    def open(self):
+        with self.mutex:
+            handles = list(self.driver.window_handles)
+            self.driver.switch_to.window(handles[0])
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+            self.__tabs = [WebTab(handles[0])]
+            while len(self.tabs) < self.size:
+                self.driver.switch_to.new_window("tab")
+                self.__tabs.append(WebTab(self.driver.current_window_handle))
+            self.__index, self.__active = 0, self.driver.current_window_handle
+            self.__fatal, self.__exceeded, self.__loads = False, False, 0
+        return self
+
+    def switch(self):
+        if self.tab.handle != self.__active:
+            self.driver.switch_to.window(self.tab.handle)
+            self.__active = self.tab.handle
+
+    def rotate(self):
+        with self.mutex:
+            for offset in range(1, len(self.tabs) + 1):
+                index = (self.__index + offset) % len(self.tabs)
+                if bool(self.tabs[index]):
+                    self.__index = index
+                    return self.tab
+            return self.tab
+
+    def get(self, url, *args, **kwargs):
+        with self.mutex:
+            self.rotate()
+            self.wrapper(self.driver.get)(url, *args, **kwargs)
+            self.tab.load()
+            self.__loads += 1
+            self.counts["loads"] += 1
+            if self.memory is not None and self.__loads % self.interval == 0:
+                self.measure()
+
+    def measure(self):
+        with self.mutex:
+            usage = 0
+            for index in range(len(self.tabs)):
+                self.driver.switch_to.window(self.tabs[index].handle)
+                usage += float(self.driver.execute_script(memory_script) or 0)
+            self.__active = self.tabs[-1].handle
+            self.__exceeded = usage >= self.memory
+            if self.exceeded:
+                LOGGER.warning("Memory Ceiling: {}[{:.0f}MB]".format(repr(self), usage / 1024 ** 2))
+            return usage
+
+    def trip(self):
+        with self.mutex:
+            self.tab.trip()
+
+    def reset(self):
+        with self.mutex:
+            if not bool(self.driver) or self.fatal or self.exceeded:
+                self.restart()
+            else:
+                self.recycle()
+
+    def recycle(self):
+        for index, tab in enumerate(list(self.tabs)):
+            if bool(tab):
+                continue
+            try:
+                self.driver.switch_to.window(tab.handle)
+                if self.clear:
+                    self.driver.delete_all_cookies()
+                self.driver.close()
+            except NoSuchWindowException:
+                pass
+            self.driver.switch_to.window(next(iter([other.handle for other in self.tabs if bool(other)]), self.driver.window_handles[0]))
+            self.driver.switch_to.new_window("tab")
+            self.tabs[index] = WebTab(self.driver.current_window_handle)
+            self.__active = self.driver.current_window_handle
+            self.counts["recycles"] += 1
+            LOGGER.info("Recycled: {}[{:.0f}]".format(repr(self), index))
+
+    def restart(self):
+        self.driver.reset()
+        self.open()
+        self.counts["restarts"] += 1
+        LOGGER.info("Restarted: {}".format(repr(self)))
+
+    @property
+    def tab(self): return self.tabs[self.__index]
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def driver(self): return self.__driver
+    @property
+    def size(self): return self.__size
+    @property
+    def memory(self): return self.__memory
+    @property
+    def interval(self): return self.__interval
+    @property
+    def clear(self): return self.__clear
+    @property
+    def tabs(self): return self.__tabs
+    @property
+    def fatal(self): return self.__fatal
+    @property
+    def exceeded(self): return self.__exceeded
+    @property
+    def counts(self): return self.__counts
+
+
+class WebTabSession(object):
+    def __init__(self, *args, browser, tabs=4, memory=None, interval=25, clear=True, **kwargs):
+        self.__browser = browser
+        self.__options = dict(tabs=int(tabs), memory=memory, interval=int(interval), clear=bool(clear))
+        self.__context = None
+        self.__driver = None
+
+    def __repr__(self): return "{}(browser={}, tabs={:.0f})".format(self.__class__.__name__, repr(self.browser), self.options["tabs"])
+    def __call__(self, *args, **kwargs): return self
+
+    def __enter__(self):
+        self.__context = self.browser()
+        self.__driver = WebTabDriver(self.__context.__enter__(), **self.options).open()
+        return self.__driver
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        LOGGER.info("Session: {}".format(repr(self.__driver)))
+        context, self.__context, self.__driver = self.__context, None, None
+        return context.__exit__(error_type, error_value, error_traceback)
+
+    @property
+    def browser(self): return self.__browser
+    @property
+    def options(self): return self.__options
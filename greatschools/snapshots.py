@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Page Snapshot Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import os.path
+import gzip
+import json
+import uuid
+import hashlib
+import logging
+import multiprocessing
+from datetime import date as Date
+from datetime import datetime as Datetime
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["SnapshotStore", "snapshot_loader", "snapshot_replay"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DATEFORMAT = "%m/%d/%Y"
+url_hasher = lambda url: hashlib.sha1(str(url).encode("utf-8")).hexdigest()
+date_folder = lambda date: Datetime.strptime(str(date), DATEFORMAT).strftime("%Y%m%d")
+
+
+def snapshot_loader(file):
+    with gzip.open(file, "rt", encoding="utf-8") as handle:
+        header = json.loads(handle.readline())
+        content = handle.read()
+    return header["url"], header["date"], content
+
+
+class SnapshotStore(object):
+    def __init__(self, *args, directory, level=6, **kwargs):
+        self.__directory = directory
+        self.__level = int(level)
+
+    def __repr__(self): return "{}(directory={})".format(self.__class__.__name__, repr(self.directory))
+    def path(self, dataset, date, url): return os.path.join(self.directory, str(dataset), date_folder(date), "{}.gz".format(url_hasher(url)))
+
+    def save(self, dataset, url, content, *args, date=None, **kwargs):
+        date = date if date is not None else Date.today().strftime(DATEFORMAT)
+        file = self.path(dataset, date, url)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        temporary = "{}.{}.tmp".format(file, uuid.uuid4().hex[:8])
+        with gzip.open(temporary, "wt", encoding="utf-8", compresslevel=self.level) as handle:
+            handle.write(json.dumps({"url": str(url), "date": str(date)}) + "\n")
+            handle.write(content if isinstance(content, str) else bytes(content).decode("utf-8"))
+        os.replace(temporary, file)
+        return file
+
+    def files(self, dataset, *args, date=None, **kwargs):
+        directory = os.path.join(self.directory, str(dataset))
+        if not os.path.isdir(directory):
+            return []
+        folders = [date_folder(date)] if date is not None else sorted(os.listdir(directory))
+        files = {}
+        for folder in [folder for folder in folders if os.path.isdir(os.path.join(directory, folder))]:
+            for file in os.listdir(os.path.join(directory, folder)):
+                if file.endswith(".gz"):
+                    files[file] = os.path.join(directory, folder, file)
+        return sorted(files.values())
+
+    @property
+    def directory(self): return self.__directory
+    @property
+    def level(self): return self.__level
+
+
+def snapshot_replay(store, dataset, function, *args, processes=None, chunksize=16, date=None, **kwargs):
+    files = store.files(dataset, date=date)
+    processes = int(processes) if processes is not None else os.cpu_count()
+    LOGGER.info("Replay: {}[{}|{:.0f}|processes={:.0f}]".format(repr(store), str(dataset), len(files), processes))
+    if not files:
+        return
+    with multiprocessing.Pool(processes=processes) as pool:
+        for results in pool.imap_unordered(function, files, chunksize=int(chunksize)):
+            yield from results
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools HTML Source Parsers
+@author: Jack Kirby Cook
+
+"""
+
+import logging
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["text_parser"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+text_parser = lambda element: " ".join(element.text_content().split())
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Attendance Zone Index
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import time
+import logging
+import numpy as np
+
+try:
+    import shapefile
+except ImportError:
+    shapefile = None
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["ZoneIndex", "contains"]
+__copyright__ = "Copyright 2021, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def contains(ring, xs, ys, chunk=2**22):
+    ring = np.asarray(ring, dtype=np.float64)
+    x0, y0 = ring[:, 0], ring[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    slopes = np.divide(x1 - x0, y1 - y0, out=np.zeros_like(x0), where=(y1 != y0))
+    inside = np.zeros(len(xs), dtype=bool)
+    step = max(int(chunk // max(len(ring), 1)), 1)
+    for start in range(0, len(xs), step):
+        px, py = xs[start:start + step, np.newaxis], ys[start:start + step, np.newaxis]
+        crossings = ((y0 > py) != (y1 > py)) & (px < slopes * (py - y0) + x0)
+        inside[start:start + step] = np.count_nonzero(crossings, axis=1) % 2 == 1
+    return inside
+
+
+class ZoneIndex(object):
+    def __init__(self, GIDs, rings, *args, cells=None, **kwargs):
+        assert len(GIDs) == len(rings)
+        self.__GIDs = np.asarray(GIDs, dtype=np.int64)
+        self.__rings = [np.asarray(ring, dtype=np.float64)[:, :2] for ring in rings]
+        self.__bounds = np.array([[ring[:, 0].min(), ring[:, 1].min(), ring[:, 0].max(), ring[:, 1].max()] for ring in self.rings], dtype=np.float64).reshape(-1, 4)
+        self.__cells = int(cells) if cells is not None else max(int(np.ceil(np.sqrt(len(self.rings)) * 2)), 1)
+        self.build()
+
+    def __repr__(self): return "{}(zones={:.0f}, cells={:.0f})".format(self.__class__.__name__, len(self), self.cells)
+    def __len__(self): return len(self.GIDs)
+
+    @classmethod
+    def load(cls, file, *args, **kwargs):
+        if shapefile is None:
+            raise ImportError("ZoneIndex.load requires pyshp (pip install pyshp)")
+        GIDs, rings = [], []
+        with shapefile.Reader(file) as reader:
+            fields = [field[0] for field in reader.fields[1:]]
+            key = "GID" if "GID" in fields else "id"
+            for shaperecord in reader.iterShapeRecords():
+                record, shape = dict(zip(fields, shaperecord.record)), shaperecord.shape
+                parts = list(shape.parts) + [len(shape.points)]
+                GIDs.append(int(record[key]))
+                rings.append(shape.points[parts[0]:parts[1]])
+        return cls(GIDs, rings, *args, **kwargs)
+
+    def build(self):
+        if not len(self):
+            self.extent, self.offsets, self.members = np.zeros(4), np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+            return
+        self.extent = np.array([self.bounds[:, 0].min(), self.bounds[:, 1].min(), self.bounds[:, 2].max(), self.bounds[:, 3].max()])
+        lower = self.index(self.bounds[:, 0], self.bounds[:, 1])
+        upper = self.index(self.bounds[:, 2], self.bounds[:, 3])
+        cells, members = [], []
+        for member, ((ix0, iy0), (ix1, iy1)) in enumerate(zip(lower, upper)):
+            ixs, iys = np.meshgrid(np.arange(ix0, ix1 + 1), np.arange(iy0, iy1 + 1))
+            cells.append((iys * self.cells + ixs).ravel())
+            members.append(np.full(ixs.size, member, dtype=np.int64))
+        cells, members = np.concatenate(cells), np.concatenate(members)
+        order = np.argsort(cells, kind="stable")
+        self.members = members[order]
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(cells, minlength=self.cells ** 2))]).astype(np.int64)
+
+    def index(self, xs, ys):
+        width = max(self.extent[2] - self.extent[0], 1e-12) / self.cells
+        height = max(self.extent[3] - self.extent[1], 1e-12) / self.cells
+        ix = np.clip(((np.asarray(xs) - self.extent[0]) // width).astype(np.int64), 0, self.cells - 1)
+        iy = np.clip(((np.asarray(ys) - self.extent[1]) // height).astype(np.int64), 0, self.cells - 1)
+        return np.stack([ix, iy], axis=-1)
+
+    def candidates(self, xs, ys):
+        within = (xs >= self.extent[0]) & (xs <= self.extent[2]) & (ys >= self.extent[1]) & (ys <= self.extent[3])
+        points = np.flatnonzero(within) if len(self) else np.zeros(0, dtype=np.int64)
+        if not len(points):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        indexes = self.index(xs[points], ys[points])
+        cells = indexes[:, 1] * self.cells + indexes[:, 0]
+        starts, counts = self.offsets[cells], self.offsets[cells + 1] - self.offsets[cells]
+        points = np.repeat(points, counts)
+        positions = np.repeat(starts - np.concatenate([[0], np.cumsum(counts)[:-1]]), counts) + np.arange(counts.sum())
+        members = self.members[positions]
+        bounds = self.bounds[members]
+        within = (xs[points] >= bounds[:, 0]) & (xs[points] <= bounds[:, 2]) & (ys[points] >= bounds[:, 1]) & (ys[points] <= bounds[:, 3])
+        return points[within], members[within]
+
+    def query(self, xs, ys):
+        xs, ys = np.asarray(xs, dtype=np.float64).ravel(), np.asarray(ys, dtype=np.float64).ravel()
+        points, members = self.candidates(xs, ys)
+        order = np.argsort(members, kind="stable")
+        points, members = points[order], members[order]
+        hits = np.zeros(len(points), dtype=bool)
+        boundaries = np.flatnonzero(np.diff(members)) + 1
+        for start, stop in zip(np.concatenate([[0], boundaries]), np.concatenate([boundaries, [len(members)]])):
+            if start == stop:
+                continue
+            selected = points[start:stop]
+            hits[start:stop] = contains(self.rings[members[start]], xs[selected], ys[selected])
+        points, members = points[hits], members[hits]
+        order = np.lexsort((members, points))
+        return points[order], self.GIDs[members[order]]
+
+    def lookup(self, xs, ys, default=-1):
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        results = np.full(len(xs), default, dtype=np.int64)
+        points, GIDs = self.query(xs, ys)
+        results[points[::-1]] = GIDs[::-1]
+        return results
+
+    def scan(self, xs, ys, default=-1):
+        xs, ys = np.asarray(xs, dtype=np.float64).ravel(), np.asarray(ys, dtype=np.float64).ravel()
+        results = np.full(len(xs), default, dtype=np.int64)
+        for GID, ring in reversed(list(zip(self.GIDs, self.rings))):
+            results[contains(ring, xs, ys)] = GID
+        return results
+
+    @property
+    def GIDs(self): return self.__GIDs
+    @property
+    def rings(self): return self.__rings
+    @property
+    def bounds(self): return self.__bounds
+    @property
+    def cells(self): return self.__cells
+
+
+def benchmark(*args, zones=2000, points=10**5, vertices=200, **kwargs):
+    centers = np.random.uniform(0, 100, size=(int(zones), 2))
+    radius = np.random.uniform(0.5, 2.5, size=int(zones))
+    angles = np.linspace(0, 2 * np.pi, int(vertices), endpoint=False)
+    rings = [np.stack([x + r * np.cos(angles), y + r * np.sin(angles)], axis=-1) for (x, y), r in zip(centers, radius)]
+    xs, ys = np.random.uniform(0, 100, size=int(points)), np.random.uniform(0, 100, size=int(points))
+    start = time.perf_counter()
+    index = ZoneIndex(np.arange(int(zones)) + 1, rings)
+    building = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = index.lookup(xs, ys)
+    lookup = time.perf_counter() - start
+    subset = slice(0, max(int(points) // 100, 1))
+    start = time.perf_counter()
+    scanned = index.scan(xs[subset], ys[subset])
+    scan = (time.perf_counter() - start) * 100
+    assert np.array_equal(indexed[subset] >= 0, scanned >= 0)
+    LOGGER.info("ZoneIndex[{:.0f}|{:.0f}]: build={:.2f}s|lookup={:.0f}/s|scan={:.0f}/s".format(int(zones), int(points), building, int(points) / lookup, int(points) / scan))
+    return {"build": building, "lookup": lookup, "scan": scan}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="[%(levelname)s, %(threadName)s]:  %(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    benchmark()
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Boundary Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import json
+import socket
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+
+BOUNDARY_PAGE = """<html><body><img src="/asset.png"><script>fetch("/gsr/api/schools/{GID}?state=CA&extras=boundaries")</script></body></html>"""
+BOUNDARY_JSON = {"id": 1, "districtId": 2, "districtName": "District", "lat": 35.0, "lon": -119.0, "name": "School", "gradeLevels": "K-5", "schooltype": "public", "state": "CA", "address": {"street1": "1 Main St", "city": "Bakersfield", "zip": "93301"}, "boundaries": {"e": {"coordinates": [[[[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]]]}}}
+rss_parser = lambda: int(open("/proc/self/statm").read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class BoundaryHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/gsr/api/schools/"):
+            body, kind = json.dumps(BOUNDARY_JSON).encode("utf-8"), "application/json"
+        elif self.path.startswith("/asset.png"):
+            body, kind = b"\x89PNG" + b"\x00" * 4096, "image/png"
+        else:
+            body, kind = BOUNDARY_PAGE.format(GID=self.path.split("=")[-1]).encode("utf-8"), "text/html"
+        self.send_response(200)
+        self.send_header("Content-Type", kind)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs): pass
+
+
+class CaptureRequest(object):
+    def __init__(self, url): self.url = url
+
+
+class CaptureResponse(object):
+    def __init__(self, body): self.headers, self.body = {"Content-Encoding": "identity"}, body
+
+
+class OutcomeHandler(BaseHTTPRequestHandler):
+    hits = {}
+
+    def do_GET(self):
+        status = int(self.path.strip("/").split("?")[0] or 200)
+        OutcomeHandler.hits[status] = OutcomeHandler.hits.get(status, 0) + 1
+        body, kind = (json.dumps(BOUNDARY_JSON).encode("utf-8"), "application/json") if status == 200 else (b"<html>Captcha</html>", "text/html")
+        body, kind = (b"<html><div class='Captcha'></div></html>", "text/html") if status == 299 else (body, kind)
+        self.send_response(200 if status == 299 else status)
+        self.send_header("Content-Type", kind)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs): pass
+
+
+@pytest.fixture
+def stub():
+    OutcomeHandler.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OutcomeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{:.0f}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("status, outcome", [(200, "success"), (299, "captcha"), (403, "refusal"), (429, "refusal"), (404, "badrequest"), (500, "failure"), (503, "failure")])
+def test_boundary_outcome(stub, status, outcome):
+    boundarys = pytest.importorskip("greatschools.boundarys")
+    with boundarys.Greatschools_Boundary_WebSession(name="TestSession", timeout=5, retrys=2) as session:
+        response = session.get("{}/{:.0f}?state=CA&extras=boundaries".format(stub, status), referer="https://www.greatschools.org")
+    assert boundarys.boundary_outcome(response)[0] == outcome
+    assert OutcomeHandler.hits[status] == 1
+    if outcome == "success":
+        assert boundarys.boundary_parser(boundarys.boundary_outcome(response)[1]) is not None
+
+
+def test_boundary_retry_connection():
+    boundarys = pytest.importorskip("greatschools.boundarys")
+    requests = pytest.importorskip("requests")
+    with socket.socket() as closed:
+        closed.bind(("127.0.0.1", 0))
+        port = closed.getsockname()[1]
+    with boundarys.Greatschools_Boundary_WebSession(name="TestSession", timeout=5, retrys=2) as session:
+        adapter = session.session.get_adapter("http://127.0.0.1")
+        assert adapter.max_retries.connect == 2 and adapter.max_retries.read == 0 and adapter.max_retries.status == 0
+        with pytest.raises(requests.ConnectionError):
+            session.get("http://127.0.0.1:{:.0f}/200".format(port))
+
+
+def test_boundary_capture_bound():
+    boundarys = pytest.importorskip("greatschools.boundarys")
+    capture = boundarys.Greatschools_Boundary_WebCapture(size=4)
+    for GID in range(1, 10001):
+        capture(CaptureRequest("https://www.greatschools.org/school-district-boundaries-map?schoolId={:.0f}".format(GID)), CaptureResponse(b"<html>" + b"x" * 4096 + b"</html>"))
+        capture(CaptureRequest("https://www.greatschools.org/asset-{:.0f}.png".format(GID)), CaptureResponse(b"\x89PNG" + b"\x00" * 4096))
+        capture(CaptureRequest("https://www.greatschools.org/gsr/api/schools/{:.0f}?state=CA&extras=boundaries".format(GID)), CaptureResponse(json.dumps({"id": GID}).encode("utf-8")))
+        assert len(capture) <= 4
+    assert capture.urls == ["https://www.greatschools.org/gsr/api/schools/{:.0f}?state=CA&extras=boundaries".format(GID) for GID in range(9997, 10001)]
+    assert json.loads(capture.wait("/gsr/api/schools/10000?", timeout=0)[1])["id"] == 10000
+    assert capture.get("/gsr/api/schools/1?") is None
+    with pytest.raises(boundarys.TimeoutException):
+        capture.wait("/gsr/api/schools/1?", timeout=0.05, poll=0.01)
+    capture.clear()
+    assert len(capture) == 0
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BoundaryHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{:.0f}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.skipif(not os.environ.get("GREATSCHOOLS_SOAK") or not sys.platform.startswith("linux"), reason="set GREATSCHOOLS_SOAK=1 with chromedriver on PATH to run the capture soak test")
+def test_boundary_capture_soak(server):
+    webdriver = pytest.importorskip("seleniumwire.webdriver")
+    boundarys = pytest.importorskip("greatschools.boundarys")
+    profiles = pytest.importorskip("greatschools.profiles")
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    profile = profiles.WebProfile(name="SoakProfile")
+    page = boundarys.Greatschools_Boundary_WebPage(driver, name="SoakPage", delayer=None)
+    loads, sizes, aborted = int(os.environ.get("GREATSCHOOLS_SOAK_LOADS", 500)), [], 0
+    try:
+        for GID in range(1, loads + 1):
+            page.capture()
+            profile.install(driver)
+            driver.get("{}/school-district-boundaries-map?state=CA&schoolId={:.0f}".format(server, GID))
+            encoding, body = page.responses.wait("gsr/api/schools/{:.0f}?".format(GID), timeout=30)
+            assert json.loads(body)["id"] == 1
+            assert len(page.responses) == 1
+            aborted += len([request for request in driver.requests if request.url.endswith("asset.png") and request.response is None])
+            sizes.append(len(driver.requests))
+            if GID == loads // 10:
+                baseline = rss_parser()
+            profile.report(driver, GID)
+        growth = rss_parser() - baseline
+    finally:
+        driver.quit()
+    assert max(sizes) <= 4
+    assert aborted >= loads * 0.9
+    assert growth < 64 * 1024 ** 2
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Change Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+pd = pytest.importorskip("pandas")
+changes = pytest.importorskip("greatschools.changes")
+from greatschools.journals import JournalMixin
+
+
+SCHOOL = {"GID": "1", "name": "School", "address": "1 Main St, Fresno, CA 93701", "date": "10/18/2026"}
+
+
+class Query(object):
+    def __init__(self, query): self.query = query
+    def todict(self): return dict(self.query)
+    def success(self): return "success"
+    def failure(self): return "failure"
+    def abandon(self): return "abandon"
+
+
+class ChangeQuery(JournalMixin, Query): pass
+
+
+def test_change_hash_ignores_date():
+    assert changes.content_hash(SCHOOL) == changes.content_hash({**SCHOOL, "date": "01/01/2027"})
+    assert changes.content_hash(SCHOOL) != changes.content_hash({**SCHOOL, "name": "Other"})
+    dataframe = pd.DataFrame([{"GID": "1", "Math": "45%", "date": "10/18/2026"}])
+    assert changes.content_hash(dataframe) == changes.content_hash(dataframe.assign(date="01/01/2027"))
+    assert changes.content_hash(dataframe) == changes.content_hash(dataframe.drop(columns="date"))
+
+
+def test_change_hash_column_order():
+    dataframe = pd.DataFrame([{"GID": "1", "Math": "45%", "English": "52%"}, {"GID": "2", "Math": "40%", "English": "60%"}])
+    assert changes.content_hash(dataframe) == changes.content_hash(dataframe[["English", "GID", "Math"]])
+    assert changes.content_hash(dataframe) != changes.content_hash(dataframe.iloc[::-1])
+    assert changes.content_hash(dict(reversed(list(SCHOOL.items())))) == changes.content_hash(SCHOOL)
+
+
+def test_change_staged_until_success(tmp_path):
+    index = changes.ChangeIndex(file=str(tmp_path / "changes.db"))
+    assert index("schools", "1", [SCHOOL])
+    assert index("scores", "1", [{"GID": "1", "Overall": "7"}])
+    assert index("schools", "2", [{**SCHOOL, "GID": "2"}])
+    assert set(index.staged.keys()) == {1, 2} and set(index.staged[1].keys()) == {"schools", "scores"}
+    assert index("schools", "1", [SCHOOL])
+    index.record({"GID": "1"}, "success")
+    assert set(index.staged.keys()) == {2}
+    assert not index("schools", "1", [{**SCHOOL, "date": "01/01/2027"}])
+    assert not index("scores", "1", [{"GID": "1", "Overall": "7"}])
+    assert index("schools", "1", [{**SCHOOL, "name": "Other"}])
+    assert index.counts["changed"] == 2 and index.counts["unchanged"] == 2
+    index.close()
+    reopened = changes.ChangeIndex(file=str(tmp_path / "changes.db"))
+    assert not reopened("schools", "1", [SCHOOL])
+    assert reopened("schools", "2", [{**SCHOOL, "GID": "2"}])
+    reopened.close()
+
+
+@pytest.mark.parametrize("outcome", ["failure", "abandon", "error"])
+def test_change_discarded(tmp_path, outcome):
+    index = changes.ChangeIndex(file=str(tmp_path / "changes.db"))
+    assert index("schools", "1", [SCHOOL])
+    index.record({"GID": "1"}, outcome)
+    assert index.staged == {} and index.counts["discarded"] == 1 and index.counts["changed"] == 0
+    assert index("schools", "1", [SCHOOL])
+    index.close()
+
+
+def test_change_query_outcomes(tmp_path):
+    index = changes.ChangeIndex(file=str(tmp_path / "changes.db"))
+    ChangeQuery.changes = index
+    try:
+        assert index("schools", "1", [SCHOOL]) and index("schools", "2", [SCHOOL]) and index("schools", "3", [SCHOOL])
+        assert ChangeQuery({"GID": "1"}).success() == "success"
+        assert ChangeQuery({"GID": "2"}).failure() == "failure"
+        assert ChangeQuery({"GID": "3"}).abandon() == "abandon"
+        assert index.staged == {}
+        assert [index("schools", GID, [SCHOOL]) for GID in ("1", "2", "3")] == [False, True, True]
+    finally:
+        ChangeQuery.changes = None
+        index.close()
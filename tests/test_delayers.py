@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Delayer Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+delayers = pytest.importorskip("greatschools.delayers")
+
+
+class VPN(object):
+    ready = True
+    server = "United States #1234"
+
+
+def test_aimd_increase():
+    controller = delayers.AIMDController(wait=(10, 20), bounds=(2, 300), step=0.5)
+    assert controller.feedback("success", "A") == 14.5
+    assert controller.feedback("badrequest", "A") == 14.0
+    assert controller.feedback("failure", "A") == 14.0
+
+
+def test_aimd_backoff():
+    controller = delayers.AIMDController(wait=(10, 20), bounds=(2, 300), backoff=2.0)
+    assert controller.feedback("captcha", "A") == 30.0
+    assert controller.feedback("refusal", "A") == 60.0
+    assert controller.seconds("B") == 15.0
+
+
+def test_aimd_bounds():
+    controller = delayers.AIMDController(wait=(10, 20), bounds=(2, 100), step=5, backoff=4.0)
+    assert max([controller.feedback("captcha", "A") for _ in range(5)]) == 100
+    assert min([controller.feedback("success", "A") for _ in range(50)]) == 2
+
+
+def test_aimd_jitter():
+    controller = delayers.AIMDController(wait=(10, 20), jitter=0.25)
+    assert all([11.25 <= controller.delay("A") <= 18.75 for _ in range(100)])
+
+
+def test_endpoint_server(monkeypatch):
+    def urlopen(*args, **kwargs): raise AssertionError("lookup")
+    monkeypatch.setattr(delayers.urllib.request, "urlopen", urlopen)
+    assert delayers.WebEndpoint(VPN())() == VPN.server
+    assert delayers.WebEndpoint(VPN(), lookup=True)() == VPN.server
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Index Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+pd = pytest.importorskip("pandas")
+indexes = pytest.importorskip("greatschools.indexes")
+
+
+@pytest.fixture
+def index(tmp_path):
+    file = str(tmp_path / "links.zip")
+    links = ["https://www.greatschools.org/california/bakersfield/{:.0f}-School/".format(GID) for GID in (101, 102, 103)]
+    pd.DataFrame({"GID": ["101", "102", "103"], "address": "", "link": links}).to_csv(file, index=False, compression="zip")
+    return indexes.LinkIndex(file=file)
+
+
+def test_link_index_lookup(index):
+    assert index.get("102") == "https://www.greatschools.org/california/bakersfield/102-School/"
+    assert index.get(104) is None
+    assert "101" in index and len(index) == 3
+
+
+def test_link_index_nonnumeric(index):
+    assert index.get("abc", default="missing") == "missing"
+    assert index.get(None) is None
+    assert "abc" not in index
+
+
+def test_link_index_stat_per_batch(index, monkeypatch):
+    index.refresh()
+    calls = []
+    stat = os.stat
+    monkeypatch.setattr(indexes.os, "stat", lambda *args, **kwargs: calls.append(args) or stat(*args, **kwargs))
+    for GID in range(100, 200):
+        index.get(GID)
+    assert not calls
+    index.refresh()
+    assert len(calls) == 1
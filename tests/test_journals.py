@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Journal Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from greatschools import journals
+from greatschools.journals import WebJournal
+
+
+def attempt(journal, GID, outcome, *values):
+    for value in values:
+        journal.result({"GID": GID}, {"schools": value}, owner={"GID": GID})
+    journal.outcome({"GID": GID}, outcome, sync=True)
+
+
+def reopen(journal):
+    journal.stop()
+    return WebJournal(file=journal.file)
+
+
+def test_journal_truncated_tail(tmp_path):
+    journal = WebJournal(file=str(tmp_path / "schools.journal"))
+    attempt(journal, "1", "success", "a")
+    attempt(journal, "2", "success", "b")
+    journal.stop()
+    with open(journal.file, "rb") as handle:
+        content = handle.read()
+    with open(journal.file, "wb") as handle:
+        handle.write(content[:-3])
+    journal = WebJournal(file=journal.file)
+    assert journal.completed("GID") == {"1"}
+    assert journal.pending() == [({"GID": "1"}, {"schools": "a"})]
+    assert os.path.getsize(journal.file) < len(content)
+
+
+def test_journal_corrupt_tail(tmp_path):
+    journal = WebJournal(file=str(tmp_path / "schools.journal"))
+    attempt(journal, "1", "success", "a")
+    journal.stop()
+    with open(journal.file, "ab") as handle:
+        handle.write(journals.FRAME.pack(4, 0) + b"junk")
+    journal = WebJournal(file=journal.file)
+    assert journal.completed("GID") == {"1"}
+    assert journal.pending() == [({"GID": "1"}, {"schools": "a"})]
+
+
+def test_journal_abandoned_owner(tmp_path):
+    journal = WebJournal(file=str(tmp_path / "schools.journal"))
+    attempt(journal, "1", "abandon", "a")
+    attempt(journal, "2", "failure", "b")
+    attempt(journal, "3", "success", "c")
+    journal.result({"GID": "4"}, {"schools": "d"}, owner={"GID": "4"}, sync=True)
+    journal = reopen(journal)
+    assert journal.completed("GID") == {"3"}
+    assert journal.pending() == [({"GID": "3"}, {"schools": "c"})]
+
+
+def test_journal_superseded_attempt(tmp_path):
+    journal = WebJournal(file=str(tmp_path / "schools.journal"))
+    attempt(journal, "1", "abandon", "a")
+    attempt(journal, "1", "success", "b")
+    attempt(journal, "2", "success", "c")
+    attempt(journal, "2", "success", "d")
+    journal = reopen(journal)
+    assert journal.completed("GID") == {"1", "2"}
+    assert sorted(journal.pending(), key=str) == [({"GID": "1"}, {"schools": "b"}), ({"GID": "2"}, {"schools": "d"})]
+
+
+def test_journal_commit_marker(tmp_path):
+    journal = WebJournal(file=str(tmp_path / "schools.journal"))
+    attempt(journal, "1", "success", "a")
+    journal.commit("parquet")
+    attempt(journal, "2", "success", "b")
+    for journal in (reopen(journal), reopen(reopen(journal))):
+        assert journal.pending("parquet") == [({"GID": "2"}, {"schools": "b"})]
+        assert journal.pending("zip") == [({"GID": "1"}, {"schools": "a"}), ({"GID": "2"}, {"schools": "b"})]
+        assert journal.completed("GID") == {"1", "2"}
+
+
+def test_journal_group_commit(tmp_path, monkeypatch):
+    fsync, calls = os.fsync, []
+
+    def counter(descriptor):
+        calls.append(descriptor)
+        time.sleep(0.01)
+        fsync(descriptor)
+
+    monkeypatch.setattr(journals.os, "fsync", counter)
+    journal = WebJournal(file=str(tmp_path / "schools.journal"), size=256)
+    for GID in range(500):
+        journal.outcome({"GID": str(GID)}, "success")
+    journal.outcome({"GID": "500"}, "success", sync=True)
+    journal = reopen(journal)
+    assert len(journal.completed("GID")) == 501
+    assert 0 < len(calls) < 50
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Lease Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import csv
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from greatschools.leases import LeaseStore, LeaseQueue
+
+
+QUERYS = [{"GID": str(GID)} for GID in range(3)]
+
+
+class Query(dict):
+    leases = None
+
+    def __init__(self, query, *args, name, **kwargs): super().__init__(query)
+    def todict(self): return dict(self)
+    def success(self): self.leases.commit(self.todict(), "success")
+
+
+class Queue(list):
+    def __init__(self, queryables, *args, name, **kwargs): super().__init__(queryables)
+    def __enter__(self): return self
+    def __exit__(self, *args): pass
+
+
+def stores(tmp_path, **kwargs):
+    return [LeaseStore(file=str(tmp_path / "leases.db"), dataset="schools", **kwargs) for _ in range(2)]
+
+
+def test_lease_exclusive(tmp_path):
+    first, second = stores(tmp_path)
+    first.seed("crawl", QUERYS)
+    second.seed("crawl", QUERYS)
+    assert first.lease("crawl", "first", 2) == QUERYS[:2]
+    assert second.lease("crawl", "second", 2) == QUERYS[2:]
+    assert second.lease("crawl", "second", 2) == []
+    assert first.counts("crawl") == {"pending": 0, "leased": 3, "success": 0, "failure": 0}
+
+
+def test_lease_heartbeat(tmp_path):
+    first, second = stores(tmp_path, timeout=0.3)
+    first.seed("crawl", QUERYS[:1])
+    assert first.lease("crawl", "first", 1) == QUERYS[:1]
+    time.sleep(0.2)
+    assert first.heartbeat("crawl", "first") == 1
+    time.sleep(0.2)
+    assert second.lease("crawl", "second", 1) == []
+
+
+def test_lease_lapse_reclaim(tmp_path):
+    first, second = stores(tmp_path, timeout=0.1)
+    first.seed("crawl", QUERYS[:1])
+    assert first.lease("crawl", "first", 1) == QUERYS[:1]
+    assert second.available("crawl") == 0
+    time.sleep(0.2)
+    assert second.available("crawl") == 1
+    assert second.lease("crawl", "second", 1) == QUERYS[:1]
+
+
+def test_lease_late_commit(tmp_path):
+    first, second = stores(tmp_path, timeout=0.1)
+    first.seed("crawl", QUERYS[:1])
+    first.lease("crawl", "first", 1)
+    time.sleep(0.2)
+    second.lease("crawl", "second", 1)
+    assert not first.commit("crawl", "first", QUERYS[0], "success")
+    assert second.commit("crawl", "second", QUERYS[0], "success")
+    assert not first.commit("crawl", "first", QUERYS[0], "failure")
+    assert second.counts("crawl")["success"] == 1
+
+
+def test_lease_retrys(tmp_path):
+    first, second = stores(tmp_path, retrys=2)
+    first.seed("crawl", QUERYS[:1])
+    first.lease("crawl", "first", 1)
+    assert first.commit("crawl", "first", QUERYS[0], "failure")
+    assert second.counts("crawl")["pending"] == 1
+    second.lease("crawl", "second", 1)
+    assert second.commit("crawl", "second", QUERYS[0], "failure")
+    assert first.counts("crawl") == {"pending": 0, "leased": 0, "success": 0, "failure": 1}
+    assert first.lease("crawl", "first", 1) == []
+    assert first.remaining("crawl") == 0
+
+
+def test_lease_queue_reclaim_report(tmp_path):
+    first, second = stores(tmp_path, timeout=60)
+    first.seed("crawl", QUERYS)
+    first.lease("crawl", "dead", 1)
+    report = str(tmp_path / "schools.csv")
+    queue = LeaseQueue(QUERYS, store=second, crawl="crawl", queryable=Query, queue=Queue, name="queue", report=report, reclaim="true", poll=60)
+    start = time.monotonic()
+    with queue:
+        for query in queue:
+            query.success()
+    assert time.monotonic() - start < 5
+    assert second.counts("crawl")["success"] == 3
+    with open(report, "r", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert sorted([row["GID"] for row in rows]) == ["0", "1", "2"]
+    assert set([row["state"] for row in rows]) == {"success"}
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Metrics Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import time
+import threading
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from greatschools.metrics import WebMetrics
+
+
+class CountingMetrics(WebMetrics):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.exports = 0
+
+    def export(self, *args, **kwargs):
+        self.exports += 1
+        return super().export(*args, **kwargs)
+
+
+def test_metrics_export_claimed_once(tmp_path):
+    metrics = CountingMetrics(name="test", file=str(tmp_path / "test.prom"), interval=1)
+    time.sleep(1.1)
+    barrier = threading.Barrier(16)
+
+    def worker():
+        barrier.wait()
+        for index in range(100):
+            metrics.observe("load", 0.01)
+
+    workers = [threading.Thread(target=worker) for index in range(16)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    assert metrics.exports == 1
+    assert metrics.todict()["histograms"]["load"]["count"] == 1600
+    assert sorted(os.listdir(str(tmp_path))) == ["test.prom"]
+
+
+def test_metrics_export_concurrent(tmp_path):
+    metrics = WebMetrics(name="test", file=str(tmp_path / "test.prom"), interval=0)
+    workers = [threading.Thread(target=lambda: [metrics.observe("load", 0.01) for index in range(50)]) for index in range(8)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    metrics.export()
+    assert sorted(os.listdir(str(tmp_path))) == ["test.prom"]
+    with open(str(tmp_path / "test.prom")) as handle:
+        assert 'greatschools_stage_seconds_count{downloader="test",stage="load"} 400' in handle.read()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Parquet Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+parquets = pytest.importorskip("greatschools.parquets")
+
+
+class Dataset(dict):
+    def todict(self): return dict(self)
+
+
+class CacheDownloader(object):
+    def __init__(self, *args, repository, **kwargs):
+        self.repository = repository
+
+    def execute(self, *args, **kwargs):
+        for GID in range(3):
+            yield {"GID": str(GID)}, Dataset(schools=[{"GID": str(GID), "address": "1 Main St, Fresno, CA 93701", "name": "School {}".format(GID)}])
+
+    def run(self, *args, **kwargs):
+        for query, dataset in self.execute(*args, **kwargs):
+            with open(os.path.join(self.repository, "{}.zip".format(query["GID"])), "wb") as file:
+                file.write(b"")
+
+
+class ParquetDownloader(parquets.ParquetMixin, CacheDownloader): pass
+
+
+class Journal(object):
+    def __init__(self): self.commits = []
+    def commit(self, *args, **kwargs): self.commits.append((args, kwargs))
+
+
+def test_parquet_backend_writes_parts_only(tmp_path):
+    journal = Journal()
+    downloader = ParquetDownloader(repository=str(tmp_path), journal=journal)
+    downloader.run()
+    assert os.listdir(str(tmp_path)) == ["schools.parquet"]
+    assert all([file.startswith("part-") and file.endswith(".parquet") for file in os.listdir(str(tmp_path / "schools.parquet"))])
+    assert len(downloader.parquet.read("schools")) == 3
+    assert len(journal.commits) == 1
+
+
+def test_parquet_sections_long(tmp_path):
+    repository = parquets.ParquetRepository(directory=str(tmp_path))
+    repository.append("testing", [{"GID": "1", "Math": "45%", "English": "52%", "date": "10/18/2026"}])
+    repository.append("testing", [{"GID": "2", "Science": "n/a", "date": "10/18/2026"}])
+    repository.flush()
+    dataframe = repository.read("testing")
+    assert list(dataframe.columns) == list(parquets.SCHEMAS["testing"].keys())
+    assert dataframe["metric"].astype(str).tolist() == ["Math", "English", "Science"]
+    assert dataframe["value"].tolist()[:2] == [45.0, 52.0] and dataframe["value"].isna().tolist()[2]
+    assert dataframe["GID"].tolist() == [1, 1, 2]
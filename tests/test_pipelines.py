@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Pipeline Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import time
+import threading
+import pytest
+from queue import Queue
+from contextlib import contextmanager
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+pipelines = pytest.importorskip("greatschools.pipelines")
+Pipeline = pipelines.Greatschools_Pipeline_WebDownloader
+
+
+class Metrics(object):
+    def __init__(self): self.observations = []
+    def observe(self, stage, seconds): self.observations.append((stage, seconds))
+
+
+@contextmanager
+def browser():
+    yield object()
+
+
+def test_pipeline_backpressure():
+    queue, stop, metrics = Queue(maxsize=1), threading.Event(), Metrics()
+    assert Pipeline.put(queue, 1, stop, metrics=metrics)
+    thread = threading.Thread(target=Pipeline.put, args=(queue, 2, stop), kwargs=dict(timeout=0.05, metrics=metrics))
+    thread.start()
+    time.sleep(0.2)
+    assert thread.is_alive() and queue.qsize() == 1
+    assert queue.get() == 1
+    thread.join(1)
+    assert not thread.is_alive() and queue.get() == 2
+    assert max([seconds for stage, seconds in metrics.observations if stage == "backpressure"]) >= 0.15
+
+
+def test_pipeline_backpressure_stop():
+    queue, stop = Queue(maxsize=1), threading.Event()
+    queue.put(1)
+    threading.Timer(0.1, stop.set).start()
+    assert not Pipeline.put(queue, 2, stop, timeout=0.05)
+    assert queue.qsize() == 1
+
+
+def test_pipeline_dedupe():
+    queue, stop, seen = Queue(), threading.Event(), pipelines.GIDSet()
+    records = [{"GID": GID} for GID in ("1", "2", "1", "3")]
+    assert Pipeline.forward(records, queue, stop, seen=seen)
+    assert Pipeline.forward([{"GID": "2"}, {"GID": "4"}], queue, stop, seen=seen)
+    assert [queue.get_nowait()["GID"] for _ in range(queue.qsize())] == ["1", "2", "3", "4"]
+
+
+def test_pipeline_stage_shutdown():
+    results, destination, stop = Queue(), Queue(), threading.Event()
+
+    def function(*args, **kwargs):
+        yield "result"
+        raise RuntimeError("stage")
+
+    consumer = threading.Thread(target=lambda: results.get()[1].set())
+    consumer.start()
+    Pipeline.stage(function, browser=browser, delayer=None, results=results, stop=stop, destination=destination, metrics=None)
+    consumer.join(1)
+    assert isinstance(results.get_nowait(), RuntimeError)
+    assert results.get_nowait() is None
+    assert destination.get_nowait() is None
+
+
+def test_pipeline_stage_stop():
+    results, destination, stop = Queue(), Queue(maxsize=1), threading.Event()
+    destination.put("full")
+
+    def function(*args, **kwargs):
+        yield "result"
+
+    threading.Timer(0.1, stop.set).start()
+    start = time.monotonic()
+    Pipeline.stage(function, browser=browser, delayer=None, results=results, stop=stop, destination=destination, metrics=None)
+    assert time.monotonic() - start < 2
+    assert results.get_nowait()[0] == "result"
+    assert results.get_nowait() is None
+
+
+def test_pipeline_take():
+    queue, stop = Queue(), threading.Event()
+    for item in (1, 2, None, 3):
+        queue.put(item)
+    assert list(Pipeline.take(queue, stop, timeout=0.05)) == [1, 2]
+    stop.set()
+    assert list(Pipeline.take(queue, stop, timeout=0.05)) == []
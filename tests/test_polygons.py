@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Polygon Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+np = pytest.importorskip("numpy")
+polygons = pytest.importorskip("greatschools.polygons")
+
+
+def ring_parser(seed, vertices=5000, x=-119.0, y=35.0):
+    generator = np.random.default_rng(seed)
+    angles = np.linspace(0, 2 * np.pi, int(vertices), endpoint=False)
+    radius = 0.1 + 0.02 * np.cumsum(generator.normal(0, 0.01, size=int(vertices)))
+    ring = np.stack([x + radius * np.cos(angles), y + radius * np.sin(angles)], axis=-1)
+    return np.vstack([ring, ring[:1]])
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("tolerance", [1e-5, 1e-4, 1e-3])
+def test_compact_error_bound(seed, tolerance):
+    ring = ring_parser(seed)
+    indexes = polygons.selection(ring, tolerance)
+    compact = polygons.compact_parser(ring, tolerance=tolerance)
+    decoded = polygons.CompactRing.frombytes(bytes(compact)).decode()
+    assert len(compact) == len(indexes) < len(ring)
+    assert polygons.deviation(ring, decoded, indexes) <= polygons.error_bound(tolerance, polygons.PRECISION) + 1e-12
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compact_lossless_without_tolerance(seed):
+    ring = ring_parser(seed, vertices=500)
+    compact = polygons.compact_parser(ring, tolerance=None)
+    decoded = polygons.CompactRing.frombytes(bytes(compact)).decode()
+    assert len(decoded) == len(ring)
+    assert np.abs(decoded - ring).max() <= 0.5 * 10 ** -polygons.PRECISION + 1e-12
+
+
+def test_compact_ring_closed():
+    ring = ring_parser(0)
+    decoded = polygons.compact_parser(ring, tolerance=1e-3).decode()
+    assert np.array_equal(decoded[0], decoded[-1])
+
+
+def test_compact_small_ring_unchanged():
+    ring = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]])
+    assert polygons.selection(ring, 10.0).tolist() == [0, 1, 2, 3]
+
+
+def test_compact_string_tolerance():
+    ring = ring_parser(0)
+    assert polygons.selection(ring, "0.0001").tolist() == polygons.selection(ring, 1e-4).tolist()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Priority Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from greatschools.priorities import WebPriority, DAY, weights_parser, weight_parser
+
+
+def test_priority_scores_string():
+    priority = WebPriority(scores="staleness:2,failures:-0.5", band="1.0")
+    assert priority.scores == {"staleness": 2.0, "failures": -0.5, "weight": 1.0}
+    assert WebPriority(scores={"weight": "3"}).scores["weight"] == 3.0
+
+
+def test_priority_weights():
+    weights = weights_parser("93301:4,Bakersfield:2")
+    assert weights == {"93301": 4.0, "Bakersfield": 2.0}
+    assert weight_parser(weights, "93301", "Bakersfield") == 4.0
+    assert weight_parser(weights, "90210", "Fresno") == 1.0
+
+
+def test_priority_ordering():
+    now = time.time()
+    history = {"1": (now - DAY, 0), "2": (now - 200 * DAY, 0), "3": (now - 200 * DAY, 5), "4": (None, 0)}
+    ordered = WebPriority(band=0.01, seed=0)(["1", "2", "3", "4"], history)
+    assert ordered == ["4", "2", "3", "1"]
+
+
+def test_priority_band_shuffles_within_band():
+    history = {str(GID): (None, 0) for GID in range(50)}
+    orders = [tuple(WebPriority(seed=seed)([str(GID) for GID in range(50)], history)) for seed in range(3)]
+    assert len(set(orders)) > 1
+    assert all([sorted(order) == sorted(orders[0]) for order in orders])
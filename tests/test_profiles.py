@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Profile Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+profiles = pytest.importorskip("greatschools.profiles")
+from greatschools.metrics import WebMetrics
+
+
+class ProfileResponse(object):
+    def __init__(self, body): self.headers, self.body = {}, body
+
+
+class ProfileRequest(object):
+    def __init__(self, body): self.response = ProfileResponse(body)
+
+
+class ProfileDriver(object):
+    def __init__(self): self.requests = [ProfileRequest(b"x" * 100), ProfileRequest(b"y" * 50)]
+    def execute_script(self, script): return 1500
+
+
+def test_profile_report_metrics():
+    metrics = WebMetrics(name="test")
+    profile = profiles.WebProfile(name="TestProfile").attach(metrics)
+    driver = ProfileDriver()
+    profile.install(driver)
+    report = profile.report(driver, "query")
+    assert report["requests"] == 2 and report["bytes"] == 150 and report["load"] == 1.5
+    results = metrics.todict()
+    assert results["histograms"]["pageload"]["count"] == 1
+    assert results["counters"]["profile|requests"] == 2
+    assert results["counters"]["profile|bytes"] == 150
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Record Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+records = pytest.importorskip("greatschools.records")
+
+
+def test_dictionary_interning():
+    dictionary = records.MetricDictionary(metrics=["English", "Math"])
+    assert dictionary["Math"] == 1
+    assert dictionary["  English\n "] == 0
+    assert dictionary["Low  Income"] == dictionary["Low Income"] == 2
+    assert len(dictionary) == 3 and list(dictionary) == ["English", "Math", "Low Income"]
+    assert dictionary.metrics[2] is sys.intern("Low Income")
+    assert list(dictionary.categories().categories) == ["English", "Math", "Low Income"]
+
+
+def test_records_shared_dictionary():
+    dictionary = records.MetricDictionary()
+    first, second = records.LongRecords(dictionary=dictionary), records.LongRecords(dictionary=dictionary)
+    first.append("testing", [{"GID": "1", "Math": "10%", "date": "10/18/2026"}])
+    second.append("demographics", [{"GID": "2", "Math": "20%", "White": "30%", "date": "10/18/2026"}])
+    assert len(dictionary) == 2
+    assert second.dataframe()["metric"].cat.codes.tolist() == [0, 1]
+
+
+def test_records_percent_coercion():
+    values = records.value_parser(["45%", " 1,234 ", "-3.5", "n/a", "", None, "12.5%"])
+    assert values.dtype == np.float32
+    assert values.iloc[:3].tolist() == [45.0, 1234.0, -3.5]
+    assert values.iloc[3:6].isna().all()
+    assert values.iloc[6] == np.float32(12.5)
+
+
+def test_records_date_coercion():
+    long = records.LongRecords()
+    long.append("scores", [{"GID": "1", "Overall": "7", "date": "10/18/2026"}, {"GID": "2", "Overall": "8", "date": "2026-10-18"}, {"GID": "3", "Overall": "9"}])
+    dataframe = long.dataframe()
+    assert pd.api.types.is_datetime64_any_dtype(dataframe["date"])
+    assert dataframe["date"].iloc[0] == pd.Timestamp(2026, 10, 18)
+    assert dataframe["date"].iloc[1:].isna().all()
+
+
+def test_records_dtypes():
+    long = records.LongRecords()
+    long.append("testing", [{"GID": "123456", "Math": "45%", "English": "52%", "date": "10/18/2026"}])
+    long.append("unknown", [{"GID": "1", "Math": "1"}])
+    dataframe = long.dataframe()
+    assert len(dataframe) == 2
+    assert dataframe["GID"].dtype == np.uint32 and set(dataframe["GID"]) == {123456}
+    assert dataframe["section"].dtype.name == "category" and set(dataframe["section"]) == {"testing"}
+    assert dataframe["metric"].tolist() == ["Math", "English"]
+    assert dataframe["value"].dtype == np.float32 and dataframe["value"].tolist() == [45.0, 52.0]
+
+
+def test_records_extend():
+    long = records.LongRecords()
+    long.extend("teachers", pd.DataFrame({"GID": ["1", "2"], "Ratio": ["12", None], "date": ["10/18/2026", "10/18/2026"]}))
+    dataframe = long.dataframe()
+    assert dataframe["GID"].tolist() == [1] and dataframe["value"].tolist() == [12.0]
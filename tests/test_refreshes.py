@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Refresh Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import time
+import sqlite3
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from greatschools import refreshes
+from greatschools.refreshes import RefreshIndex
+
+
+def test_refresh_never_scraped(tmp_path):
+    index = RefreshIndex(file=str(tmp_path / "refresh.db"), dataset="schools")
+    index.attempt(["1"])
+    index.failure("2")
+    assert index.stale(["1", "2", "3"], age=30) == ["1", "2", "3"]
+    index.close()
+
+
+def test_refresh_max_age(tmp_path, monkeypatch):
+    index = RefreshIndex(file=str(tmp_path / "refresh.db"), dataset="schools")
+    now = time.time()
+    monkeypatch.setattr(refreshes.time, "time", lambda: now - 10 * refreshes.DAY)
+    index.success("1")
+    monkeypatch.setattr(refreshes.time, "time", lambda: now - 2 * refreshes.DAY)
+    index.success("2")
+    monkeypatch.setattr(refreshes.time, "time", lambda: now)
+    assert index.stale(["1", "2"], age=5) == ["1"]
+    assert index.stale(["1", "2"], age=1) == ["1", "2"]
+    assert index.stale(["1", "2"], age=30) == []
+    index.close()
+
+
+def test_refresh_attempted_after_success(tmp_path, monkeypatch):
+    index = RefreshIndex(file=str(tmp_path / "refresh.db"), dataset="schools")
+    now = time.time()
+    monkeypatch.setattr(refreshes.time, "time", lambda: now - 60)
+    index.success("1")
+    index.success("2")
+    monkeypatch.setattr(refreshes.time, "time", lambda: now)
+    index.attempt(["1"])
+    assert index.stale(["1", "2"], age=30) == ["1"]
+    index.success("1")
+    assert index.stale(["1", "2"], age=30) == []
+    index.close()
+
+
+def test_refresh_datasets(tmp_path):
+    schools = RefreshIndex(file=str(tmp_path / "refresh.db"), dataset="schools")
+    boundary = RefreshIndex(file=str(tmp_path / "refresh.db"), dataset="boundary")
+    schools.success("1")
+    assert schools.stale(["1"], age=30) == []
+    assert boundary.stale(["1"], age=30) == ["1"]
+    schools.close()
+    boundary.close()
+
+
+def test_refresh_migration(tmp_path):
+    file = str(tmp_path / "refresh.db")
+    connection = sqlite3.connect(file)
+    connection.execute("CREATE TABLE refresh (dataset TEXT NOT NULL, GID INTEGER NOT NULL, attempted REAL, scraped REAL, PRIMARY KEY (dataset, GID)) WITHOUT ROWID")
+    connection.execute("INSERT INTO refresh VALUES ('schools', 1, ?, ?)", (time.time(), time.time()))
+    connection.commit()
+    connection.close()
+    index = RefreshIndex(file=file, dataset="schools")
+    history = index.history(["1", "2"])
+    assert history["1"][0] is not None and history["1"][1] == 0
+    assert history["2"] == (None, 0)
+    index.failure("1")
+    index.failure("1")
+    assert index.history(["1"])["1"][1] == 2
+    assert index.stale(["1"], age=30) == []
+    index.close()
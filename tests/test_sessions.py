@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Session Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import itertools
+import pytest
+from contextlib import contextmanager
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+exceptions = pytest.importorskip("selenium.common.exceptions")
+sessions = pytest.importorskip("greatschools.sessions")
+from greatschools.sessions import WebTabDriver, WebTabSession
+
+
+class SwitchTo(object):
+    def __init__(self, driver): self.driver = driver
+
+    def window(self, handle):
+        if handle not in self.driver.windows:
+            raise exceptions.NoSuchWindowException("no such window")
+        self.driver.current_window_handle = handle
+
+    def new_window(self, kind):
+        self.driver.current_window_handle = self.driver.create()
+
+
+class TabDriver(object):
+    def __init__(self, handles=1, heap=0):
+        self.counter = itertools.count()
+        self.heap, self.windows, self.cookies, self.resets, self.error = heap, {}, [], 0, None
+        self.switch_to = SwitchTo(self)
+        self.current_window_handle = [self.create() for _ in range(handles)][0]
+
+    def __bool__(self): return True
+
+    def create(self):
+        handle = "tab-{:.0f}".format(next(self.counter))
+        self.windows[handle] = []
+        return handle
+
+    def get(self, url):
+        if self.error is not None:
+            raise self.error
+        self.windows[self.current_window_handle].append(url)
+
+    def execute_script(self, script): return self.heap
+    def delete_all_cookies(self): self.cookies.append(self.current_window_handle)
+    def close(self): del self.windows[self.current_window_handle]
+
+    def reset(self):
+        self.windows, self.error, self.resets = {}, None, self.resets + 1
+        self.current_window_handle = self.create()
+
+    @property
+    def window_handles(self): return list(self.windows.keys())
+
+
+def test_tab_open():
+    driver = TabDriver(handles=3)
+    tabbed = WebTabDriver(driver, tabs=2).open()
+    assert driver.window_handles == ["tab-0", "tab-3"]
+    assert [tab.handle for tab in tabbed.tabs] == ["tab-0", "tab-3"]
+    assert bool(tabbed)
+
+
+def test_tab_rotate():
+    driver = TabDriver()
+    tabbed = WebTabDriver(driver, tabs=3).open()
+    handles = [tab.handle for tab in tabbed.tabs]
+    for index in range(4):
+        tabbed.get("https://www.greatschools.org/{:.0f}".format(index))
+    assert [driver.windows[handle] for handle in handles] == [["https://www.greatschools.org/2"], ["https://www.greatschools.org/0", "https://www.greatschools.org/3"], ["https://www.greatschools.org/1"]]
+    assert [tab.loads for tab in tabbed.tabs] == [1, 2, 1] and tabbed.counts["loads"] == 4
+    assert tabbed.current_window_handle == handles[1]
+
+
+@pytest.mark.parametrize("clear", [True, False])
+def test_tab_trip_reset(clear):
+    driver = TabDriver()
+    tabbed = WebTabDriver(driver, tabs=3, clear=clear).open()
+    tabbed.get("https://www.greatschools.org/0")
+    tripped = tabbed.tab.handle
+    tabbed.trip()
+    assert not bool(tabbed)
+    tabbed.get("https://www.greatschools.org/1")
+    tabbed.get("https://www.greatschools.org/2")
+    tabbed.get("https://www.greatschools.org/3")
+    assert driver.windows[tripped] == ["https://www.greatschools.org/0"]
+    tabbed.trip()
+    tabbed.reset()
+    assert tripped not in driver.window_handles and len(driver.window_handles) == 3
+    assert all([bool(tab) for tab in tabbed.tabs]) and bool(tabbed)
+    assert tabbed.counts["recycles"] == 2 and tabbed.counts["restarts"] == 0 and driver.resets == 0
+    assert len(driver.cookies) == (2 if clear else 0) and (tripped in driver.cookies) == clear
+
+
+def test_tab_missing_window():
+    driver = TabDriver()
+    tabbed = WebTabDriver(driver, tabs=2).open()
+    driver.error = exceptions.NoSuchWindowException("no such window")
+    with pytest.raises(exceptions.NoSuchWindowException):
+        tabbed.get("https://www.greatschools.org/0")
+    assert not bool(tabbed) and not tabbed.fatal
+    driver.error = None
+    tabbed.reset()
+    assert bool(tabbed) and tabbed.counts["recycles"] == 1 and driver.resets == 0
+
+
+def test_tab_fatal_restart():
+    driver = TabDriver()
+    tabbed = WebTabDriver(driver, tabs=2).open()
+    driver.error = exceptions.WebDriverException("unknown error: cannot load page")
+    with pytest.raises(exceptions.WebDriverException):
+        tabbed.get("https://www.greatschools.org/0")
+    assert not tabbed.fatal and bool(tabbed)
+    driver.error = exceptions.WebDriverException("chrome not reachable")
+    with pytest.raises(exceptions.WebDriverException):
+        tabbed.get("https://www.greatschools.org/1")
+    assert tabbed.fatal and not bool(tabbed)
+    tabbed.reset()
+    assert driver.resets == 1 and tabbed.counts["restarts"] == 1
+    assert not tabbed.fatal and bool(tabbed) and len(driver.window_handles) == 2
+
+
+def test_tab_memory_restart():
+    driver = TabDriver(heap=0.4 * 1024 ** 2)
+    tabbed = WebTabDriver(driver, tabs=3, memory=1, interval=2).open()
+    tabbed.get("https://www.greatschools.org/0")
+    assert not tabbed.exceeded
+    driver.heap = 0.2 * 1024 ** 2
+    tabbed.get("https://www.greatschools.org/1")
+    assert not tabbed.exceeded and bool(tabbed)
+    driver.heap = 0.4 * 1024 ** 2
+    tabbed.get("https://www.greatschools.org/2")
+    tabbed.get("https://www.greatschools.org/3")
+    assert tabbed.exceeded and not bool(tabbed)
+    tabbed.reset()
+    assert driver.resets == 1 and tabbed.counts["restarts"] == 1
+    assert not tabbed.exceeded and bool(tabbed)
+
+
+def test_tab_session():
+    driver, exits = TabDriver(), []
+
+    @contextmanager
+    def browser():
+        yield driver
+        exits.append(True)
+
+    session = WebTabSession(browser=browser, tabs=3, clear=False)
+    assert session() is session
+    with session() as tabbed:
+        assert isinstance(tabbed, WebTabDriver) and tabbed.driver is driver
+        assert len(driver.window_handles) == 3 and not tabbed.clear
+    assert exits == [True]
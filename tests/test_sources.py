@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Source Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+html = pytest.importorskip("lxml.html")
+from greatschools.sources import text_parser
+
+
+def test_source_text_parser():
+    element = html.fromstring("<div>\n  <span>Fresno</span>,\tCA  <b>93701</b><!-- hidden --> \n</div>")
+    assert text_parser(element) == "Fresno, CA 93701"
+    assert text_parser(html.fromstring("<div>  \n </div>")) == ""
+
+
+def test_source_text_parser_shared():
+    links = pytest.importorskip("greatschools.links")
+    schools = pytest.importorskip("greatschools.schools")
+    assert links.text_parser is schools.text_parser is text_parser
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Greatschools Zone Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+np = pytest.importorskip("numpy")
+zones = pytest.importorskip("greatschools.zones")
+from greatschools.zones import ZoneIndex, contains
+
+
+square = lambda x, y, size: [(x, y), (x + size, y), (x + size, y + size), (x, y + size), (x, y)]
+GIDS = [11, 12, 13, 14]
+RINGS = [square(0, 0, 1), square(1, 0, 1), square(0.5, 0.5, 1), [(3, 3), (5, 3), (4, 5), (3, 3)]]
+
+
+def brute(index, xs, ys):
+    hits = [(point, GID) for GID, ring in zip(index.GIDs, index.rings) for point in np.flatnonzero(contains(ring, xs, ys))]
+    return sorted(hits, key=lambda hit: (hit[0], index.GIDs.tolist().index(hit[1])))
+
+
+@pytest.mark.parametrize("cells", [None, 1, 3, 16])
+def test_zone_lookup_scan(cells):
+    index = ZoneIndex(GIDS, RINGS, cells=cells)
+    edges = [(1.0, 0.5), (0.0, 0.5), (0.5, 0.0), (2.0, 0.5), (0.5, 1.0), (1.5, 1.5), (4.0, 3.0), (3.5, 4.0), (0.0, 0.0)]
+    overlaps = [(0.75, 0.75), (1.25, 0.75), (0.9, 0.9)]
+    outside = [(-1.0, 0.5), (6.0, 6.0), (2.5, 2.5), (1e9, -1e9)]
+    random = list(zip(*np.random.default_rng(7).uniform(-1, 6, size=(2, 5000))))
+    xs, ys = (np.array(values, dtype=np.float64) for values in zip(*(edges + overlaps + outside + random)))
+    assert np.array_equal(index.lookup(xs, ys), index.scan(xs, ys))
+    points, GIDs = index.query(xs, ys)
+    assert list(zip(points.tolist(), GIDs.tolist())) == brute(index, xs, ys)
+    offset = len(edges)
+    assert index.lookup(xs[offset:offset + 3], ys[offset:offset + 3]).tolist() == [11, 12, 11]
+    assert set(GIDs[points == offset].tolist()) == {11, 13} and set(GIDs[points == offset + 1].tolist()) == {12, 13}
+    offset = len(edges) + len(overlaps)
+    assert index.lookup(xs[offset:offset + 4], ys[offset:offset + 4]).tolist() == [-1, -1, -1, -1]
+
+
+def test_zone_empty():
+    index = ZoneIndex([], [])
+    assert len(index) == 0
+    assert index.lookup([0.5], [0.5], default=0).tolist() == [0]
+    assert [values.tolist() for values in index.query([0.5], [0.5])] == [[], []]
+
+
+def test_zone_load(tmp_path):
+    shapefile = pytest.importorskip("shapefile")
+    file = str(tmp_path / "zones")
+    with shapefile.Writer(file, shapeType=shapefile.POLYGON) as writer:
+        writer.field("GID", "N", size=10)
+        for GID, ring in zip(GIDS, RINGS):
+            writer.poly([ring])
+            writer.record(GID)
+    index = ZoneIndex.load(file)
+    assert index.GIDs.tolist() == GIDS
+    assert index.lookup([0.25, 1.75, 4.0], [0.25, 0.25, 4.0]).tolist() == [11, 12, 14]
+
+
+def test_zone_load_requires_pyshp(monkeypatch):
+    monkeypatch.setattr(zones, "shapefile", None)
+    with pytest.raises(ImportError):
+        ZoneIndex.load("zones")